@@ -32,6 +32,10 @@ extensions = [
         os.path.join("src", "trading", "market", "cost_engine", "cost_engine.pyx"),
         ]
     ),
+    Extension("trading.price_model.gbm.price_distribution.option.option_kernel", [
+        os.path.join("src", "trading", "price_model", "gbm", "price_distribution", "option", "option_kernel.pyx"),
+        ]
+    ),
 ]
 
 setup(
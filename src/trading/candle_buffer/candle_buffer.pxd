@@ -16,11 +16,18 @@ cdef class CandleBuffer:
     cdef int time_frame
     cdef int tradebook_address
     cdef int tradebook_timestamp
+    cdef long frame_count
+    cdef long generation
+    cdef long reset_count
 
     # Getters
     cpdef int get_size(self)
     cpdef int get_capacity(self)
     cpdef int get_time_frame(self)
+    cpdef long get_frame_count(self)
+    cpdef long get_generation(self)
+    cpdef long get_reset_count(self)
+    cpdef tuple get_candle(self, int index = *)
     cpdef np.ndarray[double, ndim=1] get_open_data(self, int frames = *)
     cpdef np.ndarray[double, ndim=1] get_high_data(self, int frames = *)
     cpdef np.ndarray[double, ndim=1] get_low_data(self, int frames = *)
@@ -21,6 +21,28 @@ cdef class CandleBuffer:
 
     cpdef int get_time_frame(self):
         return self.time_frame
+
+    cpdef long get_frame_count(self):
+        # Number of frames pushed since the last reset (including frames dropped from the buffer).
+        return self.frame_count
+
+    cpdef long get_generation(self):
+        # Incremented whenever the OHLC data changes (new frames and changes to the live frame).
+        return self.generation
+
+    cpdef long get_reset_count(self):
+        # Incremented on every reset, such that frame counts are only comparable within a reset count.
+        return self.reset_count
+
+    cpdef tuple get_candle(self, int index = -1):
+        # Returns the (open, high, low, close, volume) of the frame at index without copying the buffers.
+        return (
+            self.open_buffer.get(index),
+            self.high_buffer.get(index),
+            self.low_buffer.get(index),
+            self.close_buffer.get(index),
+            self.volume_buffer.get(index)
+        )
     
     cpdef np.ndarray[double, ndim=1] get_open_data(self, int frames = 0):
         return self.open_buffer.get_data(start_index=(-frames))
@@ -57,6 +79,9 @@ cdef class CandleBuffer:
         self.set_time_frame(time.time())
         self.tradebook_address = -1
         self.tradebook_timestamp = -1
+        self.frame_count = 0
+        self.generation += 1
+        self.reset_count += 1
 
     cpdef void set_time_frame(self, int timestamp):
         self.time_frame = timestamp - (timestamp % self.frame_resolution) + self.frame_resolution
@@ -79,6 +104,8 @@ cdef class CandleBuffer:
             self.low_buffer.push_back(curr_price)
             self.close_buffer.push_back(curr_price)
             self.volume_buffer.push_back(0)
+            self.frame_count += 1
+            self.generation += 1
 
             self.tradebook_timestamp = self.time_frame - self.frame_resolution
 
@@ -91,6 +118,8 @@ cdef class CandleBuffer:
             self.high_buffer.push_back(max(curr_price, open_price))
             self.low_buffer.push_back(min(curr_price, open_price))
             self.close_buffer.push_back(curr_price)
+            self.frame_count += 1
+            self.generation += 1
             
             for tradebook_address, tradebook_timestamp, trade_price, trade_size in tradebook_iterator:
                 if (tradebook_address == self.tradebook_address) or (tradebook_timestamp <
@@ -116,6 +145,10 @@ cdef class CandleBuffer:
             return
 
         else: # Within same time frame
+            if curr_price != self.close_buffer.get(-1):
+                # Covers the high and low changes (the close lies within the high and low).
+                self.generation += 1
+
             if curr_price > self.high_buffer.get(-1):
                 self.high_buffer.set(-1, curr_price)
             elif curr_price < self.low_buffer.get(-1):
@@ -147,7 +180,9 @@ cdef class CandleBuffer:
             self.low_buffer.push_back(low_values[index])
             self.close_buffer.push_back(close_values[index])
             self.volume_buffer.push_back(volumes[index])
-        
+
+        self.frame_count += size
+        self.generation += 1
         self.set_time_frame(timestamp)
 
     
@@ -160,7 +195,10 @@ cdef class CandleBuffer:
             "volume_buffer": self.volume_buffer.__reduce__()[2],
             "time_frame": self.time_frame,
             "tradebook_address": self.tradebook_address,
-            "tradebook_timestamp": self.tradebook_timestamp
+            "tradebook_timestamp": self.tradebook_timestamp,
+            "frame_count": self.frame_count,
+            "generation": self.generation,
+            "reset_count": self.reset_count
         }
 
         return (self.__class__, (self.frame_resolution, self.open_buffer.get_capacity(),
@@ -176,3 +214,6 @@ cdef class CandleBuffer:
         self.time_frame = attrs.get("time_frame")
         self.tradebook_address = attrs.get("tradebook_address")
         self.tradebook_timestamp = attrs.get("tradebook_timestamp")
+        self.frame_count = attrs.get("frame_count", 0)
+        self.generation = attrs.get("generation", 0)
+        self.reset_count = attrs.get("reset_count", 0)
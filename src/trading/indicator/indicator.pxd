@@ -11,16 +11,29 @@ cdef class IndicatorBase:
     cpdef int get_num_features(self)
     cpdef double get_feature(self, int feature_index)
     cpdef np.ndarray[double, ndim=1] get_observation(self)
+    cpdef int get_window_size(self)
+    cpdef object get_candle_buffer(self)
+    cpdef long get_input_generation(self)
+    cpdef np.ndarray[double, ndim=2] get_hist_features(self, np.ndarray[double, ndim=1] open_values,
+        np.ndarray[double, ndim=1] high_values, np.ndarray[double, ndim=1] low_values,
+        np.ndarray[double, ndim=1] close_values, np.ndarray[double, ndim=1] volumes)
 
     # Mutators
     cpdef void set(self, int feature_index, double feature_value)
     cpdef void update(self)
+    cpdef void update_window(self, tuple window)
 
 cdef class FeaturesCompiler:
     cdef list indicators
     cdef int num_features
     cdef double[:] features
+    cdef dict window_plans
+    cdef list window_keys
+    cdef list input_generations
 
     # Getters
     cpdef int get_num_features(self)
     cpdef np.ndarray[double, ndim=1] get(self)
+    cpdef np.ndarray[double, ndim=2] get_hist_features(self, np.ndarray[double, ndim=1] open_values,
+        np.ndarray[double, ndim=1] high_values, np.ndarray[double, ndim=1] low_values,
+        np.ndarray[double, ndim=1] close_values, np.ndarray[double, ndim=1] volumes)
@@ -16,6 +16,26 @@ cdef class IndicatorBase:
     cpdef np.ndarray[double, ndim=1] get_observation(self):
         return np.asarray(self.current_observation, dtype=float)
 
+    cpdef int get_window_size(self):
+        # Number of trailing candles read by update_window (0 if the indicator reads no window).
+        return 0
+
+    cpdef object get_candle_buffer(self):
+        # CandleBuffer the window is read from (None if the indicator reads no window).
+        return None
+
+    cpdef long get_input_generation(self):
+        # Generation of the inputs (e.g. CandleBuffer.get_generation), unchanged while the observation
+        # cannot change. Returns -1 if the inputs are untracked, such that updates are never skipped.
+        return -1
+
+    cpdef np.ndarray[double, ndim=2] get_hist_features(self, np.ndarray[double, ndim=1] open_values,
+        np.ndarray[double, ndim=1] high_values, np.ndarray[double, ndim=1] low_values,
+        np.ndarray[double, ndim=1] close_values, np.ndarray[double, ndim=1] volumes):
+        # Returns the (T, num_features) observations produced by the update after each of the T candles
+        # of the (full) candle series, computed offline in a single pass.
+        raise NotImplementedError()
+
     # Mutators
     cpdef void set(self, int feature_index, double feature_value):
         self.current_observation[feature_index] = feature_value
@@ -24,6 +44,11 @@ cdef class IndicatorBase:
         # Performs update to store current observation
         return
 
+    cpdef void update_window(self, tuple window):
+        # Performs update from the (open, high, low, close, volume) window of the candle_buffer, which
+        # holds at least the get_window_size trailing candles.
+        self.update()
+
     def __reduce__(self):
         return (self.__class__, (self.name,))
 
@@ -37,6 +62,28 @@ cdef class FeaturesCompiler:
 
         self.features = np.zeros(shape=(self.num_features,), dtype=float)
 
+        # Plans a single window fetch per candle_buffer, covering the largest window_size of the
+        # indicators reading from it: {window_key: (candle_buffer, window_size)}.
+        self.window_plans = dict()
+        self.window_keys = list()
+        self.input_generations = [-1] * len(self.indicators)
+
+        for indicator in self.indicators:
+            candle_buffer = indicator.get_candle_buffer()
+
+            if candle_buffer is None or indicator.get_window_size() <= 0:
+                self.window_keys.append(None)
+                continue
+
+            window_key = id(candle_buffer)
+            window_size = indicator.get_window_size()
+
+            if window_key in self.window_plans:
+                window_size = max(window_size, self.window_plans[window_key][1])
+
+            self.window_plans[window_key] = (candle_buffer, window_size)
+            self.window_keys.append(window_key)
+
     cpdef int get_num_features(self):
         return self.num_features
 
@@ -45,9 +92,28 @@ cdef class FeaturesCompiler:
         cdef int feature_index = 0
         cdef int sub_feature_index
         cdef int num_features
+        cdef int indicator_index
+        cdef long input_generation
+        cdef dict windows = dict() # Fetched on the first outdated indicator per window_key.
 
-        for indicator in self.indicators:
-            indicator.update()
+        for indicator_index, (indicator, window_key) in enumerate(zip(self.indicators, self.window_keys)):
+            input_generation = indicator.get_input_generation()
+
+            if input_generation >= 0 and input_generation == self.input_generations[indicator_index]:
+                # Inputs unchanged, the features still hold the current observation.
+                feature_index += indicator.get_num_features()
+                continue
+
+            self.input_generations[indicator_index] = input_generation
+
+            if window_key is None:
+                indicator.update()
+            else:
+                if window_key not in windows:
+                    candle_buffer, window_size = self.window_plans[window_key]
+                    windows[window_key] = candle_buffer.get_data(window_size)
+
+                indicator.update_window(windows[window_key])
             
             for sub_feature_index in range(indicator.get_num_features()):
                 self.features[feature_index] = indicator.get_feature(sub_feature_index)
@@ -55,5 +121,15 @@ cdef class FeaturesCompiler:
 
         return np.asarray(self.features, dtype=float)
 
+    cpdef np.ndarray[double, ndim=2] get_hist_features(self, np.ndarray[double, ndim=1] open_values,
+        np.ndarray[double, ndim=1] high_values, np.ndarray[double, ndim=1] low_values,
+        np.ndarray[double, ndim=1] close_values, np.ndarray[double, ndim=1] volumes):
+        # Returns the (T, num_features) features returned by get after each of the T candles of the
+        # candle series read by the indicators (see IndicatorBase.get_hist_features).
+        return np.column_stack([
+            indicator.get_hist_features(open_values, high_values, low_values, close_values, volumes)
+            for indicator in self.indicators
+        ]).astype(float)
+
     def __reduce__(self) -> tuple:
         return (self.__class__, (self.indicators,))
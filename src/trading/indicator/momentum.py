@@ -1,281 +1,164 @@
+import numpy as np
+
 from . import IndicatorBase
+from .streaming import StreamingGraph
 from ..candle_buffer import CandleBuffer
 from talib import abstract
 
 class MomentumIndicatorBase (IndicatorBase):
-    # Momentum Indicator for TaLib momentum indicators.
+    # Momentum Indicator for TaLib momentum indicators, updated in O(1) per candle from a node of a
+    # StreamingGraph (see streaming.py) instead of recomputing the indicator over a window of candles.
+    # The features follow TaLib over the full (buffered) candle history rather than a truncated window.
     momentum_indicator = None
+    reads_volume = False # volume changes on the live candle do not change the candle_buffer generation.
 
-    def __init__(self, candle_buffer: CandleBuffer) -> None:
+    def __init__(self, candle_buffer: CandleBuffer, streaming_graph: StreamingGraph = None) -> None:
+        """ @param candle_buffer (CandleBuffer): Reads OHLCV from this buffer to generate observations.
+            @param streaming_graph (StreamingGraph, opt): The graph of the candle_buffer shared with other
+                    momentum indicators, such that the intermediate series are computed once per update.
+        """
         assert candle_buffer.get_capacity() >= 50 # mim candles required.
+        assert streaming_graph is None or streaming_graph.candle_buffer is candle_buffer
 
         IndicatorBase.__init__(self, self.momentum_indicator)
         self.candle_buffer = candle_buffer
         self.momentum_funct = getattr(abstract, self.momentum_indicator)
 
+        self.streaming_graph = StreamingGraph(candle_buffer) if streaming_graph is None else streaming_graph
+        self.streaming_graph.add(self.momentum_indicator)
+
+    # Getters
+    def get_input_generation(self) -> int:
+        return -1 if self.reads_volume else self.candle_buffer.get_generation()
+
+    def get_hist_features(self, open_values: np.ndarray, high_values: np.ndarray, low_values: np.ndarray,
+        close_values: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        # TaLib over the full series, which the shared StreamingGraph node of the momentum_indicator
+        # reproduces candle by candle (up to floating point rounding).
+        hist_features = self.momentum_funct({"open": open_values, "high": high_values, "low": low_values,
+                "close": close_values, "volume": volumes})
+
+        return np.column_stack([hist_features] if isinstance(hist_features, np.ndarray) else hist_features)
+
+    # Mutators
+    def update(self) -> None:
+        if not self.candle_buffer.get_size():
+            return
+
+        # Evaluated once per candle_buffer change across the indicators sharing the streaming_graph.
+        self.streaming_graph.update()
+
+        for index, value in enumerate(self.streaming_graph.get_values(self.momentum_indicator)):
+            self.set(index, value)
+
     def __reduce__(self) -> tuple:
-        return (self.__class__, (self.candle_buffer,))
+        return (self.__class__, (self.candle_buffer, self.streaming_graph))
 
 # TaLib momentum classes
 class ADX (MomentumIndicatorBase):
     momentum_indicator = "ADX"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(30),
-            self.candle_buffer.get_low_data(30),
-            self.candle_buffer.get_close_data(30)
-        )[-1])
-
 class ADXR (MomentumIndicatorBase):
     momentum_indicator = "ADXR"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(50),
-            self.candle_buffer.get_low_data(50),
-            self.candle_buffer.get_close_data(50)
-        )[-1])
-
 class APO (MomentumIndicatorBase):
     momentum_indicator = "APO"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(30))[-1])
-
 class AROON (MomentumIndicatorBase):
     momentum_indicator = "AROON"
 
     def get_num_features(self) -> int:
         return 2
 
-    def update(self) -> float:
-        aroon_down, aroon_up = self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20)
-        )
-
-        self.set(0, aroon_down[-1])
-        self.set(1, aroon_up[-1])
-
 class AROONOSC (MomentumIndicatorBase):
     momentum_indicator = "AROONOSC"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20)
-        )[-1])
-
 class BOP (MomentumIndicatorBase):
     momentum_indicator = "BOP"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_open_data(20),
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 class CCI (MomentumIndicatorBase):
     momentum_indicator = "CCI"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 class CMO (MomentumIndicatorBase):
     momentum_indicator = "CMO"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class DX (MomentumIndicatorBase):
     momentum_indicator = "DX"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 class MACD (MomentumIndicatorBase):
     momentum_indicator = "MACD"
 
     def get_num_features(self) -> int:
         return 3
 
-    def update(self) -> float:
-        macd, macdsignal, macdhist = self.momentum_funct(self.candle_buffer.get_close_data(40))
-        self.set(0, macd[-1])
-        self.set(1, macdsignal[-1])
-        self.set(2, macdhist[-1])
-
 class MFI (MomentumIndicatorBase):
     momentum_indicator = "MFI"
-
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20),
-            self.candle_buffer.get_volume_data(20)
-        )[-1])
+    reads_volume = True
 
 class MINUS_DI (MomentumIndicatorBase):
     momentum_indicator = "MINUS_DI"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 class MINUS_DM (MomentumIndicatorBase):
     momentum_indicator = "MINUS_DM"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20)
-        )[-1])
-
 class MOM (MomentumIndicatorBase):
     momentum_indicator = "MOM"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class PLUS_DI (MomentumIndicatorBase):
     momentum_indicator = "PLUS_DI"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 class PLUS_DM (MomentumIndicatorBase):
     momentum_indicator = "PLUS_DM"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20)
-        )[-1])
-
 class PPO (MomentumIndicatorBase):
     momentum_indicator = "PPO"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(40))[-1])
-
 class ROC (MomentumIndicatorBase):
     momentum_indicator = "ROC"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class ROCP (MomentumIndicatorBase):
     momentum_indicator = "ROCP"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class ROCR (MomentumIndicatorBase):
     momentum_indicator = "ROCR"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class RSI (MomentumIndicatorBase):
     momentum_indicator = "RSI"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class STOCH (MomentumIndicatorBase):
     momentum_indicator = "STOCH"
 
     def get_num_features(self) -> int:
         return 2
 
-    def update(self) -> float:
-        slowk, slowd = self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )
-
-        self.set(0, slowk[-1])
-        self.set(1, slowd[-1])
-
 class STOCHF (MomentumIndicatorBase):
     momentum_indicator = "STOCHF"
 
     def get_num_features(self) -> int:
         return 2
 
-    def update(self) -> float:
-        fastk, fastd = self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )
-
-        self.set(0, fastk[-1])
-        self.set(1, fastd[-1])
-
 class STOCHRSI (MomentumIndicatorBase):
-    momentum_indicator = "RSI"
+    momentum_indicator = "STOCHRSI"
 
     def get_num_features(self) -> int:
         return 2
 
-    def update(self) -> float:
-        fastk, fastd = self.momentum_funct(self.candle_buffer.get_close_data(20))
-
-        self.set(0, fastk[-1])
-        self.set(1, fastd[-1])
-
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(self.candle_buffer.get_close_data(20))[-1])
-
 class ULTOSC (MomentumIndicatorBase):
     momentum_indicator = "ULTOSC"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(30),
-            self.candle_buffer.get_low_data(30),
-            self.candle_buffer.get_close_data(30)
-        )[-1])
-
 class WILLR (MomentumIndicatorBase):
     momentum_indicator = "WILLR"
 
-    def update(self) -> float:
-        self.set(0, self.momentum_funct(
-            self.candle_buffer.get_high_data(20),
-            self.candle_buffer.get_low_data(20),
-            self.candle_buffer.get_close_data(20)
-        )[-1])
-
 MOMENTUM_INDICATOR_LIST = [ADX, ADXR, APO, AROON, AROONOSC, BOP, CCI, CMO, DX, MACD, MFI, MINUS_DI, MINUS_DM, MOM, PLUS_DI, PLUS_DM, PPO, ROC, ROCP, ROCR, RSI, STOCH, STOCHF, STOCHRSI, ULTOSC, WILLR]
 
 def get_momentum_indicator_suite(candle_buffer: CandleBuffer) -> list[MomentumIndicatorBase]:
-    # Returns the full suite of MomentumIndicators
+    # Returns the full suite of MomentumIndicators, sharing a StreamingGraph.
+    streaming_graph = StreamingGraph(candle_buffer)
+
     return [
-        momentum_indicator(candle_buffer)
+        momentum_indicator(candle_buffer, streaming_graph)
         for momentum_indicator in MOMENTUM_INDICATOR_LIST
     ]
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
@@ -1,6 +1,8 @@
+import numpy as np
+import talib
+
 from . import IndicatorBase
 from ..candle_buffer import CandleBuffer
-from talib import abstract
 
 PATTERN_LIST_STR = """
 CDL2CROWS            Two Crows
@@ -71,8 +73,9 @@ PATTERN_LIST = [
     for pattern in PATTERN_LIST_STR.split('\n')[1:-1]
 ]
 
+# Function API (rather than talib.abstract) to skip the per call input wrapping on the shared windows.
 PATTERN_FUNCT_MAP = {
-    pattern : getattr(abstract, pattern)
+    pattern : getattr(talib, pattern)
     for pattern in PATTERN_LIST
 }
 
@@ -90,13 +93,40 @@ class PatternIndicator (IndicatorBase):
         self.pattern_indicator = pattern_indicator
         self.pattern_funct = PATTERN_FUNCT_MAP.get(pattern_indicator)
         self.curr_obseration = 0
+        self.input_generation = -1 # candle_buffer generation of the current observation.
     
+    # Getters
+    def get_window_size(self) -> int:
+        return 30
+
+    def get_candle_buffer(self) -> CandleBuffer:
+        return self.candle_buffer
+
+    def get_input_generation(self) -> int:
+        # The patterns only read the OHLC data.
+        return self.candle_buffer.get_generation()
+
+    def get_hist_features(self, open_values: np.ndarray, high_values: np.ndarray, low_values: np.ndarray,
+        close_values: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        # The trailing 30 candles cover the pattern lookbacks, such that TaLib over the full series
+        # reproduces the update after each candle.
+        return (self.pattern_funct(open_values, high_values, low_values, close_values) / 100).reshape(-1, 1)
+
+    # Mutators
     def update(self) -> None:
+        if self.input_generation != self.candle_buffer.get_generation():
+            self.update_window(self.candle_buffer.get_data(30))
+
+    def update_window(self, window: tuple) -> None:
+        # Reads the trailing 30 candles from the (shared) window as views.
+        open_data, high_data, low_data, close_data, _ = window
+        self.input_generation = self.candle_buffer.get_generation()
+
         self.set(0, self.pattern_funct(
-            self.candle_buffer.get_open_data(30),
-            self.candle_buffer.get_high_data(30),
-            self.candle_buffer.get_low_data(30),
-            self.candle_buffer.get_close_data(30)
+            open_data[-30:],
+            high_data[-30:],
+            low_data[-30:],
+            close_data[-30:]
         )[-1] / 100)
 
     def __reduce__(self) -> tuple:
@@ -110,4 +140,62 @@ def get_pattern_indicator_suite(candle_buffer: CandleBuffer) -> list[PatternIndi
     ]
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    # Parity of the FeaturesCompiler (single window fetch per candle_buffer, skipped while the candles
+    # are unchanged) against updating the full momentum and pattern suites independently, and of the
+    # offline (historical) features against replaying the candles through a live FeaturesCompiler.
+    import time
+
+    from . import FeaturesCompiler
+    from .momentum import get_momentum_indicator_suite
+
+    rng = np.random.default_rng(0)
+    size, ticks = 256, 300
+
+    close_values = 100 * np.exp(np.cumsum(.01 * rng.standard_normal(size + ticks)))
+    open_values = np.r_[close_values[0], close_values[:-1]]
+    high_values = np.maximum(open_values, close_values) + rng.exponential(.2, size + ticks)
+    low_values = np.minimum(open_values, close_values) - rng.exponential(.2, size + ticks)
+    volumes = rng.exponential(10, size + ticks)
+
+    def set_candles(candle_buffer: CandleBuffer, start: int, end: int) -> None:
+        candle_buffer.set_data(int(time.time()), open_values[start:end], high_values[start:end],
+                low_values[start:end], close_values[start:end], volumes[start:end])
+
+    def get_indicators(candle_buffer: CandleBuffer) -> list[IndicatorBase]:
+        return get_pattern_indicator_suite(candle_buffer) + get_momentum_indicator_suite(candle_buffer)
+
+    independent_candle_buffer = CandleBuffer(60, size)
+    candle_buffer = CandleBuffer(60, size)
+    set_candles(independent_candle_buffer, 0, size)
+    set_candles(candle_buffer, 0, size)
+
+    independent_indicators = get_indicators(independent_candle_buffer)
+    features_compiler = FeaturesCompiler(get_indicators(candle_buffer))
+
+    for tick in range(size, size + ticks): # New candle per tick.
+        set_candles(independent_candle_buffer, tick, tick + 1)
+        set_candles(candle_buffer, tick, tick + 1)
+
+        for indicator in independent_indicators:
+            indicator.update()
+
+        features = features_compiler.get().copy()
+
+        assert np.allclose(features, [indicator.get_feature(feature_index) for indicator in independent_indicators
+                for feature_index in range(indicator.get_num_features())], rtol=0, atol=0, equal_nan=True)
+
+    for _ in range(10): # Polling unchanged candles.
+        assert np.allclose(features_compiler.get(), features, rtol=0, atol=0, equal_nan=True)
+
+    candle_buffer = CandleBuffer(60, size)
+    features_compiler = FeaturesCompiler(get_indicators(candle_buffer))
+    replayed_features = list()
+
+    for tick in range(size + ticks):
+        set_candles(candle_buffer, tick, tick + 1)
+        replayed_features.append(features_compiler.get().copy())
+
+    hist_features = features_compiler.get_hist_features(open_values, high_values, low_values,
+            close_values, volumes)
+
+    assert np.allclose(hist_features, np.array(replayed_features), rtol=1e-10, atol=1e-10, equal_nan=True)
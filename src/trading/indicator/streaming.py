@@ -0,0 +1,893 @@
+import numpy as np
+
+from collections import deque
+
+# Incremental (O(1) per candle) implementations of the TA-Lib momentum functions with the TA-Lib
+# default parameters, declared as a graph of nodes where the intermediate series (true range,
+# directional movement, EMAs, RSI, ...) are computed once per candle and consumed by the downstream
+# nodes. The nodes are committed on the closed candles and evaluated against the live (forming)
+# candle without being committed, reproducing the TA-Lib outputs over the full history of candles
+# (NaN before the TA-Lib lookback).
+
+def is_zero(value: float, scale: float) -> bool:
+    # Zero up to the rounding of prices around @param scale (TA-Lib treats these flat prices as unchanged).
+    return abs(value) <= 1e-14 * abs(scale)
+
+# Running statistics
+class RollingSum:
+    def __init__(self, period: int) -> None:
+        # Sum over the last period values (added before the trailing value is removed, as TA-Lib).
+        self.period = period
+        self.values = deque()
+        self.total = 0
+        self.nonzero_count = 0 # Resets the rounding residue of the total once the window is all zeros.
+
+    def update(self, value: float, commit: bool = True) -> float:
+        """ @param value (float): the next value, where NaN values (warm-up of an upstream statistic)
+                are skipped.
+        @param commit (bool, opt): whether the value is committed, or only evaluated.
+
+        @returns total (float): the sum of the last period values including @param value.
+        """
+        if value != value:
+            return np.nan
+
+        total = self.total + value
+        nonzero_count = self.nonzero_count + (value != 0)
+        period_total = (total if nonzero_count else 0) if len(self.values) == self.period - 1 else np.nan
+
+        if commit:
+            self.values.append(value)
+
+            if len(self.values) == self.period:
+                trailing_value = self.values.popleft()
+                total -= trailing_value
+                nonzero_count -= (trailing_value != 0)
+
+            self.total = total if nonzero_count else 0
+            self.nonzero_count = nonzero_count
+
+        return period_total
+
+class SimpleAverage (RollingSum):
+    def update(self, value: float, commit: bool = True) -> float:
+        return RollingSum.update(self, value, commit) / self.period
+
+class ExponentialAverage:
+    def __init__(self, period: int, skip: int = 0) -> None:
+        """ TA-Lib EMA: seeded by the simple average of the first period values.
+
+        @param skip (int, opt): the number of leading values excluded from the seed, such that the
+                EMA starts aligned with a longer EMA (TA-Lib MACD).
+        """
+        self.period = period
+        self.k = 2 / (period + 1)
+        self.skip = skip
+        self.count = 0
+        self.total = 0
+        self.value = np.nan
+
+    def update(self, value: float, commit: bool = True) -> float:
+        if value != value:
+            return np.nan
+
+        count = self.count + 1
+        total = self.total
+        ema = np.nan
+
+        if count <= self.skip:
+            pass
+        elif count - self.skip < self.period:
+            total += value
+        elif count - self.skip == self.period:
+            ema = (total + value) / self.period
+        else:
+            ema = ((value - self.value) * self.k) + self.value
+
+        if commit:
+            self.count, self.total, self.value = count, total, ema
+
+        return ema
+
+class WilderAverage:
+    def __init__(self, period: int) -> None:
+        # Wilder smoothing (TA-Lib RSI): seeded by the simple average of the first period values.
+        self.period = period
+        self.count = 0
+        self.total = 0
+        self.value = np.nan
+
+    def update(self, value: float, commit: bool = True) -> float:
+        count = self.count + 1
+        total = self.total
+        average = np.nan
+
+        if count < self.period:
+            total += value
+        elif count == self.period:
+            average = (total + value) / self.period
+        else:
+            average = (self.value * (self.period - 1) + value) / self.period
+
+        if commit:
+            self.count, self.total, self.value = count, total, average
+
+        return average
+
+class WilderSum:
+    def __init__(self, period: int) -> None:
+        # Wilder smoothed sum (TA-Lib directional movement): seeded by the sum of the first period - 1 values.
+        self.period = period
+        self.count = 0
+        self.value = 0
+
+    def update(self, value: float, commit: bool = True) -> float:
+        count = self.count + 1
+        total = self.value + value if count < self.period else self.value - (self.value / self.period) + value
+
+        if commit:
+            self.count, self.value = count, total
+
+        return total if count >= self.period - 1 else np.nan
+
+class RollingExtremum:
+    def __init__(self, window: int, is_max: bool = True) -> None:
+        """ Monotonic deque of the (latest) extremum over the last window values.
+
+        @param window (int): the number of values (including the latest value).
+        @param is_max (bool, opt): whether the maximum (or minimum) is tracked.
+        """
+        self.window = window
+        self.sign = 1 if is_max else -1
+        self.extrema = deque() # (index, signed value) in decreasing order of the signed values.
+        self.count = 0
+
+    def update(self, value: float, commit: bool = True) -> tuple[float, int]:
+        """ @returns extremum (float): the extremum of the last window values including @param value.
+        @returns age (int): the number of values since the (latest) extremum.
+        """
+        signed_value = self.sign * value
+
+        if self.count < self.window - 1:
+            extremum, age = np.nan, 0
+        elif not self.extrema or signed_value >= self.extrema[0][1]:
+            extremum, age = value, 0
+        else:
+            extremum, age = self.sign * self.extrema[0][1], self.count - self.extrema[0][0]
+
+        if commit:
+            while self.extrema and self.extrema[-1][1] <= signed_value:
+                self.extrema.pop()
+
+            self.extrema.append((self.count, signed_value))
+            self.count += 1
+
+            while self.extrema[0][0] <= self.count - self.window:
+                self.extrema.popleft()
+
+        return extremum, age
+
+class Lag:
+    def __init__(self, period: int) -> None:
+        # The value period updates before the latest value.
+        self.values = deque(maxlen=period)
+
+    def update(self, value: float, commit: bool = True) -> float:
+        lagged_value = self.values[0] if len(self.values) == self.values.maxlen else np.nan
+
+        if commit:
+            self.values.append(value)
+
+        return lagged_value
+
+# Streaming nodes
+class StreamingNodeBase:
+    # Keys of the upstream nodes, whose outputs are passed (in order) to update.
+    dependencies: tuple[str, ...] = ()
+    # TA-Lib lookback (the index of the first defined output) and number of outputs.
+    lookback = 0
+    num_outputs = 1
+
+    def update(self, candle: tuple[float, float, float, float, float], inputs: tuple[tuple[float, ...], ...],
+        commit: bool) -> tuple[float, ...]:
+        """ @param candle (tuple[float, float, float, float, float]): the (open, high, low, close, volume).
+        @param inputs (tuple[tuple[float, ...], ...]): the outputs of the dependencies for the candle.
+        @param commit (bool): whether the candle is committed (closed), or only evaluated.
+
+        @returns values (tuple[float, ...]): the outputs for the candle.
+        """
+        raise NotImplementedError()
+
+# Intermediate nodes
+class TrueRangeNode (StreamingNodeBase):
+    # @returns true_range, true_low (tuple[float, float]): NaN on the first candle.
+    num_outputs = 2
+
+    def __init__(self) -> None:
+        self.prev_close: float = None
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        _, high_price, low_price, close_price, _ = candle
+        prev_close = self.prev_close
+
+        if commit:
+            self.prev_close = close_price
+
+        if prev_close is None:
+            return np.nan, np.nan
+
+        return (max(high_price - low_price, abs(high_price - prev_close), abs(low_price - prev_close)),
+                min(low_price, prev_close))
+
+class DirectionalMovementNode (StreamingNodeBase):
+    # @returns plus_dm, minus_dm, true_range (tuple[float, float, float]): the Wilder smoothed sums
+    # (NaN until the first period - 1 candles after the first candle).
+    dependencies = ("TRANGE",)
+    period = 14
+    num_outputs = 3
+
+    def __init__(self) -> None:
+        self.plus_dm = WilderSum(self.period)
+        self.minus_dm = WilderSum(self.period)
+        self.true_range = WilderSum(self.period)
+        self.prev_candle: tuple[float, float] = None # (high, low)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float, float]:
+        _, high_price, low_price, _, _ = candle
+        prev_candle = self.prev_candle
+
+        if commit:
+            self.prev_candle = (high_price, low_price)
+
+        if prev_candle is None:
+            return np.nan, np.nan, np.nan
+
+        prev_high, prev_low = prev_candle
+        diff_plus, diff_minus = high_price - prev_high, prev_low - low_price
+
+        return (self.plus_dm.update(diff_plus if diff_plus > 0 and diff_plus > diff_minus else 0, commit),
+                self.minus_dm.update(diff_minus if diff_minus > 0 and diff_plus < diff_minus else 0, commit),
+                self.true_range.update(inputs[0][0], commit))
+
+class DirectionalIndexNode (StreamingNodeBase):
+    # @returns plus_di, minus_di, dx (tuple[float, float, float]): NaN where undefined.
+    dependencies = ("DM",)
+    num_outputs = 3
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float, float]:
+        plus_dm, minus_dm, true_range = inputs[0]
+
+        if true_range == 0:
+            return np.nan, np.nan, np.nan
+
+        plus_di, minus_di = 100 * (plus_dm / true_range), 100 * (minus_dm / true_range)
+        di_total = minus_di + plus_di
+
+        return plus_di, minus_di, (100 * (abs(minus_di - plus_di) / di_total) if di_total != 0 else np.nan)
+
+class ExponentialAverageNode (StreamingNodeBase):
+    # EMA of the closes.
+    period = None
+
+    def __init__(self) -> None:
+        self.average = ExponentialAverage(self.period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return (self.average.update(candle[3], commit),)
+
+class FastExponentialAverageNode (ExponentialAverageNode):
+    period = 12
+
+class SlowExponentialAverageNode (ExponentialAverageNode):
+    period = 26
+
+class GainLossNode (StreamingNodeBase):
+    # @returns gain, loss (tuple[float, float]): the Wilder smoothed gains and losses of the closes.
+    period = 14
+    num_outputs = 2
+
+    def __init__(self) -> None:
+        self.gain = WilderAverage(self.period)
+        self.loss = WilderAverage(self.period)
+        self.prev_close: float = None
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        close_price = candle[3]
+        prev_close = self.prev_close
+
+        if commit:
+            self.prev_close = close_price
+
+        if prev_close is None:
+            return np.nan, np.nan
+
+        change = close_price - prev_close
+        return self.gain.update(max(change, 0), commit), self.loss.update(max(-change, 0), commit)
+
+class StochasticNodeBase (StreamingNodeBase):
+    # TA-Lib fast %K over the last period candles.
+    period = 5
+
+    def __init__(self) -> None:
+        self.highest = RollingExtremum(self.period, True)
+        self.lowest = RollingExtremum(self.period, False)
+
+    def update_fast_k(self, high_price: float, low_price: float, close_price: float, commit: bool) -> float:
+        highest, _ = self.highest.update(high_price, commit)
+        lowest, _ = self.lowest.update(low_price, commit)
+        price_range = (highest - lowest) / 100
+
+        return (close_price - lowest) / price_range if price_range != 0 else 0
+
+class FastKNode (StochasticNodeBase):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        _, high_price, low_price, close_price, _ = candle
+        return (self.update_fast_k(high_price, low_price, close_price, commit),)
+
+class FastDNode (StreamingNodeBase):
+    # Simple average of the fast %K (the STOCHF fast %D and the STOCH slow %K).
+    dependencies = ("FAST_K",)
+    period = 3
+
+    def __init__(self) -> None:
+        self.average = SimpleAverage(self.period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return (self.average.update(inputs[0][0], commit),)
+
+class CloseLagNode (StreamingNodeBase):
+    # The close period candles before (NaN until then).
+    period = 10
+
+    def __init__(self) -> None:
+        self.lagged_close = Lag(self.period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return (self.lagged_close.update(candle[3], commit),)
+
+# Indicator nodes
+class PLUS_DMNode (StreamingNodeBase):
+    dependencies = ("DM",)
+    lookback = DirectionalMovementNode.period - 1
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return inputs[0][:1]
+
+class MINUS_DMNode (StreamingNodeBase):
+    dependencies = ("DM",)
+    lookback = DirectionalMovementNode.period - 1
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return inputs[0][1:2]
+
+class PLUS_DINode (StreamingNodeBase):
+    dependencies = ("DI",)
+    lookback = DirectionalMovementNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        plus_di = inputs[0][0]
+        return (plus_di if plus_di == plus_di else 0,)
+
+class MINUS_DINode (StreamingNodeBase):
+    dependencies = ("DI",)
+    lookback = DirectionalMovementNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        minus_di = inputs[0][1]
+        return (minus_di if minus_di == minus_di else 0,)
+
+class DXNode (StreamingNodeBase):
+    dependencies = ("DI",)
+    lookback = DirectionalMovementNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        dx = inputs[0][2]
+        return (dx if dx == dx else 0,)
+
+class ADXNode (StreamingNodeBase):
+    dependencies = ("DI",)
+    period = DirectionalMovementNode.period
+    lookback = 2 * period - 1
+
+    def __init__(self) -> None:
+        self.count = 0 # Committed candles.
+        self.dx_count = 0
+        self.dx_total = 0
+        self.adx = np.nan
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        count = self.count
+
+        if commit:
+            self.count += 1
+
+        if count < self.period:
+            return (np.nan,)
+
+        # The DX is skipped where undefined (zero true range or directional indexes).
+        dx = inputs[0][2]
+        dx_count, dx_total, adx = self.dx_count + 1, self.dx_total, self.adx
+
+        if dx_count < self.period:
+            dx_total += dx if dx == dx else 0
+        elif dx_count == self.period:
+            adx = (dx_total + (dx if dx == dx else 0)) / self.period
+        elif dx == dx:
+            adx = ((adx * (self.period - 1)) + dx) / self.period
+
+        if commit:
+            self.dx_count, self.dx_total, self.adx = dx_count, dx_total, adx
+
+        return (adx,)
+
+class ADXRNode (StreamingNodeBase):
+    dependencies = ("ADX",)
+    lookback = 3 * DirectionalMovementNode.period - 2
+
+    def __init__(self) -> None:
+        self.lagged_adx = Lag(DirectionalMovementNode.period - 1)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        adx = inputs[0][0]
+        return ((adx + self.lagged_adx.update(adx, commit)) / 2,)
+
+class APONode (StreamingNodeBase):
+    # TA-Lib APO and PPO with exponential moving averages (the talib abstract default).
+    dependencies = ("EMA12", "EMA26")
+    lookback = SlowExponentialAverageNode.period - 1
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return (inputs[0][0] - inputs[1][0],)
+
+class PPONode (APONode):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        fast_average, slow_average = inputs[0][0], inputs[1][0]
+        return (((fast_average - slow_average) / slow_average) * 100 if slow_average != 0 else 0,)
+
+class AROONNode (StreamingNodeBase):
+    # @returns aroon_down, aroon_up (tuple[float, float])
+    period = 14
+    lookback = period
+    num_outputs = 2
+
+    def __init__(self) -> None:
+        self.highest = RollingExtremum(self.period + 1, True)
+        self.lowest = RollingExtremum(self.period + 1, False)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        factor = 100 / self.period
+        _, high_age = self.highest.update(candle[1], commit)
+        _, low_age = self.lowest.update(candle[2], commit)
+
+        return factor * (self.period - low_age), factor * (self.period - high_age)
+
+class AROONOSCNode (StreamingNodeBase):
+    dependencies = ("AROON",)
+    lookback = AROONNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        aroon_down, aroon_up = inputs[0]
+        return (aroon_up - aroon_down,)
+
+class BOPNode (StreamingNodeBase):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        open_price, high_price, low_price, close_price, _ = candle
+        price_range = high_price - low_price
+
+        return ((close_price - open_price) / price_range if price_range > 0 else 0,)
+
+class CCINode (StreamingNodeBase):
+    period = 14
+    lookback = period - 1
+
+    def __init__(self) -> None:
+        self.typical_prices = deque(maxlen=self.period - 1)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        # The mean deviation is O(period) per candle, which is not maintainable incrementally.
+        _, high_price, low_price, close_price, _ = candle
+        typical_price = (high_price + low_price + close_price) / 3
+        value = np.nan
+
+        if len(self.typical_prices) == self.period - 1:
+            average = (sum(self.typical_prices) + typical_price) / self.period
+            mean_deviation = (sum(abs(price - average) for price in self.typical_prices)
+                    + abs(typical_price - average)) / self.period
+            deviation = typical_price - average
+
+            value = 0 if is_zero(deviation, average) or mean_deviation == 0 else deviation / (0.015
+                    * mean_deviation)
+
+        if commit:
+            self.typical_prices.append(typical_price)
+
+        return (value,)
+
+class RSINode (StreamingNodeBase):
+    dependencies = ("GAIN_LOSS",)
+    lookback = GainLossNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        gain, loss = inputs[0]
+        return (100 * (gain / (gain + loss)) if gain + loss != 0 else 0,)
+
+class CMONode (RSINode):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        gain, loss = inputs[0]
+        return (100 * ((gain - loss) / (gain + loss)) if gain + loss != 0 else 0,)
+
+class STOCHRSINode (StochasticNodeBase):
+    # TA-Lib STOCHF (fast %K and simple average fast %D) of the RSI.
+    # @returns fast_k, fast_d (tuple[float, float])
+    dependencies = ("RSI",)
+    fast_d_period = 3
+    lookback = RSINode.lookback + StochasticNodeBase.period + fast_d_period - 2
+    num_outputs = 2
+
+    def __init__(self) -> None:
+        StochasticNodeBase.__init__(self)
+        self.fast_d_average = SimpleAverage(self.fast_d_period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        rsi = inputs[0][0]
+
+        if rsi != rsi: # RSI warm-up.
+            return np.nan, np.nan
+
+        # The RSI of flat prices is constant up to rounding, where the range is taken as zero.
+        highest, _ = self.highest.update(rsi, commit)
+        lowest, _ = self.lowest.update(rsi, commit)
+        fast_k = 0 if is_zero(highest - lowest, 100) else (rsi - lowest) / ((highest - lowest) / 100)
+
+        return fast_k, self.fast_d_average.update(fast_k, commit)
+
+class MACDNode (StreamingNodeBase):
+    # @returns macd, macd_signal, macd_hist (tuple[float, float, float])
+    dependencies = ("EMA26",)
+    fast_period = FastExponentialAverageNode.period
+    slow_period = SlowExponentialAverageNode.period
+    signal_period = 9
+    lookback = slow_period + signal_period - 2
+    num_outputs = 3
+
+    def __init__(self) -> None:
+        # The fast EMA is seeded on the last fast_period values of the slow EMA seed (as TA-Lib), such
+        # that only the slow EMA is shared.
+        self.fast_average = ExponentialAverage(self.fast_period, self.slow_period - self.fast_period)
+        self.signal_average = ExponentialAverage(self.signal_period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float, float]:
+        macd = self.fast_average.update(candle[3], commit) - inputs[0][0]
+        macd_signal = self.signal_average.update(macd, commit)
+
+        return macd, macd_signal, macd - macd_signal
+
+class MFINode (StreamingNodeBase):
+    period = 14
+    lookback = period
+
+    def __init__(self) -> None:
+        self.positive_flow = RollingSum(self.period)
+        self.negative_flow = RollingSum(self.period)
+        self.prev_typical_price: float = None
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        _, high_price, low_price, close_price, volume = candle
+        typical_price = (high_price + low_price + close_price) / 3
+
+        if self.prev_typical_price is None:
+            if commit:
+                self.prev_typical_price = typical_price
+
+            return (np.nan,)
+
+        money_flow = typical_price * volume
+        change = 0 if is_zero(typical_price - self.prev_typical_price, typical_price) \
+                else typical_price - self.prev_typical_price
+
+        positive_flow = self.positive_flow.update(money_flow if change > 0 else 0, commit)
+        negative_flow = self.negative_flow.update(money_flow if change < 0 else 0, commit)
+
+        if commit:
+            self.prev_typical_price = typical_price
+
+        total_flow = positive_flow + negative_flow
+        return (100 * (positive_flow / total_flow) if total_flow != 0 else 0,)
+
+class MOMNode (StreamingNodeBase):
+    # TA-Lib MOM, ROC, ROCP and ROCR against the close period candles before.
+    dependencies = ("CLOSE_LAG",)
+    lookback = CloseLagNode.period
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        return (candle[3] - inputs[0][0],)
+
+class ROCNode (MOMNode):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        lagged_close = inputs[0][0]
+        return (((candle[3] / lagged_close) - 1) * 100 if lagged_close != 0 else 0,)
+
+class ROCPNode (MOMNode):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        lagged_close = inputs[0][0]
+        return ((candle[3] - lagged_close) / lagged_close if lagged_close != 0 else 0,)
+
+class ROCRNode (MOMNode):
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        lagged_close = inputs[0][0]
+        return (candle[3] / lagged_close if lagged_close != 0 else 0,)
+
+class STOCHNode (StreamingNodeBase):
+    # TA-Lib STOCH with simple moving averages.
+    # @returns slow_k, slow_d (tuple[float, float])
+    dependencies = ("FAST_D",)
+    slow_d_period = 3
+    lookback = StochasticNodeBase.period + FastDNode.period + slow_d_period - 3
+    num_outputs = 2
+
+    def __init__(self) -> None:
+        self.slow_d_average = SimpleAverage(self.slow_d_period)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        slow_k = inputs[0][0]
+        return slow_k, self.slow_d_average.update(slow_k, commit)
+
+class STOCHFNode (StreamingNodeBase):
+    # TA-Lib STOCHF with a simple moving average.
+    # @returns fast_k, fast_d (tuple[float, float])
+    dependencies = ("FAST_K", "FAST_D")
+    lookback = StochasticNodeBase.period + FastDNode.period - 2
+    num_outputs = 2
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float, float]:
+        return inputs[0][0], inputs[1][0]
+
+class ULTOSCNode (StreamingNodeBase):
+    dependencies = ("TRANGE",)
+    periods = (7, 14, 28)
+    lookback = max(periods)
+
+    def __init__(self) -> None:
+        self.buying_pressures = [RollingSum(period) for period in self.periods]
+        self.true_ranges = [RollingSum(period) for period in self.periods]
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        true_range, true_low = inputs[0]
+
+        if true_range != true_range: # First candle.
+            return (np.nan,)
+
+        value = 0
+
+        for weight, buying_pressure, true_range_sum in zip((4, 2, 1), self.buying_pressures,
+            self.true_ranges):
+            buying_pressure = buying_pressure.update(candle[3] - true_low, commit)
+            true_range_sum = true_range_sum.update(true_range, commit)
+
+            if true_range_sum != 0:
+                value += weight * (buying_pressure / true_range_sum)
+
+        return (100 * (value / 7),)
+
+class WILLRNode (StreamingNodeBase):
+    period = 14
+    lookback = period - 1
+
+    def __init__(self) -> None:
+        self.highest = RollingExtremum(self.period, True)
+        self.lowest = RollingExtremum(self.period, False)
+
+    def update(self, candle: tuple, inputs: tuple, commit: bool) -> tuple[float]:
+        _, high_price, low_price, close_price, _ = candle
+        highest, _ = self.highest.update(high_price, commit)
+        lowest, _ = self.lowest.update(low_price, commit)
+        price_range = (highest - lowest) / -100
+
+        return ((highest - close_price) / price_range if price_range != 0 else 0,)
+
+# Intermediate nodes keyed by name, and the indicator nodes keyed by the TA-Lib function name.
+STREAMING_NODE_MAP = {
+    "TRANGE": TrueRangeNode, "DM": DirectionalMovementNode, "DI": DirectionalIndexNode,
+    "EMA12": FastExponentialAverageNode, "EMA26": SlowExponentialAverageNode, "GAIN_LOSS": GainLossNode,
+    "FAST_K": FastKNode, "FAST_D": FastDNode, "CLOSE_LAG": CloseLagNode,
+
+    "ADX": ADXNode, "ADXR": ADXRNode, "APO": APONode, "AROON": AROONNode, "AROONOSC": AROONOSCNode,
+    "BOP": BOPNode, "CCI": CCINode, "CMO": CMONode, "DX": DXNode, "MACD": MACDNode, "MFI": MFINode,
+    "MINUS_DI": MINUS_DINode, "MINUS_DM": MINUS_DMNode, "MOM": MOMNode, "PLUS_DI": PLUS_DINode,
+    "PLUS_DM": PLUS_DMNode, "PPO": PPONode, "ROC": ROCNode, "ROCP": ROCPNode, "ROCR": ROCRNode,
+    "RSI": RSINode, "STOCH": STOCHNode, "STOCHF": STOCHFNode, "STOCHRSI": STOCHRSINode,
+    "ULTOSC": ULTOSCNode, "WILLR": WILLRNode
+}
+
+class StreamingGraph:
+    def __init__(self, candle_buffer) -> None:
+        """ Shared streaming nodes of the indicators reading from the @param candle_buffer, where each
+        node is updated once per candle (in topological order) and consumed by its downstream nodes.
+
+        @param candle_buffer (CandleBuffer): the candles pushed to and evaluated by the nodes.
+        """
+        self.candle_buffer = candle_buffer
+        self.nodes: dict[str, StreamingNodeBase] = dict() # Topological (insertion) order.
+        self.values: dict[str, tuple[float, ...]] = dict() # Outputs for the last evaluated candle.
+        self.count = 0 # Committed candles.
+
+        self.closed_frames: int = None # Frame count of the committed candles (None to replay).
+        self.reset_count: int = None # candle_buffer reset count of the committed candles.
+        self.evaluated_key: tuple = None # (generation, live candle) of the values.
+
+    # Getters
+    def get_values(self, key: str) -> tuple[float, ...]:
+        # @returns values (tuple[float, ...]): the outputs of the node for the live candle.
+        node = self.nodes[key]
+
+        if self.count < node.lookback or key not in self.values:
+            return (np.nan,) * node.num_outputs
+
+        return self.values[key]
+
+    # Mutators
+    def add(self, key: str) -> None:
+        # Adds the node (and its dependencies) from the STREAMING_NODE_MAP.
+        if key in self.nodes:
+            return
+
+        node_cls = STREAMING_NODE_MAP[key]
+
+        for dependency in node_cls.dependencies:
+            self.add(dependency)
+
+        self.nodes[key] = node_cls()
+        self.closed_frames = None # Replays the buffered candles through the new nodes.
+
+    def reset(self) -> None:
+        self.nodes = {key: node.__class__() for key, node in self.nodes.items()}
+        self.values = dict()
+        self.count = 0
+
+    def evaluate(self, candle: tuple[float, float, float, float, float], commit: bool = False) -> None:
+        # Updates every node once on the (open, high, low, close, volume) @param candle.
+        for key, node in self.nodes.items():
+            self.values[key] = node.update(candle, tuple(self.values[dependency] for dependency
+                    in node.dependencies), commit)
+
+        if commit:
+            self.count += 1
+
+    def push(self, candle: tuple[float, float, float, float, float]) -> None:
+        # Commits the closed candle.
+        self.evaluate(candle, True)
+
+    def update(self) -> None:
+        # Pushes the candles closed since the last update and evaluates the live candle, replaying the
+        # buffered candles if the candle_buffer was reset or frames were dropped in between updates.
+        size = self.candle_buffer.get_size()
+
+        if not size:
+            return
+
+        live_candle = self.candle_buffer.get_candle(-1)
+        evaluated_key = (self.candle_buffer.get_generation(), live_candle)
+
+        if self.closed_frames is not None and evaluated_key == self.evaluated_key:
+            return
+
+        closed_frames = self.candle_buffer.get_frame_count() - 1
+        reset_count = self.candle_buffer.get_reset_count()
+        new_frames = -1 if self.closed_frames is None or reset_count != self.reset_count \
+                else closed_frames - self.closed_frames
+
+        if new_frames < 0 or new_frames > size - 1:
+            self.reset()
+            new_frames = size - 1
+
+        for index in range(-new_frames - 1, -1):
+            self.push(self.candle_buffer.get_candle(index))
+
+        self.closed_frames = closed_frames
+        self.reset_count = reset_count
+        self.evaluate(live_candle)
+        self.evaluated_key = evaluated_key
+
+if __name__ == "__main__":
+    # Parity of the streaming nodes against the TA-Lib functions, peeking at a partially formed (live)
+    # candle before each candle is closed.
+    from talib import abstract
+
+    rng = np.random.default_rng(1)
+    size = 3000
+
+    close_prices = np.round(100 * np.exp(np.cumsum(.01 * rng.standard_normal(size))), 1)
+    open_prices = np.r_[close_prices[0], close_prices[:-1]]
+    high_prices = np.maximum(open_prices, close_prices) + np.round(rng.exponential(.2, size), 1)
+    low_prices = np.minimum(open_prices, close_prices) - np.round(rng.exponential(.2, size), 1)
+    volumes = rng.exponential(10, size)
+
+    # Flat segment (zero ranges, deviations and price changes).
+    for prices in (open_prices, high_prices, low_prices, close_prices):
+        prices[1000:1040] = close_prices[999]
+
+    candles = [tuple(candle) for candle in np.column_stack((open_prices, high_prices, low_prices,
+            close_prices, volumes))]
+
+    momentum_indicators = [key for key in STREAMING_NODE_MAP if hasattr(abstract, key) and key != "TRANGE"]
+    streaming_graph = StreamingGraph(None)
+
+    for key in momentum_indicators:
+        streaming_graph.add(key)
+
+    streaming_values = {key: list() for key in momentum_indicators}
+
+    for open_price, high_price, low_price, close_price, volume in candles:
+        streaming_graph.evaluate((open_price, (open_price + high_price) / 2, low_price, close_price * 1.001,
+                volume / 2))
+        streaming_graph.evaluate((open_price, high_price, low_price, close_price, volume))
+
+        for key in momentum_indicators:
+            streaming_values[key].append(streaming_graph.get_values(key))
+
+        streaming_graph.push((open_price, high_price, low_price, close_price, volume))
+
+    def get_talib_values(key: str, start: int, end: int) -> np.ndarray:
+        talib_values = getattr(abstract, key)({"open": open_prices[start:end], "high": high_prices[start:end],
+                "low": low_prices[start:end], "close": close_prices[start:end], "volume": volumes[start:end]})
+
+        return np.column_stack([talib_values] if isinstance(talib_values, np.ndarray) else talib_values)
+
+    def assert_parity(key: str, values: np.ndarray, talib_values: np.ndarray, valid: np.ndarray) -> None:
+        assert np.array_equal(np.isnan(values), np.isnan(talib_values)), key
+        valid = valid & ~np.isnan(talib_values)
+        assert np.allclose(values[valid], talib_values[valid], rtol=1e-10, atol=1e-10), key
+
+    # The STOCHRSI of a constant RSI (flat prices) is the rounding noise of the RSI, which is excluded.
+    rsi_range = np.r_[np.full(4, np.nan), np.ptp(np.lib.stride_tricks.sliding_window_view(
+            get_talib_values("RSI", 0, size)[:, 0], 5), axis=1)]
+    flat_rsi = np.convolve(np.nan_to_num(rsi_range, nan=1) <= 1e-12, np.ones(3))[:size] > 0
+
+    for key in momentum_indicators:
+        assert_parity(key, np.array(streaming_values[key]), get_talib_values(key, 0, size),
+                ~flat_rsi[:, None] if key == "STOCHRSI" else np.ones((size, 1), dtype=bool))
+
+    class ReplayCandleBuffer:
+        # Minimal CandleBuffer (the streaming_graph reads) over the candles above.
+        def __init__(self) -> None:
+            self.candles, self.frame_count, self.generation, self.reset_count = list(), 0, 0, 0
+
+        def get_size(self) -> int:
+            return len(self.candles)
+
+        def get_candle(self, index: int = -1) -> tuple:
+            return self.candles[index]
+
+        def get_frame_count(self) -> int:
+            return self.frame_count
+
+        def get_generation(self) -> int:
+            return self.generation
+
+        def get_reset_count(self) -> int:
+            return self.reset_count
+
+        def reset(self) -> None:
+            self.candles, self.frame_count = list(), 0
+            self.generation, self.reset_count = self.generation + 1, self.reset_count + 1
+
+        def set_data(self, start: int, end: int) -> None:
+            self.candles += candles[start:end]
+            self.frame_count, self.generation = self.frame_count + end - start, self.generation + 1
+
+    # Reset then reload (reconnect) with more candles than committed, which must replay the buffer.
+    candle_buffer = ReplayCandleBuffer()
+    streaming_graph = StreamingGraph(candle_buffer)
+
+    for key in momentum_indicators:
+        streaming_graph.add(key)
+
+    candle_buffer.set_data(0, 100)
+    streaming_graph.update()
+    candle_buffer.reset()
+    candle_buffer.set_data(500, 620)
+    streaming_graph.update()
+
+    for key in momentum_indicators:
+        assert_parity(key, np.array([streaming_graph.get_values(key)]), get_talib_values(key, 500, 620)[-1:],
+                np.ones((1, 1), dtype=bool))
@@ -0,0 +1,234 @@
+import numpy as np
+
+from collections.abc import Iterable
+from scipy.linalg import cho_factor, cho_solve
+from . import PortfolioOptimizerInterface
+from .. import Portfolio
+from ...price_model import PriceModelBase
+
+class EfficientFrontierResults:
+    def __init__(self, weights: np.ndarray, expected_returns: np.ndarray, volatilities: np.ndarray) -> None:
+        """ Container for the frontier portfolios generated from @method MeanVarianceSolver.get_frontier
+        @param weights (np.ndarray): the (fully invested) weights of the portfolios (points x m_assets).
+        @param expected_returns (np.ndarray): the expected returns of the portfolios (points).
+        @param volatilities (np.ndarray): the return volatilities of the portfolios (points).
+        """
+        self.weights = weights
+        self.expected_returns = expected_returns
+        self.volatilities = volatilities
+
+class MeanVarianceSolver:
+    def __init__(self, covar_mat: np.ndarray, expected_returns: np.ndarray) -> None:
+        """ Mean-variance (fully invested, unconstrained) portfolios from a single Cholesky factorization
+        of the return covariance. Every frontier portfolio is a combination of the two fundamental
+        solutions inv(covar_mat) @ [expected_returns, 1], solved together in one batched triangular
+        solve, such that any number of frontier points are evaluated in O(points * m_assets).
+
+        @param covar_mat (np.ndarray): the return covariance matrix (m_assets x m_assets).
+        @param expected_returns (np.ndarray): the expected returns (m_assets).
+        """
+        self.factorize(covar_mat, expected_returns)
+
+    # Getters
+    def get_fundamental_rhs(self) -> np.ndarray:
+        return np.stack([self.expected_returns, np.ones_like(self.expected_returns)], axis=1)
+
+    def get_fundamental_coefs(self) -> tuple[float, float, float]:
+        """ @returns fundamental_coefs (tuple[float, float, float]): the quadratic forms
+                mu' inv(S) mu, 1' inv(S) mu and 1' inv(S) 1.
+        """
+        return (self.expected_returns @ self.fundamental_solutions[:, 0], self.fundamental_solutions[:, 0].sum(),
+                self.fundamental_solutions[:, 1].sum())
+
+    def get_min_variance_weights(self) -> np.ndarray:
+        return self.fundamental_solutions[:, 1] / self.fundamental_solutions[:, 1].sum()
+
+    def get_tangent_weights(self, risk_free_rate: float = 0) -> np.ndarray:
+        # @returns tangent_weights (np.ndarray): the weights maximizing the Sharpe ratio.
+        risk_premium_solution = self.fundamental_solutions[:, 0] - risk_free_rate * self.fundamental_solutions[:, 1]
+        return risk_premium_solution / risk_premium_solution.sum()
+
+    def get_target_return_weights(self, target_returns: (float | Iterable[float])) -> np.ndarray:
+        """ @returns weights (np.ndarray): the minimum variance weights (points x m_assets) achieving
+                each of the @param target_returns.
+        """
+        a, b, c = self.get_fundamental_coefs()
+        target_returns = np.array(target_returns, dtype=float, ndmin=1)[:, np.newaxis]
+
+        return ((c * target_returns - b) * self.fundamental_solutions[:, 0]
+                + (a - b * target_returns) * self.fundamental_solutions[:, 1]) / (a * c - b ** 2)
+
+    def get_risk_aversion_weights(self, risk_aversions: (float | Iterable[float])) -> np.ndarray:
+        """ @returns weights (np.ndarray): the weights (points x m_assets) maximizing
+                w' mu - risk_aversion / 2 * w' S w for each of the @param risk_aversions.
+        """
+        _, b, c = self.get_fundamental_coefs()
+        risk_aversions = np.array(risk_aversions, dtype=float, ndmin=1)[:, np.newaxis]
+
+        return self.get_min_variance_weights() + (self.fundamental_solutions[:, 0]
+                - b / c * self.fundamental_solutions[:, 1]) / risk_aversions
+
+    def get_frontier(self, target_returns: Iterable[float]) -> EfficientFrontierResults:
+        # @returns frontier (EfficientFrontierResults): the frontier portfolios at the @param target_returns.
+        a, b, c = self.get_fundamental_coefs()
+        target_returns = np.array(target_returns, dtype=float, ndmin=1)
+        variances = (c * target_returns ** 2 - 2 * b * target_returns + a) / (a * c - b ** 2)
+
+        return EfficientFrontierResults(self.get_target_return_weights(target_returns), target_returns,
+                np.sqrt(variances))
+
+    # Mutators
+    def factorize(self, covar_mat: np.ndarray, expected_returns: np.ndarray) -> None:
+        # Factorizes the @param covar_mat in O(m_assets^3) and solves the fundamental solutions.
+        self.covar_mat = np.array(covar_mat, dtype=float)
+        self.expected_returns = np.array(expected_returns, dtype=float)
+        self.chol_factor = cho_factor(self.covar_mat)
+        self.fundamental_solutions = cho_solve(self.chol_factor, self.get_fundamental_rhs())
+
+    def update(self, covar_mat: np.ndarray, expected_returns: np.ndarray = None, tol: float = 1e-10,
+        max_iterations: int = 8) -> int:
+        """ Warm-started re-optimization for covariances drifting between ticks: the fundamental
+        solutions are refined by conjugate gradient iterations (O(m_assets^2) each) from the previous
+        solutions, preconditioned by the existing Cholesky factor. Refactorizes where the iterations
+        do not converge (the covariance has drifted too far from the factorized covariance).
+
+        @param covar_mat (np.ndarray): the updated return covariance matrix (m_assets x m_assets).
+        @param expected_returns (np.ndarray, opt): the updated expected returns (m_assets).
+        @param tol (float, opt): the relative residual at which the solutions have converged.
+        @param max_iterations (int, opt): the maximum number of iterations before refactorizing.
+
+        @returns iterations (int): the number of iterations taken (-1 where refactorized).
+        """
+        self.covar_mat = np.array(covar_mat, dtype=float)
+
+        if expected_returns is not None:
+            self.expected_returns = np.array(expected_returns, dtype=float)
+
+        rhs = self.get_fundamental_rhs()
+        rhs_norm = np.linalg.norm(rhs, axis=0)
+        solutions = self.fundamental_solutions.copy()
+        residuals = rhs - self.covar_mat @ solutions
+        preconditioned = cho_solve(self.chol_factor, residuals, check_finite=False)
+        directions = preconditioned.copy()
+        residual_products = np.sum(residuals * preconditioned, axis=0)
+
+        for iterations in range(max_iterations + 1):
+            if np.all(np.linalg.norm(residuals, axis=0) <= tol * rhs_norm):
+                self.fundamental_solutions = solutions
+                return iterations
+
+            if iterations == max_iterations:
+                break
+
+            covar_directions = self.covar_mat @ directions
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step_sizes = np.nan_to_num(residual_products / np.sum(directions * covar_directions, axis=0))
+
+            solutions += step_sizes * directions
+            residuals -= step_sizes * covar_directions
+            preconditioned = cho_solve(self.chol_factor, residuals, check_finite=False)
+            updated_residual_products = np.sum(residuals * preconditioned, axis=0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                directions = preconditioned + np.nan_to_num(updated_residual_products / residual_products) \
+                        * directions
+
+            residual_products = updated_residual_products
+
+        self.factorize(self.covar_mat, self.expected_returns)
+        return -1
+
+class FrontierPortfolioOptimizer (PortfolioOptimizerInterface):
+    def __init__(self, price_model: PriceModelBase, t: float = 1, risk_aversion: float = None,
+        target_return: float = None) -> None:
+        """ Optimizes the portfolio weights along the efficient frontier of the portfolio returns over
+        the horizon @param t, reusing the factorization across calls where the covariance only drifts
+        (see @method MeanVarianceSolver.update).
+
+        @param price_model (PriceModelBase): the pricing model.
+        @param t (float, opt): the horizon of the returns, denominated in base_unit_of_time.
+        @param risk_aversion (float, opt): the risk aversion of the optimized portfolio.
+        @param target_return (float, opt): the target return of the optimized portfolio, defaults
+                to the tangent portfolio where neither is specified.
+        """
+        assert risk_aversion is None or target_return is None
+
+        self.price_model = price_model
+        self.t = t
+        self.risk_aversion = risk_aversion
+        self.target_return = target_return
+        self.solver: MeanVarianceSolver = None
+        self.tickers: list[str] = None
+
+    # Getters
+    def get_risk_free_rate(self) -> float:
+        # Continuously compounded risk free rate over the horizon.
+        return np.exp(self.price_model.get_risk_free_rate() * self.t) - 1
+
+    def get_solver(self, portfolio: Portfolio) -> MeanVarianceSolver:
+        """ @returns solver (MeanVarianceSolver): the solver of the portfolio returns, updated in place
+                (warm-started) while the portfolio holds the same balances.
+        """
+        port_ret_dist = portfolio.get_ret_dist(self.price_model)
+        covar_mat = port_ret_dist.get_covar_mat(self.t)
+        expected_returns = port_ret_dist.get_expectation_vect(self.t)
+        tickers = list(portfolio.ticker_to_balances.keys())
+
+        if self.solver is None or self.tickers != tickers:
+            self.solver = MeanVarianceSolver(covar_mat, expected_returns)
+            self.tickers = tickers
+        else:
+            self.solver.update(covar_mat, expected_returns)
+
+        return self.solver
+
+    def get_frontier(self, portfolio: Portfolio, target_returns: Iterable[float]) -> EfficientFrontierResults:
+        return self.get_solver(portfolio).get_frontier(target_returns)
+
+    def get_optimized_weights(self, portfolio: Portfolio) -> np.ndarray:
+        solver = self.get_solver(portfolio)
+
+        if self.risk_aversion is not None:
+            return solver.get_risk_aversion_weights(self.risk_aversion)[0]
+
+        if self.target_return is not None:
+            return solver.get_target_return_weights(self.target_return)[0]
+
+        return solver.get_tangent_weights(self.get_risk_free_rate())
+
+if __name__ == "__main__":
+    # Frontier sweep against re-solving with the inverse for each point, and warm-started updates
+    # against refactorizing.
+    m, points = 200, 100
+    rng = np.random.default_rng(0)
+    factors = rng.standard_normal((m, m)) / np.sqrt(m)
+    covar_mat = factors @ factors.T * .04 + np.eye(m) * .01
+    expected_returns = rng.uniform(0, .1, m)
+    target_returns = np.linspace(.02, .2, points)
+
+    solver = MeanVarianceSolver(covar_mat, expected_returns)
+    frontier = solver.get_frontier(target_returns)
+
+    # Lagrangian solution of each point from the inverse.
+    precision_mat = np.linalg.inv(covar_mat)
+    constraint_mat = np.stack([expected_returns, np.ones(m)], axis=1)
+    multipliers = np.linalg.solve(constraint_mat.T @ precision_mat @ constraint_mat,
+            np.stack([target_returns, np.ones(points)]))
+    point_weights = (precision_mat @ constraint_mat @ multipliers).T
+
+    assert np.allclose(frontier.weights, point_weights, rtol=0, atol=1e-8)
+    assert np.allclose(frontier.weights.sum(axis=-1), 1)
+    assert np.allclose(frontier.weights @ expected_returns, target_returns)
+    assert np.allclose(frontier.volatilities, np.sqrt(np.einsum("ij,jk,ik->i", point_weights, covar_mat,
+            point_weights)))
+
+    drift = rng.standard_normal((m, m)) * 1e-6
+    drifted_covar_mat = covar_mat + (drift + drift.T) / 2
+
+    iterations = solver.update(drifted_covar_mat)
+    refactorized_solver = MeanVarianceSolver(drifted_covar_mat, expected_returns)
+
+    assert 0 <= iterations
+    assert np.allclose(solver.get_tangent_weights(.01), refactorized_solver.get_tangent_weights(.01),
+            rtol=0, atol=1e-8)
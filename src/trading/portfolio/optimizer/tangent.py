@@ -2,25 +2,26 @@ import numpy as np
 
 from . import PortfolioOptimizerInterface
 from .. import Portfolio
+from .frontier import MeanVarianceSolver
 from ...price_model import PriceModelBase
 
 class TangentPortfolioOptimizer (PortfolioOptimizerInterface):
-    def __init__(self, price_model: PriceModelBase) -> None:
+    def __init__(self, price_model: PriceModelBase, t: float = 1) -> None:
+        """
+        @param price_model (PriceModelBase): the pricing model.
+        @param t (float, opt): the horizon of the returns, denominated in base_unit_of_time.
+        """
         self.price_model = price_model
+        self.t = t
 
     def get_optimized_weights(self, portfolio: Portfolio) -> np.ndarray:
         # Continuous compounded interest
-        risk_free_rate = np.exp(self.price_model.get_risk_free_rate() * self.price_model
-                .get_time_step_size()) - 1
+        risk_free_rate = np.exp(self.price_model.get_risk_free_rate() * self.t) - 1
 
         port_ret_dist = portfolio.get_ret_dist(self.price_model)
-        ret_covar_mat = port_ret_dist.get_covar_mat()
-        risk_premium_vect = port_ret_dist.get_expectation_vect() - risk_free_rate
+        solver = MeanVarianceSolver(port_ret_dist.get_covar_mat(self.t), port_ret_dist.get_expectation_vect(self.t))
 
-        precision_mat = np.linalg.inv(ret_covar_mat)
-        vect_product = np.squeeze(precision_mat @ np.expand_dims(risk_premium_vect, axis=1))
-
-        return vect_product / np.sum(vect_product)
+        return solver.get_tangent_weights(risk_free_rate)
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
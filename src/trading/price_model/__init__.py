@@ -1,10 +1,10 @@
 import time
 import numpy as np
 
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from datetime import datetime
 from .price_model_interface import PriceModelInterface
-from .price_distribution import AssetPriceDistributionBase
+from .price_distribution import AssetPriceDistributionBase, GreeksResults
 from .price_distribution.option import CallOptionPriceDistributionBase, PutOptionPriceDistributionBase
 
 class PriceModelBase (PriceModelInterface):
@@ -28,6 +28,19 @@ class PriceModelBase (PriceModelInterface):
         self.risk_free_rate = risk_free_rate
         self.base_unit_of_time = base_unit_of_time
         self.time_stamp = time_stamp if time_stamp else time.time()
+        # Incremented on every in-place update, invalidating the values cached by the distributions.
+        self.version = 0
+        # Incremented on the updates of the time_stamp and of the spot price of each asset respectively,
+        # such that the cached values are only invalidated by the inputs they were derived from.
+        self.time_version = 0
+        self.spot_versions: np.ndarray = np.zeros(len(self.asset_spot_prices), dtype=int)
+        # Covariances of the legs {(leg_key_a, leg_key_b, t): (spot_versions, covariance)}, valid for the
+        # time version and the spot versions of the underlyings of the legs.
+        self._covar_cache: dict[tuple[Hashable, Hashable, float], tuple[tuple[int, int], float]] = dict()
+        # Covariance matrices of the legs {(leg_keys, t): (spot_version_vect, covar_mat)}, valid for the time
+        # version, where the rows and columns of the legs whose underlyings have been updated are stale.
+        self._covar_mat_cache: dict[tuple[tuple[Hashable, ...], float], tuple[np.ndarray, np.ndarray]] = dict()
+        self._covar_cache_version: int = None
 
     # Getters
     def get_spot_price(self, asset_ticker: str) -> float:
@@ -48,6 +61,12 @@ class PriceModelBase (PriceModelInterface):
 
         return max(expiry_datetime - self.time_stamp, 0) / self.base_unit_of_time
 
+    def get_elapsed_time(self, time_stamp: float) -> float:
+        """ @returns elapsed_time (float): the time elapsed from the @param time_stamp (in seconds)
+                to the current time_stamp of the model, denominated in base_unit_of_time.
+        """
+        return (self.time_stamp - time_stamp) / self.base_unit_of_time
+
     def get_day_t(self) -> float:
         """ @returns day_t (float): the time step size for day denominated in
                 base_unit_of_time.
@@ -66,6 +85,137 @@ class PriceModelBase (PriceModelInterface):
         """
         return 31104000 / self.base_unit_of_time
 
+    def get_time_version(self) -> int:
+        return self.time_version
+
+    def get_spot_version(self, asset_ticker: str) -> int:
+        return int(self.spot_versions[self.ticker_to_indexes[asset_ticker]])
+
+    def get_covar_cache(self) -> dict[tuple[Hashable, Hashable, float], tuple[tuple[int, int], float]]:
+        # @returns covar_cache (dict): the cached covariances of the leg pairs with their spot versions.
+        self.validate_covar_caches()
+        return self._covar_cache
+
+    def get_covar_mat_cache(self) -> dict[tuple[tuple[Hashable, ...], float], tuple[np.ndarray, np.ndarray]]:
+        # @returns covar_mat_cache (dict): the cached covariance matrices with the spot versions of the legs.
+        self.validate_covar_caches()
+        return self._covar_mat_cache
+
+    def get_spot_version_vect(self, price_dists: list[AssetPriceDistributionBase]) -> np.ndarray:
+        # @returns spot_version_vect (np.ndarray): the spot versions of the underlyings of the @param price_dists.
+        return np.array([price_dist.get_spot_version() for price_dist in price_dists], dtype=int)
+
+    def get_covariance(self, price_dist_a: AssetPriceDistributionBase, price_dist_b: AssetPriceDistributionBase,
+        t: float = 1) -> float:
+        """ @returns covariance (float): the covariance of the @param price_dist_a and @param price_dist_b
+                (the variance where the legs are identical), cached by leg_key until the spot prices of
+                the underlyings (or the time_stamp) are updated.
+        """
+        key = (price_dist_a.leg_key, price_dist_b.leg_key, t)
+
+        try:
+            hash(key)
+        except TypeError: # Unhashable key (e.g. array of time steps)
+            return price_dist_a.get_covariance(price_dist_b, t)
+
+        covar_cache = self.get_covar_cache()
+        spot_versions = (price_dist_a.get_spot_version(), price_dist_b.get_spot_version())
+        spot_versions_covar = covar_cache.get(key)
+
+        if spot_versions_covar is None or spot_versions_covar[0] != spot_versions:
+            spot_versions_covar = (spot_versions, price_dist_a.get_variance(t) if key[0] == key[1]
+                    else price_dist_a.get_covariance(price_dist_b, t))
+            covar_cache[key] = covar_cache[(key[1], key[0], t)] = spot_versions_covar
+
+        return spot_versions_covar[1]
+
+    def get_cached_covar_mat(self, price_dists: list[AssetPriceDistributionBase], t: float = 1) \
+        -> tuple[(np.ndarray | None), (np.ndarray | None)]:
+        """ @returns covar_mat (np.ndarray | None): the cached covariance matrix (m_dists x m_dists) of the
+                @param price_dists, None where not cached (or the leg_keys are unhashable).
+        @returns stale (np.ndarray | None): whether the underlying of each leg has been updated since
+                the matrix was cached, such that its row and column of the covar_mat are stale.
+        """
+        try:
+            spot_version_vect_covar_mat = self.get_covar_mat_cache().get(
+                    (tuple(price_dist.leg_key for price_dist in price_dists), t))
+        except TypeError: # Unhashable key
+            return None, None
+
+        if spot_version_vect_covar_mat is None:
+            return None, None
+
+        spot_version_vect, covar_mat = spot_version_vect_covar_mat
+        return covar_mat, spot_version_vect != self.get_spot_version_vect(price_dists)
+
+    def set_cached_covar_mat(self, price_dists: list[AssetPriceDistributionBase], covar_mat: np.ndarray,
+        t: float = 1) -> None:
+        # Caches the @param covar_mat (m_dists x m_dists) of the @param price_dists, without copying.
+        try:
+            self.get_covar_mat_cache()[(tuple(price_dist.leg_key for price_dist in price_dists), t)] = \
+                    (self.get_spot_version_vect(price_dists), covar_mat)
+        except TypeError: # Unhashable key
+            pass
+
+    def get_covar_mat(self, price_dists: list[AssetPriceDistributionBase], t: float = 1) -> np.ndarray:
+        """ @returns covar_mat (np.ndarray): the covariance matrix (m_dists x m_dists) of the
+                @param price_dists, evaluated pairwise (see @method get_covariance).
+        """
+        m = len(price_dists)
+        covar_mat = np.empty(shape=(m, m), dtype=float)
+
+        for i in range(m):
+            covar_mat[i, i] = self.get_covariance(price_dists[i], price_dists[i], t)
+
+            for j in range(i + 1, m):
+                covar_mat[i, j] = self.get_covariance(price_dists[i], price_dists[j], t)
+                covar_mat[j, i] = covar_mat[i, j]
+
+        return covar_mat
+
+    def get_greeks(self, price_dists: list[AssetPriceDistributionBase], t: float = 0) -> GreeksResults:
+        """ @returns greeks (GreeksResults): the sensitivities (m_dists) of the @param price_dists,
+                evaluated for each distribution.
+        """
+        dist_greeks = [price_dist.get_greeks(t) for price_dist in price_dists]
+
+        return GreeksResults(*(
+            np.array([getattr(greeks, greek) for greeks in dist_greeks], dtype=float)
+            for greek in ("value", "delta", "gamma", "vega", "theta")
+        ))
+
+    # Mutators
+    def validate_covar_caches(self) -> None:
+        # Clears the cached covariances once the time_stamp is updated (the leg_keys of the derivatives
+        # depend on their decayed times to expiry).
+        if self._covar_cache_version != self.time_version:
+            self._covar_cache = dict()
+            self._covar_mat_cache = dict()
+            self._covar_cache_version = self.time_version
+
+    def update_spots(self, ticker_to_prices: dict[str, float]) -> None:
+        """ Updates the spot prices in place, such that existing distributions are repriced
+        without being regenerated.
+
+        @param ticker_to_prices (dict[str, float]): the updated prices by asset ticker.
+        """
+        for asset_ticker, spot_price in ticker_to_prices.items():
+            index = self.ticker_to_indexes[asset_ticker]
+            self.asset_spot_prices[index] = spot_price
+            self.spot_versions[index] += 1
+
+        self.version += 1
+
+    def update_time(self, time_stamp: float = None) -> None:
+        """ Advances the model time_stamp in place, decaying the times to expiry of the existing
+        derivative distributions.
+
+        @param time_stamp (float, opt): the current time_stamp in seconds, defaults to the system time.
+        """
+        self.time_stamp = time_stamp if time_stamp else time.time()
+        self.time_version += 1
+        self.version += 1
+
     # PriceDistribution generators
     def get_asset_price_dist(self, asset_ticker: str) -> AssetPriceDistributionBase:
         raise NotImplementedError()
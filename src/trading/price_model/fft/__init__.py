@@ -0,0 +1,120 @@
+import numpy as np
+
+from collections.abc import Iterable
+from .fft_price_model_base import FFTPriceModelBase
+from .price_distribution import FFTAssetPriceDistribution, FFTCallOptionPriceDistribution, \
+        FFTPutOptionPriceDistribution
+
+class FFTPriceModel (FFTPriceModelBase):
+    # PriceDistribution generators
+    def get_asset_price_dist(self, asset_ticker: str) -> FFTAssetPriceDistribution:
+        assert asset_ticker in self.ticker_to_indexes
+        return FFTAssetPriceDistribution(self, asset_ticker)
+
+    def get_call_option_price_dist(self, asset_ticker: str, strike_price: float,\
+        time_to_expiry: float, option_ticker: str = None) \
+        -> FFTCallOptionPriceDistribution:
+        assert asset_ticker in self.ticker_to_indexes
+        return FFTCallOptionPriceDistribution(self, asset_ticker, strike_price,
+                time_to_expiry, option_ticker)
+
+    def get_put_option_price_dist(self, asset_ticker: str, strike_price: float,\
+        time_to_expiry: float, option_ticker: str = None) \
+        -> FFTPutOptionPriceDistribution:
+        assert asset_ticker in self.ticker_to_indexes
+        return FFTPutOptionPriceDistribution(self, asset_ticker, strike_price,
+                time_to_expiry, option_ticker)
+
+class GBMFFTPriceModel (FFTPriceModel):
+    def __init__(self, asset_tickers: Iterable[str], asset_spot_prices: Iterable[float],
+        asset_log_ret_volatility: Iterable[float], risk_free_rate: float, time_stamp: float = None,
+        base_unit_of_time: int = 31104000, **fft_params) -> None:
+        """
+        @param asset_log_ret_volatility (Iterable[float]): the log return volatilities of the assets.
+        @param fft_params: see @method FFTPriceModelBase.__init__.
+        """
+        FFTPriceModel.__init__(self, asset_tickers, asset_spot_prices, risk_free_rate, time_stamp,
+                base_unit_of_time, **fft_params)
+
+        self.asset_log_ret_volatility = np.array(asset_log_ret_volatility, dtype=float)
+
+    def get_log_ret_char_fn_values(self, asset_ticker: str, u: np.ndarray, t: float = 1) -> np.ndarray:
+        variance = self.asset_log_ret_volatility[self.ticker_to_indexes[asset_ticker]] ** 2
+        return np.exp(1j * u * (self.risk_free_rate - variance / 2) * t - variance * u ** 2 * t / 2)
+
+class MertonJumpDiffusionFFTPriceModel (FFTPriceModel):
+    def __init__(self, asset_tickers: Iterable[str], asset_spot_prices: Iterable[float],
+        asset_log_ret_volatility: Iterable[float], asset_jump_intensity: Iterable[float],
+        asset_jump_mean: Iterable[float], asset_jump_volatility: Iterable[float], risk_free_rate: float,
+        time_stamp: float = None, base_unit_of_time: int = 31104000, **fft_params) -> None:
+        """ GBM with compound Poisson (log-normal) jumps in the log returns.
+
+        @param asset_log_ret_volatility (Iterable[float]): the diffusion log return volatilities.
+        @param asset_jump_intensity (Iterable[float]): the expected number of jumps per base_unit_of_time.
+        @param asset_jump_mean (Iterable[float]): the mean log return of the jumps.
+        @param asset_jump_volatility (Iterable[float]): the log return volatility of the jumps.
+        @param fft_params: see @method FFTPriceModelBase.__init__.
+        """
+        FFTPriceModel.__init__(self, asset_tickers, asset_spot_prices, risk_free_rate, time_stamp,
+                base_unit_of_time, **fft_params)
+
+        self.asset_log_ret_volatility = np.array(asset_log_ret_volatility, dtype=float)
+        self.asset_jump_intensity = np.array(asset_jump_intensity, dtype=float)
+        self.asset_jump_mean = np.array(asset_jump_mean, dtype=float)
+        self.asset_jump_volatility = np.array(asset_jump_volatility, dtype=float)
+
+    def get_log_ret_char_fn_values(self, asset_ticker: str, u: np.ndarray, t: float = 1) -> np.ndarray:
+        index = self.ticker_to_indexes[asset_ticker]
+        variance = self.asset_log_ret_volatility[index] ** 2
+        jump_intensity = self.asset_jump_intensity[index]
+        jump_mean, jump_variance = self.asset_jump_mean[index], self.asset_jump_volatility[index] ** 2
+
+        # Drift compensating the expected jump in the prices.
+        jump_compensator = jump_intensity * (np.exp(jump_mean + jump_variance / 2) - 1)
+
+        return np.exp(1j * u * (self.risk_free_rate - variance / 2 - jump_compensator) * t
+                - variance * u ** 2 * t / 2 + jump_intensity * t * (np.exp(1j * u * jump_mean
+                - jump_variance * u ** 2 / 2) - 1))
+
+class HestonFFTPriceModel (FFTPriceModel):
+    def __init__(self, asset_tickers: Iterable[str], asset_spot_prices: Iterable[float],
+        asset_variance: Iterable[float], asset_variance_reversion: Iterable[float],
+        asset_long_run_variance: Iterable[float], asset_variance_volatility: Iterable[float],
+        asset_variance_corr: Iterable[float], risk_free_rate: float, time_stamp: float = None,
+        base_unit_of_time: int = 31104000, **fft_params) -> None:
+        """ Stochastic (mean-reverting square root) variance of the log returns.
+
+        @param asset_variance (Iterable[float]): the current log return variances (v0).
+        @param asset_variance_reversion (Iterable[float]): the mean reversion rates (kappa).
+        @param asset_long_run_variance (Iterable[float]): the long run variances (theta).
+        @param asset_variance_volatility (Iterable[float]): the volatilities of the variances (xi).
+        @param asset_variance_corr (Iterable[float]): the correlations (rho) of the prices and variances.
+        @param fft_params: see @method FFTPriceModelBase.__init__.
+        """
+        FFTPriceModel.__init__(self, asset_tickers, asset_spot_prices, risk_free_rate, time_stamp,
+                base_unit_of_time, **fft_params)
+
+        self.asset_variance = np.array(asset_variance, dtype=float)
+        self.asset_variance_reversion = np.array(asset_variance_reversion, dtype=float)
+        self.asset_long_run_variance = np.array(asset_long_run_variance, dtype=float)
+        self.asset_variance_volatility = np.array(asset_variance_volatility, dtype=float)
+        self.asset_variance_corr = np.array(asset_variance_corr, dtype=float)
+
+    def get_log_ret_char_fn_values(self, asset_ticker: str, u: np.ndarray, t: float = 1) -> np.ndarray:
+        index = self.ticker_to_indexes[asset_ticker]
+        v0, kappa = self.asset_variance[index], self.asset_variance_reversion[index]
+        theta, xi, rho = self.asset_long_run_variance[index], self.asset_variance_volatility[index], \
+                self.asset_variance_corr[index]
+
+        # Albrecher et al. formulation (continuous in the complex logarithm).
+        beta = kappa - rho * xi * 1j * u
+        d = np.sqrt(beta ** 2 + xi ** 2 * (1j * u + u ** 2))
+        g = (beta - d) / (beta + d)
+        exp_dt = np.exp(-d * t)
+
+        return np.exp(1j * u * self.risk_free_rate * t + kappa * theta / xi ** 2 * ((beta - d) * t
+                - 2 * np.log((1 - g * exp_dt) / (1 - g))) + v0 / xi ** 2 * (beta - d) * (1 - exp_dt)
+                / (1 - g * exp_dt))
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,123 @@
+import numpy as np
+
+from collections.abc import Iterable
+from scipy.interpolate import CubicSpline
+from .. import PriceModelBase
+
+class FFTPriceModelBase (PriceModelBase):
+    def __init__(self, asset_tickers: Iterable[str], asset_spot_prices: Iterable[float], risk_free_rate: float,
+        time_stamp: float = None, base_unit_of_time: int = 31104000, fft_points: int = 4096,
+        fft_grid_spacing: float = .25, damping: float = 1.5) -> None:
+        """ Price model defined by the (risk-neutral) characteristic function of the log returns, where
+        the European options on each asset are priced for a full chain of strikes per expiry in
+        O(N log N) by the Carr-Madan FFT.
+
+        @param asset_tickers (Iterable[str]): the tickers of the assets in the price model universe.
+        @param asset_spot_prices (Iterable[float]): the current prices of the assets.
+        @param risk_free_rate (str): the borrowing rate of the funding currency.
+        @param time_stamp (float, opt): the current time_stamp of the model in seconds.
+        @param base_unit_of_time (int, opt): the base time unit in seconds.
+        @param fft_points (int, opt): the number of FFT points N (power of two).
+        @param fft_grid_spacing (float, opt): the spacing of the characteristic function grid, where
+                the log strike spacing is 2 * pi / (fft_points * fft_grid_spacing).
+        @param damping (float, opt): the damping exponent (alpha) of the call prices.
+        """
+        PriceModelBase.__init__(self, asset_tickers, asset_spot_prices, risk_free_rate, time_stamp,
+                base_unit_of_time)
+
+        self.fft_points = fft_points
+        self.fft_grid_spacing = fft_grid_spacing
+        self.damping = damping
+
+        # {(asset_ticker, T): call price spline over log moneyness}, valid for the model time_stamp.
+        self._call_price_chains: dict[tuple[str, float], CubicSpline] = dict()
+        self._call_price_chains_time_stamp: float = None
+
+    # Getters
+    def get_log_ret_char_fn_values(self, asset_ticker: str, u: np.ndarray, t: float = 1) -> np.ndarray:
+        """ @returns char_fn_values (np.ndarray): the risk-neutral characteristic function of the log
+                return Ln(S_t / S_0) of the @param asset_ticker evaluated at the (complex) @param u.
+        """
+        raise NotImplementedError()
+
+    def get_expected_ret(self, asset_ticker: str, t: float = 1, moment: int = 1) -> float:
+        # @returns expected_ret (float): the (risk-neutral) raw moment E[(S_t / S_0) ^ moment].
+        return self.get_log_ret_char_fn_values(asset_ticker, np.array([-1j * moment]), t)[0].real
+
+    def get_call_price_chain(self, asset_ticker: str, T: float) -> CubicSpline:
+        """ Carr-Madan FFT of the damped call prices, normalized by the spot price such that the chain
+        is invariant to spot updates (the log returns are independent of the spot price).
+
+        @returns call_price_chain (CubicSpline): the normalized call prices C / S_0 over the log
+                moneyness Ln(K / S_0), cached until the model time_stamp is updated.
+        """
+        if self._call_price_chains_time_stamp != self.time_stamp:
+            self._call_price_chains = dict()
+            self._call_price_chains_time_stamp = self.time_stamp
+
+        if (asset_ticker, T) in self._call_price_chains:
+            return self._call_price_chains[(asset_ticker, T)]
+
+        n, eta, alpha = self.fft_points, self.fft_grid_spacing, self.damping
+        log_strike_spacing = 2 * np.pi / (n * eta)
+        b = n * log_strike_spacing / 2
+
+        v = np.arange(n) * eta
+        log_moneyness = -b + log_strike_spacing * np.arange(n)
+
+        psi = np.exp(-self.risk_free_rate * T) * self.get_log_ret_char_fn_values(asset_ticker,
+                v - (alpha + 1) * 1j, T) / (alpha ** 2 + alpha - v ** 2 + 1j * (2 * alpha + 1) * v)
+
+        # Simpson's rule weights.
+        simpson_weights = (3 + (-1) ** (np.arange(n) + 1)) / 3
+        simpson_weights[0] = 1 / 3
+
+        call_prices = np.exp(-alpha * log_moneyness) / np.pi * np.fft.fft(np.exp(1j * b * v) * psi * eta
+                * simpson_weights).real
+
+        self._call_price_chains[(asset_ticker, T)] = CubicSpline(log_moneyness, call_prices)
+        return self._call_price_chains[(asset_ticker, T)]
+
+    def get_option_prices(self, asset_ticker: str, strike_prices: (float | np.ndarray), T: float,
+        call_flags: (bool | np.ndarray) = True) -> (float | np.ndarray):
+        """ Values a ladder of strikes on the @param asset_ticker expiring at @param T by
+        interpolating the cached chain.
+
+        @param strike_prices (float | np.ndarray): the strike prices of the options.
+        @param T (float): the time to expiry, denominated in base_unit_of_time.
+        @param call_flags (bool | np.ndarray, opt): whether each option is a call (True) or put (False).
+
+        @returns option_prices (float | np.ndarray): the current option prices.
+        """
+        s0 = self.get_spot_price(asset_ticker)
+        strike_prices = np.asarray(strike_prices, dtype=float)
+
+        if T <= 0:
+            return np.where(call_flags, np.maximum(s0 - strike_prices, 0),
+                    np.maximum(strike_prices - s0, 0))[()]
+
+        call_prices = s0 * np.maximum(self.get_call_price_chain(asset_ticker, T)(np.log(strike_prices / s0)), 0)
+
+        # Put-call parity.
+        return np.where(call_flags, call_prices, call_prices - np.exp(-self.risk_free_rate * T)
+                * (s0 * self.get_expected_ret(asset_ticker, T) - strike_prices))[()]
+
+if __name__ == "__main__":
+    # Strike ladders priced by FFT against the closed-form (per strike) GBM prices.
+    from . import GBMFFTPriceModel
+    from ..gbm import GBMPriceModel
+
+    strikes = np.linspace(50, 150, 200)
+    gbm_price_model = GBMPriceModel(["S"], [100], [.02], np.array([[.04]]), .02, time_stamp=1, log_ret_values=True)
+    fft_price_model = GBMFFTPriceModel(["S"], [100], [.2], .02, time_stamp=1)
+
+    for time_to_expiry in (.05, .5, 2):
+        fft_call_prices = fft_price_model.get_option_prices("S", strikes, time_to_expiry)
+        fft_put_prices = fft_price_model.get_option_prices("S", strikes, time_to_expiry, False)
+        closed_form_call_prices = np.array([gbm_price_model.get_call_option_price_dist("S", strike,
+                time_to_expiry).get_expectation(0) for strike in strikes])
+        closed_form_put_prices = np.array([gbm_price_model.get_put_option_price_dist("S", strike,
+                time_to_expiry).get_expectation(0) for strike in strikes])
+
+        assert np.allclose(fft_call_prices, closed_form_call_prices, rtol=0, atol=1e-5)
+        assert np.allclose(fft_put_prices, closed_form_put_prices, rtol=0, atol=1e-5)
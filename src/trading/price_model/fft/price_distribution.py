@@ -0,0 +1,34 @@
+import numpy as np
+
+from .fft_price_model_base import FFTPriceModelBase
+from ..price_distribution import AssetPriceDistributionBase
+from ..price_distribution.option import CallOptionPriceDistributionBase, PutOptionPriceDistributionBase
+
+class FFTAssetPriceDistribution (AssetPriceDistributionBase):
+    # Moments under the (risk-neutral) dynamics of the price model.
+    price_model: FFTPriceModelBase
+
+    def get_expectation(self, t: float = 1) -> float:
+        return self.s0 * self.price_model.get_expected_ret(self.asset_ticker, t)
+
+    def get_variance(self, t: float = 1) -> float:
+        return self.s0 ** 2 * (self.price_model.get_expected_ret(self.asset_ticker, t, 2)
+                - self.price_model.get_expected_ret(self.asset_ticker, t) ** 2)
+
+class FFTCallOptionPriceDistribution (CallOptionPriceDistributionBase):
+    price_model: FFTPriceModelBase
+
+    def get_expectation(self, t: float = 1) -> float:
+        # The discounted option price is a martingale under the (risk-neutral) model dynamics.
+        return self.price_model.get_option_prices(self.asset_ticker, self.K, self.T, True) \
+                * np.exp(self.r * t)
+
+class FFTPutOptionPriceDistribution (PutOptionPriceDistributionBase):
+    price_model: FFTPriceModelBase
+
+    def get_expectation(self, t: float = 1) -> float:
+        return self.price_model.get_option_prices(self.asset_ticker, self.K, self.T, False) \
+                * np.exp(self.r * t)
+
+if __name__ == "__main__":
+    pass
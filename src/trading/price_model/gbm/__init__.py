@@ -1,7 +1,13 @@
+import numpy as np
+
+from collections.abc import Iterable
 from .gbm_price_model_base import GBMPriceModelBase
 from .price_distribution import GBMAssetPriceDistribution
 from .price_distribution.option.call_option import GBMCallOptionPriceDistribution
 from .price_distribution.option.put_option import GBMPutOptionPriceDistribution
+from .price_distribution.chain import GBMAssetChainPriceDistribution, GBMCallOptionChainPriceDistribution, \
+        GBMPutOptionChainPriceDistribution
+from ..price_distribution import AssetPriceDistributionBase, GreeksResults
 
 class GBMPriceModel (GBMPriceModelBase):
     # PriceDistribution generators
@@ -23,5 +29,194 @@ class GBMPriceModel (GBMPriceModelBase):
         return GBMPutOptionPriceDistribution(self, asset_ticker, strike_price,
                 time_to_expiry, option_ticker)
 
+    def get_asset_chain_price_dist(self, asset_tickers: Iterable[str]) -> GBMAssetChainPriceDistribution:
+        return GBMAssetChainPriceDistribution(self, asset_tickers)
+
+    def get_call_option_chain_price_dist(self, asset_tickers: Iterable[str], strike_prices: Iterable[float],
+        times_to_expiry: Iterable[float]) -> GBMCallOptionChainPriceDistribution:
+        return GBMCallOptionChainPriceDistribution(self, asset_tickers, strike_prices, times_to_expiry)
+
+    def get_put_option_chain_price_dist(self, asset_tickers: Iterable[str], strike_prices: Iterable[float],
+        times_to_expiry: Iterable[float]) -> GBMPutOptionChainPriceDistribution:
+        return GBMPutOptionChainPriceDistribution(self, asset_tickers, strike_prices, times_to_expiry)
+
+    def get_option_chain_dist_params(self, asset_tickers: Iterable[str], strike_prices: Iterable[float],
+        times_to_expiry: Iterable[float], call_flags: Iterable[bool], t: float = 1) \
+        -> tuple[np.ndarray, np.ndarray]:
+        """ Values a chain of call and put options in one vectorized pass.
+
+        @param asset_tickers (Iterable[str]): the tickers of the underlying assets.
+        @param strike_prices (Iterable[float]): the strike prices of the options.
+        @param times_to_expiry (Iterable[float]): the times to expiry of the options,
+                denominated in base_unit_of_time.
+        @param call_flags (Iterable[bool]): whether each option is a call (True) or put (False).
+        @param t (float, opt): the time step size.
+
+        @returns dist_params (tuple[np.ndarray, np.ndarray]): the expectations and variances
+                of the option prices.
+        """
+        asset_tickers = np.array(asset_tickers, dtype=object)
+        strike_prices = np.array(strike_prices, dtype=float)
+        times_to_expiry = np.array(times_to_expiry, dtype=float)
+        call_flags = np.array(call_flags, dtype=bool)
+
+        expectations = np.empty(call_flags.shape, dtype=float)
+        variances = np.empty(call_flags.shape, dtype=float)
+
+        for chain_flags, get_chain_price_dist in ((call_flags, self.get_call_option_chain_price_dist),
+            (~call_flags, self.get_put_option_chain_price_dist)):
+            if not chain_flags.any():
+                continue
+
+            chain_price_dist = get_chain_price_dist(asset_tickers[chain_flags], strike_prices[chain_flags],
+                    times_to_expiry[chain_flags])
+
+            expectations[chain_flags] = chain_price_dist.get_expectation(t)
+            variances[chain_flags] = chain_price_dist.get_variance(t)
+
+        return expectations, variances
+
+    def get_chain_price_dists(self, price_dists: list[AssetPriceDistributionBase]) \
+        -> (list[tuple[np.ndarray, GBMAssetChainPriceDistribution]] | None):
+        """ @returns chain_price_dists (list[tuple[np.ndarray, GBMAssetChainPriceDistribution]]): the
+                GBM asset, call and put legs grouped by leg type into chain distributions, paired
+                with the indexes of the legs in @param price_dists. None where any leg is not
+                a GBM asset, call or put distribution.
+        """
+        leg_type_to_indexes: dict[type, list[int]] = {
+            GBMAssetPriceDistribution: [],
+            GBMCallOptionPriceDistribution: [],
+            GBMPutOptionPriceDistribution: []
+        }
+
+        for index, price_dist in enumerate(price_dists):
+            if type(price_dist) not in leg_type_to_indexes:
+                return None
+
+            leg_type_to_indexes[type(price_dist)].append(index)
+
+        chain_price_dists = list[tuple[np.ndarray, GBMAssetChainPriceDistribution]]()
+
+        for leg_type, indexes in leg_type_to_indexes.items():
+            if not indexes:
+                continue
+
+            legs = [price_dists[index] for index in indexes]
+            asset_tickers = [leg.asset_ticker for leg in legs]
+
+            if leg_type is GBMAssetPriceDistribution:
+                chain_price_dist = self.get_asset_chain_price_dist(asset_tickers)
+            elif leg_type is GBMCallOptionPriceDistribution:
+                chain_price_dist = self.get_call_option_chain_price_dist(asset_tickers,
+                        [leg.K for leg in legs], [leg.T for leg in legs])
+            else:
+                chain_price_dist = self.get_put_option_chain_price_dist(asset_tickers,
+                        [leg.K for leg in legs], [leg.T for leg in legs])
+
+            chain_price_dists.append((np.array(indexes, dtype=int), chain_price_dist))
+
+        return chain_price_dists
+
+    def get_chain_covar_mat(self, chain_price_dists: list[tuple[np.ndarray, GBMAssetChainPriceDistribution]],
+        m: int, t: float = 1) -> np.ndarray:
+        """ @returns covar_mat (np.ndarray): the covariance matrix (m_dists x m_dists) of the legs grouped
+                into the @param chain_price_dists (see @method get_chain_price_dists), where each block
+                of the upper triangle is evaluated in one broadcasted pass.
+        """
+        covar_mat = np.empty(shape=(m, m), dtype=float)
+
+        for i, (indexes_a, chain_a) in enumerate(chain_price_dists):
+            chain_a_col = chain_a.reshape((-1, 1))
+
+            for indexes_b, chain_b in chain_price_dists[i:]:
+                covar_block = chain_a_col.get_covariance(chain_b.reshape((1, -1)), t)
+
+                if indexes_b is indexes_a:
+                    # Mirror the upper triangle to preserve symmetry.
+                    covar_block = np.triu(covar_block, 1)
+                    covar_block += covar_block.T
+                    np.fill_diagonal(covar_block, chain_a.get_variance(t))
+
+                covar_mat[np.ix_(indexes_a, indexes_b)] = covar_block
+                covar_mat[np.ix_(indexes_b, indexes_a)] = covar_block.T
+
+        return covar_mat
+
+    def update_chain_covar_mat(self, covar_mat: np.ndarray, price_dists: list[AssetPriceDistributionBase],
+        chain_price_dists: list[tuple[np.ndarray, GBMAssetChainPriceDistribution]], stale_indexes: np.ndarray,
+        t: float = 1) -> None:
+        """ Re-evaluates the rows and columns of the @param covar_mat (m_dists x m_dists) of the legs at the
+        @param stale_indexes in place, against every leg grouped into the @param chain_price_dists.
+        """
+        stale_chain_price_dists = self.get_chain_price_dists([price_dists[index] for index in stale_indexes])
+        stale_covar_rows = np.empty(shape=(stale_indexes.size, len(price_dists)), dtype=float)
+        stale_variances = np.empty(stale_indexes.size, dtype=float)
+
+        for indexes_a, chain_a in stale_chain_price_dists:
+            chain_a_col = chain_a.reshape((-1, 1))
+            stale_variances[indexes_a] = chain_a.get_variance(t)
+
+            for indexes_b, chain_b in chain_price_dists:
+                stale_covar_rows[np.ix_(indexes_a, indexes_b)] = chain_a_col.get_covariance(
+                        chain_b.reshape((1, -1)), t)
+
+        # Mirror the upper triangle of the stale block to preserve symmetry.
+        stale_covar_block = np.triu(stale_covar_rows[:, stale_indexes], 1)
+        stale_covar_block += stale_covar_block.T
+        np.fill_diagonal(stale_covar_block, stale_variances)
+        stale_covar_rows[:, stale_indexes] = stale_covar_block
+
+        covar_mat[stale_indexes] = stale_covar_rows
+        covar_mat[:, stale_indexes] = stale_covar_rows.T
+
+    def get_covar_mat(self, price_dists: list[AssetPriceDistributionBase], t: float = 1) -> np.ndarray:
+        """ @returns covar_mat (np.ndarray): the covariance matrix (m_dists x m_dists) of the
+                @param price_dists. GBM asset, call and put legs are grouped by leg type into
+                chain distributions and each block of the matrix is evaluated in one
+                broadcasted pass.
+
+        Notes:
+            1. Falls back on the pairwise evaluation for any other distribution.
+            2. The matrix is cached by the leg_keys until the time_stamp is updated. Updates to the
+                spot prices only re-evaluate the rows and columns of the legs on the updated
+                underlyings (or the whole matrix, where most legs are stale).
+        """
+        covar_mat, stale = self.get_cached_covar_mat(price_dists, t)
+
+        if covar_mat is not None and not stale.any():
+            return covar_mat.copy()
+
+        chain_price_dists = self.get_chain_price_dists(price_dists)
+
+        if chain_price_dists is None:
+            return GBMPriceModelBase.get_covar_mat(self, price_dists, t)
+
+        if covar_mat is None or 2 * stale.sum() > stale.size:
+            covar_mat = self.get_chain_covar_mat(chain_price_dists, len(price_dists), t)
+        else:
+            self.update_chain_covar_mat(covar_mat, price_dists, chain_price_dists, np.flatnonzero(stale), t)
+
+        self.set_cached_covar_mat(price_dists, covar_mat, t)
+        return covar_mat.copy()
+
+    def get_greeks(self, price_dists: list[AssetPriceDistributionBase], t: float = 0) -> GreeksResults:
+        """ @returns greeks (GreeksResults): the sensitivities (m_dists) of the @param price_dists,
+                evaluated in one vectorized pass per leg type.
+        """
+        chain_price_dists = self.get_chain_price_dists(price_dists)
+
+        if chain_price_dists is None:
+            return GBMPriceModelBase.get_greeks(self, price_dists, t)
+
+        greeks = GreeksResults(*(np.empty(len(price_dists), dtype=float) for _ in range(5)))
+
+        for indexes, chain_price_dist in chain_price_dists:
+            chain_greeks = chain_price_dist.get_greeks(t)
+
+            for greek in ("value", "delta", "gamma", "vega", "theta"):
+                getattr(greeks, greek)[indexes] = getattr(chain_greeks, greek)
+
+        return greeks
+
 if __name__ == "__main__":
     pass
\ No newline at end of file
@@ -0,0 +1,205 @@
+import numpy as np
+
+from collections.abc import Iterable
+from . import GBMPriceModel
+from ...candle_buffer import CandleBuffer
+
+class GBMOnlineEstimator:
+    def __init__(self, asset_tickers: Iterable[str], candle_buffers: Iterable[CandleBuffer],
+        frame_resolution: int, decay: float = None, base_unit_of_time: int = 31104000) -> None:
+        """ Streaming estimator of the GBM log return drift and covariance, updated in O(m_assets^2)
+        for each candle closed across the subscribed candle buffers.
+
+        @param asset_tickers (Iterable[str]): the tickers of the assets.
+        @param candle_buffers (Iterable[CandleBuffer]): the candle buffers of the assets, sharing
+                the @param frame_resolution.
+        @param frame_resolution (int): the candle frame resolution in seconds.
+        @param decay (float, opt): the EWMA weight (0, 1) of the existing estimates for each candle,
+                defaults to the equally weighted (Welford) estimates.
+        @param base_unit_of_time (int, opt): the base time unit in seconds of the emitted price models.
+        """
+        assert decay is None or 0 < decay < 1
+
+        self.asset_tickers = list(asset_tickers)
+        self.candle_buffers: list[CandleBuffer] = list(candle_buffers)
+        self.frame_resolution = frame_resolution
+        self.decay = decay
+        self.base_unit_of_time = base_unit_of_time
+
+        assert len(self.asset_tickers) == len(self.candle_buffers)
+        self.reset()
+
+    # Getters
+    def get_log_ret_mean(self) -> np.ndarray:
+        # @returns log_ret_mean (np.ndarray): the mean log return per candle.
+        return self.log_ret_mean
+
+    def get_log_ret_covar_mat(self) -> np.ndarray:
+        # @returns log_ret_covar_mat (np.ndarray): the log return covariance per candle.
+        if self.decay is not None:
+            return self.log_ret_comoments.copy()
+
+        return self.log_ret_comoments / max(self.observations - 1, 1)
+
+    def get_price_model(self, risk_free_rate: float, time_stamp: float = None) -> GBMPriceModel:
+        """ @returns price_model (GBMPriceModel): the price model calibrated to the current estimates,
+                with the last close prices as spot prices.
+        """
+        assert self.observations > 0, "No candles have been observed."
+
+        candles_per_unit_time = self.base_unit_of_time / self.frame_resolution
+        log_ret_covar_mat = self.get_log_ret_covar_mat()
+
+        # E[Ln(S_t / S_0)] = (drift - variance / 2) * t
+        return GBMPriceModel(self.asset_tickers, self.last_close_prices, (self.log_ret_mean
+                + np.diag(log_ret_covar_mat) / 2) * candles_per_unit_time, log_ret_covar_mat
+                * candles_per_unit_time, risk_free_rate, time_stamp, self.base_unit_of_time,
+                log_ret_values=True)
+
+    # Mutators
+    def reset(self) -> None:
+        m = len(self.asset_tickers)
+
+        self.observations = 0
+        self.log_ret_mean = np.zeros(m, dtype=float)
+        self.log_ret_comoments = np.zeros((m, m), dtype=float)
+        self.last_close_prices: np.ndarray = None
+        self.time_frame: int = None
+
+    def push(self, log_rets: np.ndarray) -> None:
+        # Updates the estimates with the log returns (m_assets) of a closed candle.
+        self.observations += 1
+        deviation = log_rets - self.log_ret_mean
+
+        if self.decay is None:
+            self.log_ret_mean += deviation / self.observations
+            self.log_ret_comoments += np.outer(deviation, log_rets - self.log_ret_mean)
+        else:
+            self.log_ret_mean += (1 - self.decay) * deviation
+            self.log_ret_comoments = self.decay * (self.log_ret_comoments + (1 - self.decay)
+                    * np.outer(deviation, deviation))
+
+    def get_closed_prices(self, candle_buffer: CandleBuffer, lead_frames: int, frames: int) -> np.ndarray:
+        """ @returns close_prices (np.ndarray): the close prices of up to @param frames candles closed
+                before the open frame of the lagging buffer, where the @param candle_buffer leads
+                the lagging buffer by @param lead_frames.
+        """
+        close_data = candle_buffer.get_close_data(frames + lead_frames + 1)
+        return close_data[:max(close_data.shape[0] - lead_frames - 1, 0)]
+
+    def update(self) -> int:
+        """ Pushes the candles closed across all the candle buffers since the last update.
+
+        @returns closed_candles (int): the number of candles pushed.
+        """
+        time_frames = [candle_buffer.get_time_frame() for candle_buffer in self.candle_buffers]
+        time_frame = min(time_frames) # The open frame of the lagging buffer.
+
+        if self.time_frame is None:
+            closed_candles = 1 # Observes the last closed candle.
+        else:
+            closed_candles = (time_frame - self.time_frame) // self.frame_resolution
+
+        if closed_candles <= 0:
+            return 0
+
+        close_prices = [
+            self.get_closed_prices(candle_buffer, (time_frames[index] - time_frame) // self.frame_resolution,
+                    closed_candles)
+            for index, candle_buffer in enumerate(self.candle_buffers)
+        ]
+
+        observed_candles = min(asset_close_prices.shape[0] for asset_close_prices in close_prices)
+        close_prices = np.stack([asset_close_prices[asset_close_prices.shape[0] - observed_candles:]
+                for asset_close_prices in close_prices], axis=1)
+
+        if self.last_close_prices is not None and observed_candles == closed_candles:
+            # Contiguous with the last update (no candles dropped from the buffers).
+            close_prices = np.concatenate([self.last_close_prices[np.newaxis, :], close_prices], axis=0)
+
+        log_rets = np.diff(np.log(close_prices), axis=0)
+
+        for candle_log_rets in log_rets:
+            self.push(candle_log_rets)
+
+        self.time_frame = time_frame
+        if observed_candles: self.last_close_prices = close_prices[-1].copy()
+
+        return log_rets.shape[0]
+
+if __name__ == "__main__":
+    # Checks the streamed estimates against the batch estimates over the log returns of the closed candles:
+    # np.cov (Welford) or the EWMA weights (1 - decay) * decay^(n - i), with decay^n on the zero prior.
+    m, candles, frame_resolution, time_stamp = 3, 200, 60, 60000
+    rng = np.random.default_rng(0)
+    log_ret_chol_mat = np.linalg.cholesky(np.array([[1., .5, .2], [.5, 1., .3], [.2, .3, 1.]]))
+    close_prices = 100 * np.exp(np.cumsum(.01 * log_ret_chol_mat @ rng.standard_normal((m, candles)), axis=1))
+
+    def push_candles(candle_buffer: CandleBuffer, index: int, start: int, end: int) -> None:
+        # Pushes the candles [start, end) of the asset @param index, where the last candle is open.
+        close_values = close_prices[index, start:end].copy()
+        candle_buffer.set_data(time_stamp + frame_resolution * (end - 1), close_values, close_values,
+                close_values, close_values, np.zeros(end - start))
+
+    def check_estimates(estimator: GBMOnlineEstimator, log_rets: np.ndarray) -> None:
+        # @param log_rets (np.ndarray): the expected log returns (candles x m_assets) pushed to the estimator.
+        if estimator.decay is None:
+            log_ret_mean, log_ret_covar_mat = log_rets.mean(axis=0), np.cov(log_rets, rowvar=False)
+        else:
+            n = log_rets.shape[0]
+            weights = np.r_[estimator.decay ** n, (1 - estimator.decay) * estimator.decay ** np.arange(n - 1, -1, -1)]
+            deviations = np.vstack([np.zeros(m), log_rets])
+            log_ret_mean = weights @ deviations
+            deviations -= log_ret_mean
+            log_ret_covar_mat = (weights[:, np.newaxis] * deviations).T @ deviations
+
+        assert estimator.observations == log_rets.shape[0]
+        assert np.allclose(estimator.get_log_ret_mean(), log_ret_mean, rtol=1e-10, atol=1e-15)
+        assert np.allclose(estimator.get_log_ret_covar_mat(), log_ret_covar_mat, rtol=1e-10, atol=1e-15)
+
+    for decay in (None, .95):
+        # Aligned buffers updated on every candle: every closed candle is observed.
+        candle_buffers = [CandleBuffer(frame_resolution, 32) for _ in range(m)]
+        estimator = GBMOnlineEstimator(["A", "B", "C"], candle_buffers, frame_resolution, decay)
+
+        for end in range(1, candles + 1):
+            for index, candle_buffer in enumerate(candle_buffers):
+                push_candles(candle_buffer, index, end - 1, end)
+
+            estimator.update()
+
+        check_estimates(estimator, np.diff(np.log(close_prices[:, :candles - 1]), axis=1).T)
+        assert np.allclose(estimator.get_price_model(.02, time_stamp).asset_spot_prices, close_prices[:, candles - 2])
+        assert estimator.update() == 0 # No candles closed since.
+
+        # The buffer of asset C leads by 3 candles: the candles are observed up to the lagging buffers.
+        lead_frames = 3
+        candle_buffers = [CandleBuffer(frame_resolution, 32) for _ in range(m)]
+        estimator = GBMOnlineEstimator(["A", "B", "C"], candle_buffers, frame_resolution, decay)
+
+        for end in range(1, candles - lead_frames + 1):
+            for index, candle_buffer in enumerate(candle_buffers):
+                lead_end = end + lead_frames if index == 2 else end
+                push_candles(candle_buffer, index, max(lead_end - 1 - (lead_frames if end == 1 else 0), 0),
+                        lead_end)
+
+            estimator.update()
+
+        check_estimates(estimator, np.diff(np.log(close_prices[:, :candles - lead_frames - 1]), axis=1).T)
+
+        # Updated every 50 candles on buffers holding 32: the returns spanning the dropped candles are skipped,
+        # each update observing the 31 candles closed in the buffers.
+        candle_buffers = [CandleBuffer(frame_resolution, 32) for _ in range(m)]
+        estimator = GBMOnlineEstimator(["A", "B", "C"], candle_buffers, frame_resolution, decay)
+        update_ends = range(50, candles + 1, 50)
+        start = 0
+
+        for end in update_ends:
+            for index, candle_buffer in enumerate(candle_buffers):
+                push_candles(candle_buffer, index, start, end)
+
+            estimator.update()
+            start = end
+
+        check_estimates(estimator, np.concatenate([np.diff(np.log(close_prices[:, end - 32:end - 1]), axis=1).T
+                for end in update_ends[1:]], axis=0))
@@ -0,0 +1,68 @@
+import numpy as np
+
+class FactorCovarianceMatrix:
+    def __init__(self, factor_loadings: np.ndarray, idiosyncratic_variances: np.ndarray) -> None:
+        """ Low-rank representation of a covariance matrix (m x m), B @ B.T + diag(D), standing in for
+        the dense matrix: elements are evaluated on demand in O(k) without forming the matrix.
+
+        @param factor_loadings (np.ndarray): the factor loadings B (m x k_factors), scaled such that
+                the factors have unit variance.
+        @param idiosyncratic_variances (np.ndarray): the idiosyncratic variances D (m).
+        """
+        self.factor_loadings = np.array(factor_loadings, dtype=float, ndmin=2)
+        self.idiosyncratic_variances = np.array(idiosyncratic_variances, dtype=float)
+
+        assert self.factor_loadings.shape[0] == self.idiosyncratic_variances.size
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.idiosyncratic_variances.size, self.idiosyncratic_variances.size)
+
+    @property
+    def k_factors(self) -> int:
+        return self.factor_loadings.shape[1]
+
+    def get_params(self) -> dict:
+        # @returns params (dict): the (JSON serializable) keyword arguments that reconstruct the matrix.
+        return {
+            "factor_loadings": self.factor_loadings.tolist(),
+            "idiosyncratic_variances": self.idiosyncratic_variances.tolist()
+        }
+
+    def diagonal(self) -> np.ndarray:
+        return np.einsum("ik,ik->i", self.factor_loadings, self.factor_loadings) + self.idiosyncratic_variances
+
+    def __getitem__(self, indexes: tuple) -> (float | np.ndarray):
+        """ Evaluates the elements at the (broadcast) row and column @param indexes, following
+        the semantics of integer array indexing. Slices are expanded to ranges (the outer
+        product where both are slices).
+        """
+        row_indexes, col_indexes = (np.arange(self.shape[0])[index] if isinstance(index, slice)
+                else np.asarray(index) for index in indexes)
+
+        if isinstance(indexes[0], slice) and isinstance(indexes[1], slice):
+            row_indexes = row_indexes[:, np.newaxis]
+
+        if row_indexes.ndim == 2 and row_indexes.shape[1] == 1 and (col_indexes.ndim == 1
+            or col_indexes.ndim == 2 and col_indexes.shape[0] == 1):
+            # Outer product (n x 1, 1 x n') evaluated as B[rows] @ B[cols].T in O(n * n' * k), without
+            # gathering the (n x n' x k) loadings.
+            row_indexes, col_indexes = row_indexes[:, 0], col_indexes.reshape(-1)
+
+            return self.factor_loadings[row_indexes] @ self.factor_loadings[col_indexes].T + np.where(
+                    row_indexes[:, np.newaxis] == col_indexes, self.idiosyncratic_variances[row_indexes, np.newaxis], 0)
+
+        row_indexes, col_indexes = np.broadcast_arrays(row_indexes, col_indexes)
+
+        return (np.einsum("...k,...k->...", self.factor_loadings[row_indexes], self.factor_loadings[col_indexes])
+                + np.where(row_indexes == col_indexes, self.idiosyncratic_variances[row_indexes], 0))[()]
+
+    def __array__(self, dtype: type = None, copy: bool = None) -> np.ndarray:
+        # Dense matrix (O(m^2 * k)) for callers requiring the full matrix.
+        covar_mat = self.factor_loadings @ self.factor_loadings.T
+        covar_mat[np.diag_indices_from(covar_mat)] += self.idiosyncratic_variances
+
+        return covar_mat if dtype is None else covar_mat.astype(dtype)
+
+if __name__ == "__main__":
+    pass
@@ -1,22 +1,30 @@
 import math
 import numpy as np
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from scipy.linalg import solve_triangular
+from scipy.stats import norm, qmc
 from sympy import exp, Function, Symbol
 from sympy import ln, pi, Matrix
 from sympy.stats import density, LogNormal
+from .factor_covar_mat import FactorCovarianceMatrix
 from .. import PriceModelBase
-from ..price_model_interface import PriceSimulationResults
+from ..price_model_interface import PriceSimulationResults, MemmapPriceSimulationResults, SAMPLING_METHODS
 
 class GBMPriceModelBase (PriceModelBase):
     def __init__(self, asset_tickers: Iterable[str], asset_spot_prices: Iterable[float],
-        asset_ret_drift: Iterable[float], asset_ret_covar_mat: np.ndarray, risk_free_rate: float,
+        asset_ret_drift: Iterable[float], asset_ret_covar_mat: (np.ndarray | FactorCovarianceMatrix | dict),
+        risk_free_rate: float,
         time_stamp: float = None, base_unit_of_time: int = 31104000, log_ret_values: bool = False) -> None:
         """
         @param asset_tickers (Iterable[str]): the tickers of the assets in the price model universe.
         @param asset_spot_prices (Iterable[float]): the current prices of the assets.
         @param asset_ret_drift (Iterable[float]): the expected returns (percent change in prices).
-        @param asset_ret_covar_mat (np.ndarray): the covariance of the @param asset_ret_drift.
+        @param asset_ret_covar_mat (np.ndarray | FactorCovarianceMatrix | dict): the covariance of the
+                @param asset_ret_drift, either dense or as a low-rank factor model (or its params),
+                where factor models require @param log_ret_values.
         @param risk_free_rate (str): the borrowing rate of the funding currency.
         @param time_stamp (float, opt): the current time_stamp of the model in seconds.
         @param base_unit_of_time (int, opt): the base time unit in seconds.
@@ -34,6 +42,12 @@ class GBMPriceModelBase (PriceModelBase):
         
         asset_ret_drift = np.array(asset_ret_drift, dtype=float)
 
+        if isinstance(asset_ret_covar_mat, dict):
+            asset_ret_covar_mat = FactorCovarianceMatrix(**asset_ret_covar_mat)
+
+        if isinstance(asset_ret_covar_mat, FactorCovarianceMatrix):
+            assert log_ret_values, "Factor covariance models must be specified in log returns."
+
         if log_ret_values:
             self.asset_log_ret_drift = asset_ret_drift
             self.asset_log_ret_covar_mat = asset_ret_covar_mat
@@ -43,6 +57,29 @@ class GBMPriceModelBase (PriceModelBase):
             self.asset_log_ret_covar_mat = np.log(asset_ret_covar_mat / (asset_ret_dt.T
                     @ asset_ret_dt) + 1)
 
+        self._asset_log_ret_chol_mat: np.ndarray = None
+        # {(asset_tickers, t): (log_st_chol_mat, log_st_covar_log_det)}
+        self._log_st_chol_factors: dict[tuple[tuple[str, ...], float], tuple[np.ndarray, float]] = dict()
+
+    def get_model_params(self) -> dict:
+        """ @returns model_params (dict): the (JSON serializable) keyword arguments that
+                reconstruct the price model.
+        """
+        return {
+            "asset_tickers": list(self.ticker_to_indexes.keys()),
+            "asset_spot_prices": self.asset_spot_prices.tolist(),
+            "asset_ret_drift": self.asset_log_ret_drift.tolist(),
+            "asset_ret_covar_mat": self.asset_log_ret_covar_mat.get_params() if self.is_factor_model()
+                    else np.asarray(self.asset_log_ret_covar_mat).tolist(),
+            "risk_free_rate": self.risk_free_rate,
+            "time_stamp": self.time_stamp,
+            "base_unit_of_time": self.base_unit_of_time,
+            "log_ret_values": True
+        }
+
+    def is_factor_model(self) -> bool:
+        return isinstance(self.asset_log_ret_covar_mat, FactorCovarianceMatrix)
+
     # Return (denominated in base_unit_of_time: t = 1) getters
     def get_log_ret_drift(self, asset_ticker: str) -> float:
         return self.asset_log_ret_drift[self.ticker_to_indexes[asset_ticker]]
@@ -54,6 +91,39 @@ class GBMPriceModelBase (PriceModelBase):
     def get_log_ret_volatility(self, asset_ticker: str) -> float:
         return np.sqrt(self.get_log_ret_covar(asset_ticker, asset_ticker))
 
+    def get_log_ret_chol_mat(self) -> np.ndarray:
+        """ @returns log_ret_chol_mat (np.ndarray): the lower triangular Cholesky factor of the
+                asset_log_ret_covar_mat, computed once and cached.
+
+        Notes:
+            1. Positive semi-definite matrices (e.g. zero variance assets) are factorized
+                by leaving the columns of zero pivots empty.
+        """
+        assert not self.is_factor_model(), "factor models are simulated from the factor loadings."
+
+        if self._asset_log_ret_chol_mat is not None:
+            return self._asset_log_ret_chol_mat
+
+        try:
+            self._asset_log_ret_chol_mat = np.linalg.cholesky(self.asset_log_ret_covar_mat)
+        except np.linalg.LinAlgError:
+            covar_mat = self.asset_log_ret_covar_mat
+            chol_mat = np.zeros(covar_mat.shape, dtype=float)
+
+            for j in range(covar_mat.shape[0]):
+                pivot = covar_mat[j, j] - chol_mat[j, :j] @ chol_mat[j, :j]
+
+                if pivot <= covar_mat[j, j] * 1e-12:
+                    continue
+
+                chol_mat[j, j] = np.sqrt(pivot)
+                chol_mat[j + 1:, j] = (covar_mat[j + 1:, j] - chol_mat[j + 1:, :j] @ chol_mat[j, :j]) \
+                        / chol_mat[j, j]
+
+            self._asset_log_ret_chol_mat = chol_mat
+
+        return self._asset_log_ret_chol_mat
+
     def get_log_st_mean(self, asset_ticker: str, t: float = 1) -> float:
         index = self.ticker_to_indexes[asset_ticker]
 
@@ -71,7 +141,66 @@ class GBMPriceModelBase (PriceModelBase):
                 / self.get_log_ret_volatility(asset_ticker) \
                 / self.get_log_ret_volatility(other_ticker)
 
+    def get_log_st_chol_factors(self, asset_tickers: Iterable[str], t: float = 1) -> tuple[np.ndarray, float]:
+        """ @returns log_st_chol_mat (np.ndarray): the lower triangular Cholesky factor of the Ln(S_t)
+                covariance matrix of the @param asset_tickers, computed once per (asset_tickers, t).
+        @returns log_st_covar_log_det (float): the log-determinant of the Ln(S_t) covariance matrix.
+        """
+        asset_tickers = tuple(asset_tickers)
+
+        if (asset_tickers, t) not in self._log_st_chol_factors:
+            indexes = [self.ticker_to_indexes[asset_ticker] for asset_ticker in asset_tickers]
+            log_st_chol_mat = np.linalg.cholesky(t * np.asarray(self.asset_log_ret_covar_mat[
+                    np.ix_(indexes, indexes)]))
+
+            self._log_st_chol_factors[(asset_tickers, t)] = (log_st_chol_mat,
+                    2 * np.log(np.diag(log_st_chol_mat)).sum())
+
+        return self._log_st_chol_factors[(asset_tickers, t)]
+
     # Desnity function getters
+    def get_asset_density(self, asset_ticker: str, st: (float | np.ndarray), t: float = 1) -> (float | np.ndarray):
+        """ @returns density (float | np.ndarray): the (log-normal) density of the @param asset_ticker
+                price evaluated at the prices @param st.
+        """
+        st = np.asarray(st, dtype=float)
+        log_st_variance = self.get_log_st_covar(asset_ticker, asset_ticker, t)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_st = np.log(st)
+            density = np.exp(-(log_st - self.get_log_st_mean(asset_ticker, t)) ** 2 / (2 * log_st_variance)) \
+                    / (st * np.sqrt(2 * np.pi * log_st_variance))
+
+        return np.where(st > 0, density, 0)[()]
+
+    def get_joint_density(self, asset_tickers: Iterable[str], st: np.ndarray, t: float = 1) -> (float | np.ndarray):
+        """ @param asset_tickers (Iterable[str]): the ordered tickers of the assets.
+        @param st (np.ndarray): the prices (... x m_assets) at which the density is evaluated,
+                with the last axis ordered as the @param asset_tickers.
+
+        @returns density (float | np.ndarray): the (multivariate log-normal) joint density of the
+                asset prices evaluated at each point in @param st.
+        """
+        asset_tickers = tuple(asset_tickers)
+        st = np.asarray(st, dtype=float)
+        m = len(asset_tickers)
+
+        if m == 0:  return np.ones(st.shape[:-1])[()]
+        if m == 1:  return self.get_asset_density(asset_tickers[0], st[..., 0], t)
+
+        log_st_chol_mat, log_st_covar_log_det = self.get_log_st_chol_factors(asset_tickers, t)
+        log_st_mean = np.array([self.get_log_st_mean(asset_ticker, t) for asset_ticker in asset_tickers])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_st = np.log(st)
+            z = solve_triangular(log_st_chol_mat, (log_st - log_st_mean).reshape(-1, m).T, lower=True,
+                    check_finite=False)
+            log_density = -0.5 * (z ** 2).sum(axis=0).reshape(st.shape[:-1]) - m / 2 * np.log(2 * np.pi) \
+                    - 0.5 * log_st_covar_log_det - log_st.sum(axis=-1)
+
+        return np.where((st > 0).all(axis=-1), np.exp(log_density), 0)[()]
+
+    # Symbolic density functions (for plotting)
     def get_asset_density_fn(self, asset_ticker: str, t: float = 1) -> Function:
         dist = LogNormal(Symbol(asset_ticker), mean=self.get_log_st_mean(asset_ticker, t),
                 std=self.get_log_st_volatility(asset_ticker, t))
@@ -85,15 +214,9 @@ class GBMPriceModelBase (PriceModelBase):
         if m == 0:  return 1
         if m == 1:  return self.get_asset_density_fn(*asset_tickers, t)
 
-        # Generate Ln(S_t) covariance matrix
-        log_st_covar: Matrix = Matrix.zeros(m, m)
-
-        for i in range(m):
-            log_st_covar[i, i] = self.get_log_st_covar(asset_tickers[i], asset_tickers[i], t)
-
-            for j in range(i + 1, m):
-                log_st_covar[i, j] = self.get_log_st_covar(asset_tickers[i], asset_tickers[j], t)
-                log_st_covar[j, i] = log_st_covar[i, j]
+        # Ln(S_t) covariance determinant and inverse from the cached Cholesky factor
+        log_st_chol_mat, log_st_covar_log_det = self.get_log_st_chol_factors(asset_tickers, t)
+        log_st_chol_inv = solve_triangular(log_st_chol_mat, np.eye(m), lower=True)
 
         # Generate (Ln(S_t) - E[Ln(S_t)]) vector
         log_st_sub_mu: Matrix = Matrix([
@@ -101,29 +224,319 @@ class GBMPriceModelBase (PriceModelBase):
             for asset_ticker in asset_tickers
         ])
 
-        return (2 * pi) ** (- m / 2) * (log_st_covar.det()) ** (-0.5) * math.prod(
+        return (2 * pi) ** (- m / 2) * np.exp(-0.5 * log_st_covar_log_det) * math.prod(
                     1 / Symbol(asset_ticker) for asset_ticker in asset_tickers
-                ) * exp(-0.5 * log_st_sub_mu.T * log_st_covar.inv() * log_st_sub_mu)
+                ) * exp(-0.5 * log_st_sub_mu.T * Matrix(log_st_chol_inv.T @ log_st_chol_inv) * log_st_sub_mu)
 
-    def simulate_prices(self, paths: int, time_steps: int, t: float = 1) -> PriceSimulationResults:
-        log_st_drift_mean = (self.asset_log_ret_drift - np.diag(self.asset_log_ret_covar_mat) / 2) * t
+    # Simulation methods
+    @staticmethod
+    def get_brownian_bridge_increments(z: np.ndarray) -> np.ndarray:
+        """ Constructs Brownian motion paths by bisection, where the first draw sets the terminal
+        value and subsequent draws fill in the midpoints of coarser intervals first.
 
-        # (time_steps, paths, m_assets)
-        results = np.random.multivariate_normal(log_st_drift_mean, self.asset_log_ret_covar_mat * t,
-                size=(time_steps, paths))
-        
-        results = np.cumsum(results, axis=0)
-        results += np.log(self.asset_spot_prices)
-        results = np.exp(results)
+        @param z (np.ndarray): the standard normal draws (time_steps x ...) in bridge order.
+
+        @returns increments (np.ndarray): the unit variance increments (time_steps x ...) of
+                the Brownian motion paths.
+        """
+        time_steps = z.shape[0]
+        w = np.zeros((time_steps + 1,) + z.shape[1:], dtype=float)
+        w[time_steps] = np.sqrt(time_steps) * z[0]
+
+        intervals = [(0, time_steps)]
+        draw_index = 1
+
+        while intervals:
+            sub_intervals = []
+
+            for left, right in intervals:
+                if right - left < 2:
+                    continue
+
+                mid = (left + right) // 2
+                w[mid] = ((right - mid) * w[left] + (mid - left) * w[right]) / (right - left) \
+                        + np.sqrt((mid - left) * (right - mid) / (right - left)) * z[draw_index]
+
+                draw_index += 1
+                sub_intervals.extend(((left, mid), (mid, right)))
+
+            intervals = sub_intervals
+
+        return np.diff(w, axis=0)
+
+    def _draw_standard_normals(self, draws: np.ndarray, sampling: str, rng: np.random.Generator) -> None:
+        # Fills @param draws (m_assets, time_steps, paths) in place with standard normal draws.
+        assert sampling in SAMPLING_METHODS
+        m, time_steps, paths = draws.shape
+
+        if sampling == "pseudo":
+            for i in range(m):
+                draws[i] = rng.standard_normal((time_steps, paths))
+
+        elif sampling == "antithetic":
+            half_paths = paths - paths // 2
+
+            for i in range(m):
+                draws[i, :, :half_paths] = rng.standard_normal((time_steps, half_paths))
+                draws[i, :, half_paths:] = -draws[i, :, :paths // 2]
+
+        else: # Randomized quasi-Monte Carlo
+            qmc_engine = (qmc.Sobol if sampling == "sobol" else qmc.Halton)(d=m * time_steps, seed=rng)
+
+            # Dimension (k * m + i) drives the k-th bridge draw of asset i, such that the leading
+            # (most uniform) dimensions determine the terminal and coarse path values.
+            z = norm.ppf(qmc_engine.random(paths)).T.reshape(time_steps, m, paths)
+            draws[:] = GBMPriceModelBase.get_brownian_bridge_increments(z).transpose((1, 0, 2))
+
+    def _correlate_standard_normals(self, draws: np.ndarray, sampling: str, rng: np.random.Generator) -> None:
+        # Correlates @param draws (m_assets, time_steps, paths) in place to the log return covariance (t = 1).
+        m, time_steps, paths = draws.shape
+
+        if self.is_factor_model():
+            # Idiosyncratic draws loaded on the (k_factors, time_steps, paths) factor draws: O(m * k).
+            factor_loadings = self.asset_log_ret_covar_mat.factor_loadings
+            idiosyncratic_volatility = np.sqrt(self.asset_log_ret_covar_mat.idiosyncratic_variances)
+
+            factor_draws = np.empty((factor_loadings.shape[1], time_steps, paths), dtype=float)
+            self._draw_standard_normals(factor_draws, sampling, rng)
+
+            for i in range(m):
+                draws[i] *= idiosyncratic_volatility[i]
+                draws[i] += np.tensordot(factor_loadings[i], factor_draws, axes=1)
+        else:
+            log_ret_chol_mat = self.get_log_ret_chol_mat()
+
+            # Correlate in place: row i only depends on the uncorrelated rows j <= i.
+            for i in reversed(range(m)):
+                draws[i] *= log_ret_chol_mat[i, i]
+
+                if i > 0:
+                    draws[i] += np.tensordot(log_ret_chol_mat[i, :i], draws[:i], axes=1)
+
+    @staticmethod
+    def get_simulation_times(time_steps: (int | Iterable[float]), t: float = 1) -> tuple[np.ndarray, (float | None)]:
+        """ @param time_steps (int | Iterable[float]): the number of uniform time steps of size @param t,
+                or the observation times (e.g. option expiries), denominated in base_unit_of_time.
+
+        @returns times (np.ndarray): the (sorted, unique) observation times starting from zero.
+        @returns t (float | None): the size of the time step, None where the steps are not uniform.
+        """
+        if np.ndim(time_steps) == 0:
+            return np.arange(time_steps + 1, dtype=float) * t, t
+
+        times = np.unique(np.array(time_steps, dtype=float))
+        assert times.size and times[0] >= 0
+
+        return (times if times[0] == 0 else np.concatenate([[0.], times])), None
+
+    def simulate_prices(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1,
+        sampling: str = "pseudo", seed: (int | np.random.SeedSequence) = None) -> PriceSimulationResults:
+        """
+        @param paths (int): the number of paths to simulate.
+        @param time_steps (int | Iterable[float]): the number of time steps per path, or the
+                observation times (see @method get_simulation_times), where the exact increments
+                are only sampled at the observation times.
+        @param t (float, opt): the size of the time step.
+        @param sampling (str, opt): the sampling method from SAMPLING_METHODS.
+                pseudo:     independent pseudo-random draws.
+                antithetic: pseudo-random draws paired with their negation.
+                sobol, halton: scrambled low-discrepancy draws with Brownian-bridge ordering.
+        @param seed (int | np.random.SeedSequence, opt): the seed of the random generator,
+                drawn from fresh entropy by default.
+
+        @returns results (PriceSimulationResults): the simulated prices.
+        """
+        times, t = self.get_simulation_times(time_steps, t)
+        dt = np.diff(times)[:, None]
+        m = self.asset_spot_prices.size
+        log_ret_drift_mean = self.asset_log_ret_drift - self.asset_log_ret_covar_mat.diagonal() / 2
+        rng = np.random.default_rng(seed)
+
+        # (m_assets, time_steps + 1, paths) with the spot prices at the first time step.
+        results = np.empty((m, times.size, paths), dtype=float)
+        results[:, 0, :] = 0
+        self._draw_standard_normals(results[:, 1:], sampling, rng)
+        self._correlate_standard_normals(results[:, 1:], sampling, rng)
+
+        for i in range(m):
+            results[i, 1:] *= np.sqrt(dt)
+            results[i, 1:] += log_ret_drift_mean[i] * dt
+
+        for time_step in range(1, times.size):
+            results[:, time_step] += results[:, time_step - 1]
+
+        results += np.log(self.asset_spot_prices)[:, None, None]
+        np.exp(results, out=results)
+        results[:, 0, :] = self.asset_spot_prices[:, None]
+
+        return PriceSimulationResults(self.ticker_to_indexes, results, t, sampling, times)
+
+    def refine_simulated_prices(self, results: PriceSimulationResults, times: Iterable[float],
+        seed: (int | np.random.SeedSequence) = None) -> PriceSimulationResults:
+        """ Brownian-bridge refinement: samples the prices at the additional observation @param times
+        conditional on the simulated prices at the neighbouring observation times, such that a
+        sparse simulation is refined only where (and once) required.
+
+        @param results (PriceSimulationResults): the simulated prices.
+        @param times (Iterable[float]): the additional observation times, within the simulated times.
+        @param seed (int | np.random.SeedSequence, opt): the seed of the random generator.
+
+        @returns results (PriceSimulationResults): the simulated prices at the union of the times.
+
+        Notes:
+            1. The bridges are sampled from pseudo-random draws regardless of the results sampling.
+        """
+        refined_times = np.union1d(results.times, np.array(times, dtype=float))
+        assert refined_times[0] == results.times[0] and refined_times[-1] == results.times[-1], \
+                "Refined times must be within the simulated times."
+
+        simulated = np.isin(refined_times, results.times)
+        log_results = np.empty(results.results.shape[:1] + refined_times.shape + results.results.shape[2:])
+        log_results[:, simulated] = np.log(results.results)
+
+        rng = np.random.default_rng(seed)
+        draws = rng.standard_normal(log_results[:, ~simulated].shape)
+        self._correlate_standard_normals(draws, "pseudo", rng)
+
+        # Each time is sampled conditional on the (refined) previous and the next simulated times.
+        for draw_index, time_step in enumerate(np.flatnonzero(~simulated)):
+            next_time_step = time_step + np.argmax(simulated[time_step:])
+            t_left, t_mid, t_right = refined_times[[time_step - 1, time_step, next_time_step]]
+            weight = (t_mid - t_left) / (t_right - t_left)
+
+            log_results[:, time_step] = (1 - weight) * log_results[:, time_step - 1] \
+                    + weight * log_results[:, next_time_step] \
+                    + np.sqrt((t_mid - t_left) * (1 - weight)) * draws[:, draw_index]
+
+        return PriceSimulationResults(results.asset_tickers, np.exp(log_results), None, results.sampling,
+                refined_times)
+
+    def get_block_seeds(self, paths: int, block_paths: int, seed: (int | np.random.SeedSequence) = None) \
+        -> list[np.random.SeedSequence]:
+        # Spawns an independent seed stream for each block of paths.
+        seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return seed_seq.spawn(-(-paths // block_paths))
+
+    def simulate_price_blocks(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1,
+        block_paths: int = 10000,
+        sampling: str = "pseudo", seed: (int | np.random.SeedSequence) = None) \
+        -> Iterator[PriceSimulationResults]:
+        """ Streams the simulation in blocks of paths such that only one block is held in memory.
+
+        @param paths (int): the total number of paths to simulate.
+        @param time_steps (int | Iterable[float]): the number of time steps per path, or the
+                observation times (see @method simulate_prices).
+        @param t (float, opt): the size of the time step.
+        @param block_paths (int, opt): the (maximum) number of paths per block.
+        @param sampling (str, opt): the sampling method from SAMPLING_METHODS, applied per block.
+        @param seed (int | np.random.SeedSequence, opt): the root seed, from which an independent
+                seed stream is spawned for each block.
+
+        @returns results_blocks (Iterator[PriceSimulationResults]): the simulated blocks.
+        """
+        block_seeds = self.get_block_seeds(paths, block_paths, seed)
+
+        for block_start, block_seed in zip(range(0, paths, block_paths), block_seeds):
+            yield self.simulate_prices(min(block_paths, paths - block_start), time_steps, t, sampling,
+                    block_seed)
+
+    def simulate_prices_parallel(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1,
+        block_paths: int = 10000,
+        sampling: str = "pseudo", seed: (int | np.random.SeedSequence) = None, workers: int = None) \
+        -> PriceSimulationResults:
+        """ Simulates blocks of paths across a process pool, writing each block into shared memory.
+
+        @param paths (int): the total number of paths to simulate.
+        @param time_steps (int | Iterable[float]): the number of time steps per path, or the
+                observation times (see @method simulate_prices).
+        @param t (float, opt): the size of the time step.
+        @param block_paths (int, opt): the (maximum) number of paths per block.
+        @param sampling (str, opt): the sampling method from SAMPLING_METHODS, applied per block.
+        @param seed (int | np.random.SeedSequence, opt): the root seed, from which an independent
+                seed stream is spawned for each block.
+        @param workers (int, opt): the number of worker processes, defaults to the number of CPUs.
+
+        @returns results (PriceSimulationResults): the simulated prices.
+
+        Notes:
+            1. The blocks (and their seed streams) are independent of @param workers, such that
+                the results are identical for a given seed regardless of the worker count, and
+                identical to the blocks of @method simulate_price_blocks.
+        """
+        times, t = self.get_simulation_times(time_steps, t)
+        shape = (self.asset_spot_prices.size, times.size, paths)
+        block_seeds = self.get_block_seeds(paths, block_paths, seed)
+        block_args = [
+            (block_start, min(block_start + block_paths, paths), block_seed)
+            for block_start, block_seed in zip(range(0, paths, block_paths), block_seeds)
+        ]
+
+        if not self.is_factor_model():
+            self.get_log_ret_chol_mat() # Factorized once before the model is sent to the workers.
+
+        shared_memory = SharedMemory(create=True, size=max(1, math.prod(shape) * 8))
+
+        try:
+            if workers == 1:
+                for block_start, block_stop, block_seed in block_args:
+                    _simulate_shared_block(self, shared_memory.name, shape, block_start, block_stop,
+                            time_steps, t, sampling, block_seed)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(_simulate_shared_block, self, shared_memory.name, shape,
+                                block_start, block_stop, time_steps, t, sampling, block_seed)
+                        for block_start, block_stop, block_seed in block_args
+                    ]
+
+                    for future in futures:
+                        future.result()
+
+            results = np.array(np.ndarray(shape, dtype=float, buffer=shared_memory.buf))
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        return PriceSimulationResults(self.ticker_to_indexes, results, t, sampling, times)
+
+    def simulate_prices_to_file(self, file_path: str, paths: int, time_steps: (int | Iterable[float]), t: float = 1,
+        block_paths: int = 10000, sampling: str = "pseudo", seed: int = None) \
+        -> MemmapPriceSimulationResults:
+        """ Streams the blocks of @method simulate_price_blocks into a memory-mapped results file,
+        recording the seed and model parameters in its header.
+
+        @param file_path (str): the path of the results file.
+        @param seed (int, opt): the root seed, drawn from fresh entropy (and recorded) by default.
+
+        @returns results (MemmapPriceSimulationResults): the results file opened for writing.
+        """
+        seed = np.random.SeedSequence(seed).entropy
+        times, step_size = self.get_simulation_times(time_steps, t)
+        memmap_results = MemmapPriceSimulationResults.create(file_path, self.ticker_to_indexes, times.size - 1,
+                paths, step_size, sampling, seed, self.get_model_params(), None if step_size is not None else times)
+
+        for block_start, block_results in zip(range(0, paths, block_paths), self.simulate_price_blocks(
+            paths, time_steps, t, block_paths, sampling, seed)):
+            memmap_results.write_block(block_results, block_start)
+
+        memmap_results.flush()
+        return memmap_results
 
-        # Append spot prices to results -> (time_steps + 1, paths, m_assets)
-        spot_prices = np.full((1, paths, self.asset_spot_prices.size), self.asset_spot_prices)
-        results = np.concatenate([spot_prices, results], axis=0)
+def _simulate_shared_block(price_model: GBMPriceModelBase, shared_memory_name: str, shape: tuple[int, int, int],
+    block_start: int, block_stop: int, time_steps: (int | Iterable[float]), t: float, sampling: str,
+    block_seed: np.random.SeedSequence) -> None:
+    # Process pool worker: simulates a block of paths into the shared results.
+    shared_memory = SharedMemory(name=shared_memory_name)
 
-        # (time_steps, paths, m_assets) -> (m_assets, time_steps + 1, paths)
-        results = results.transpose((2, 0, 1))
+    try:
+        block_results = price_model.simulate_prices(block_stop - block_start, time_steps, t, sampling,
+                block_seed)
 
-        return PriceSimulationResults(self.ticker_to_indexes, results, t)
+        results = np.ndarray(shape, dtype=float, buffer=shared_memory.buf)
+        results[:, :, block_start:block_stop] = block_results.results
+        del results
+    finally:
+        shared_memory.close()
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
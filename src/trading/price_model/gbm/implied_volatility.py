@@ -0,0 +1,186 @@
+import numpy as np
+
+from collections.abc import Iterable
+from scipy.special import ndtr
+from scipy.stats import norm
+
+class ImpliedVolatilityResults:
+    def __init__(self, volatility: np.ndarray, converged: np.ndarray, iterations: int) -> None:
+        """ Container for the implied volatilities solved by @function get_implied_volatility
+        @param volatility (np.ndarray): the implied log return volatilities (nan where not converged).
+        @param converged (np.ndarray): whether the solver converged for each option.
+        @param iterations (int): the number of iterations taken.
+        """
+        self.volatility = volatility
+        self.converged = converged
+        self.iterations = iterations
+
+def get_option_prices(volatility: np.ndarray, spot_prices: np.ndarray, strike_prices: np.ndarray,
+    times_to_expiry: np.ndarray, risk_free_rates: np.ndarray, call_flags: np.ndarray) \
+    -> tuple[np.ndarray, np.ndarray]:
+    """ @returns option_prices (np.ndarray): the Black-Scholes prices, with d1 and d2 defined as in
+            @method GBMOptionPriceDistributionBase.get_d1_t and get_d2_t.
+    @returns vega (np.ndarray): the sensitivities of the prices to the @param volatility.
+    """
+    vol_sqrt_dt = volatility * np.sqrt(times_to_expiry)
+    discounted_strike = strike_prices * np.exp(-risk_free_rates * times_to_expiry)
+    option_sign = np.where(call_flags, 1, -1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1_t = (np.log(spot_prices) - np.log(strike_prices) + (risk_free_rates + volatility ** 2 / 2)
+                * times_to_expiry) / vol_sqrt_dt
+
+    d2_t = d1_t - vol_sqrt_dt
+    option_prices = option_sign * (spot_prices * ndtr(option_sign * d1_t) - discounted_strike
+            * ndtr(option_sign * d2_t))
+
+    return option_prices, spot_prices * norm.pdf(d1_t) * np.sqrt(times_to_expiry)
+
+def get_implied_volatility(option_prices: Iterable[float], spot_prices: Iterable[float],
+    strike_prices: Iterable[float], times_to_expiry: Iterable[float], risk_free_rates: (float | Iterable[float]),
+    call_flags: Iterable[bool], price_tol: float = 1e-10, volatility_tol: float = 1e-8,
+    volatility_bounds: tuple[float, float] = (1e-6, 10.), max_iterations: int = 100) -> ImpliedVolatilityResults:
+    """ Solves the implied volatilities of arrays of European options simultaneously, by Newton
+    iterations safeguarded with bisection: each option keeps a bracket of the implied volatility
+    and steps falling outside of the bracket (or with vanishing vega) bisect the bracket instead.
+
+    @param option_prices (Iterable[float]): the quoted option prices.
+    @param spot_prices (Iterable[float]): the spot prices of the underlying assets.
+    @param strike_prices (Iterable[float]): the strike prices of the options.
+    @param times_to_expiry (Iterable[float]): the times to expiry, denominated in base_unit_of_time.
+    @param risk_free_rates (float | Iterable[float]): the borrowing rates of the funding currency.
+    @param call_flags (Iterable[bool]): whether each option is a call (True) or put (False).
+    @param price_tol (float, opt): the absolute pricing error at which an option has converged.
+    @param volatility_tol (float, opt): the volatility error at which an option has converged (within
+            @param price_tol), where the error is estimated by the Newton step (or the width of the bracket).
+    @param volatility_bounds (tuple[float, float], opt): the initial bracket of volatilities.
+    @param max_iterations (int, opt): the maximum number of iterations.
+
+    @returns implied_volatility (ImpliedVolatilityResults): the implied log return volatilities
+            (denominated in base_unit_of_time) and convergence flags.
+
+    Notes:
+        1. Prices outside the no-arbitrage bounds are flagged as not converged.
+        2. Options whose bracket collapses while the pricing error exceeds @param price_tol (e.g. pinned
+            to the @param volatility_bounds) are flagged as not converged.
+        3. Options whose vega is too small for @param price_tol to resolve the volatility within
+            @param volatility_tol (e.g. deep in the money) are flagged as not converged.
+    """
+    option_prices, spot_prices, strike_prices, times_to_expiry, risk_free_rates, call_flags = \
+            np.broadcast_arrays(*(np.asarray(values, dtype=float) for values in (option_prices, spot_prices,
+            strike_prices, times_to_expiry, risk_free_rates, call_flags)))
+
+    call_flags = call_flags.astype(bool)
+    discounted_strike = strike_prices * np.exp(-risk_free_rates * times_to_expiry)
+
+    # No-arbitrage bounds of the option prices.
+    lower_bound = np.maximum(np.where(call_flags, spot_prices - discounted_strike,
+            discounted_strike - spot_prices), 0)
+    upper_bound = np.where(call_flags, spot_prices, discounted_strike)
+
+    solvable = (option_prices > lower_bound) & (option_prices < upper_bound) & (times_to_expiry > 0)
+    volatility_lo = np.full(option_prices.shape, volatility_bounds[0])
+    volatility_hi = np.full(option_prices.shape, volatility_bounds[1])
+
+    # Brenner-Subrahmanyam approximation as the initial guess.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility = np.sqrt(2 * np.pi / times_to_expiry) * option_prices / spot_prices
+
+    volatility = np.clip(np.nan_to_num(volatility, nan=.2), *volatility_bounds)
+    converged = np.zeros(option_prices.shape, dtype=bool)
+    # Converged, unsolvable or stalled options (the bracket collapsed without the price converging,
+    # or the price converged without resolving the volatility).
+    terminated = ~solvable
+    iterations = 0
+
+    while iterations < max_iterations and not terminated.all():
+        iterations += 1
+        active = ~terminated
+
+        prices, vega = get_option_prices(volatility[active], spot_prices[active], strike_prices[active],
+                times_to_expiry[active], risk_free_rates[active], call_flags[active])
+
+        pricing_error = prices - option_prices[active]
+        priced = np.abs(pricing_error) < price_tol
+        collapsed = volatility_hi[active] - volatility_lo[active] < volatility_tol
+        # The price does not resolve the volatility within volatility_tol (e.g. deep in the money).
+        ill_conditioned = vega * volatility_tol < price_tol
+
+        converged[active] = priced & ~ill_conditioned & ((np.abs(pricing_error) < volatility_tol * vega)
+                | collapsed)
+        terminated[active] = converged[active] | collapsed | (priced & ill_conditioned)
+
+        # Option prices are increasing in volatility.
+        volatility_hi[active] = np.where(pricing_error > 0, volatility[active], volatility_hi[active])
+        volatility_lo[active] = np.where(pricing_error < 0, volatility[active], volatility_lo[active])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton_volatility = volatility[active] - pricing_error / vega
+
+        bisect = ~((newton_volatility > volatility_lo[active]) & (newton_volatility < volatility_hi[active]))
+        volatility[active] = np.where(terminated[active], volatility[active], np.where(bisect,
+                (volatility_lo[active] + volatility_hi[active]) / 2, newton_volatility))
+
+    return ImpliedVolatilityResults(np.where(converged, volatility, np.nan), converged, iterations)
+
+if __name__ == "__main__":
+    # Checks and benchmarks the batch solver against the scalar approach: a root-finder wrapped around
+    # per-contract GBMPriceModel construction.
+    import time
+
+    from scipy.optimize import brentq
+    from . import GBMPriceModel
+
+    n = 2000
+    rng = np.random.default_rng(0)
+    spot_prices = rng.uniform(50, 150, n)
+    strike_prices = spot_prices * rng.uniform(.7, 1.3, n)
+    times_to_expiry = rng.uniform(.02, 2, n)
+    call_flags = rng.random(n) < .5
+    volatility = rng.uniform(.05, 1, n)
+    risk_free_rate = .02
+
+    option_prices, vega = get_option_prices(volatility, spot_prices, strike_prices, times_to_expiry,
+            risk_free_rate, call_flags)
+
+    start_time = time.perf_counter()
+    results = get_implied_volatility(option_prices, spot_prices, strike_prices, times_to_expiry,
+            risk_free_rate, call_flags)
+    batch_time = time.perf_counter() - start_time
+
+    # Deep in the money options (where the default price_tol does not resolve the volatility within
+    # the default volatility_tol) are not converged.
+    assert results.converged[vega > 2e-2].all() and not results.converged[vega < 5e-3].any()
+    assert np.allclose(results.volatility[results.converged], volatility[results.converged], rtol=0, atol=1e-6)
+
+    def get_scalar_implied_volatility(i: int) -> float:
+        def get_pricing_error(volatility: float) -> float:
+            price_model = GBMPriceModel(["S"], [spot_prices[i]], [risk_free_rate],
+                    np.array([[volatility ** 2]]), risk_free_rate, time_stamp=1, log_ret_values=True)
+            get_price_dist = price_model.get_call_option_price_dist if call_flags[i] \
+                    else price_model.get_put_option_price_dist
+
+            return get_price_dist("S", strike_prices[i], times_to_expiry[i]).get_expectation(0) \
+                    - option_prices[i]
+
+        return brentq(get_pricing_error, 1e-6, 10., xtol=1e-12)
+
+    scalar_indexes = np.flatnonzero(results.converged)[:50]
+    start_time = time.perf_counter()
+    scalar_volatility = np.array([get_scalar_implied_volatility(i) for i in scalar_indexes])
+    # Extrapolated from the subset to the n options.
+    scalar_time = (time.perf_counter() - start_time) * n / scalar_indexes.size
+
+    assert np.allclose(results.volatility[scalar_indexes], scalar_volatility, rtol=0, atol=1e-6)
+    assert batch_time * 10 < scalar_time, f"batch: {batch_time:.4f}s, scalar: {scalar_time:.4f}s"
+
+    # Options pinned to the volatility bounds or priced outside of the no-arbitrage bounds
+    # are not converged.
+    pinned_prices, _ = get_option_prices(np.array([.8, 1e-8]), 100., 110., .5, risk_free_rate, True)
+    pinned_results = get_implied_volatility(pinned_prices, 100., 110., .5, risk_free_rate, True,
+            volatility_bounds=(1e-3, .5))
+
+    assert not pinned_results.converged.any() and np.isnan(pinned_results.volatility).all()
+
+    arbitrage_results = get_implied_volatility([100., 0.], 100., [90., 110.], .5, risk_free_rate, [True, True])
+    assert not arbitrage_results.converged.any()
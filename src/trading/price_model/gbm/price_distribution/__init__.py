@@ -1,12 +1,18 @@
 import numpy as np
 
 from ..gbm_price_model_base import GBMPriceModelBase
-from ...price_distribution import AssetPriceDistributionBase
+from ...price_distribution import AssetPriceDistributionBase, GreeksResults
 from ...price_distribution.derivative import DerivativePriceDistributionBase
 from ...temporal_distribution import TemporalDistributionBase
 
 class GBMAssetPriceDistribution (AssetPriceDistributionBase):
     price_model: GBMPriceModelBase
+    # Whether the distribution parameters are arrays (see GBMAssetChainPriceDistribution).
+    vectorized: bool = False
+
+    @property
+    def asset_index(self) -> int:
+        return self.price_model.ticker_to_indexes[self.asset_ticker]
 
     @property
     def log_ret_mean(self) -> float:
@@ -21,7 +27,8 @@ class GBMAssetPriceDistribution (AssetPriceDistributionBase):
         return self.price_model.get_log_ret_volatility(self.asset_ticker)
 
     def get_log_st_mean(self, t: float = 1) -> float:
-        return self.price_model.get_log_st_mean(self.asset_ticker, t)
+        return self.get_derived_value(("log_st_mean", t), lambda: self.price_model.get_log_st_mean(
+                self.asset_ticker, t), self.get_spot_version())
 
     def get_log_st_variance(self, t: float = 1) -> float:
         return self.price_model.get_log_st_covar(self.asset_ticker, self.asset_ticker, t)
@@ -29,6 +36,12 @@ class GBMAssetPriceDistribution (AssetPriceDistributionBase):
     def get_log_st_volatility(self, t: float = 1) -> float:
         return self.price_model.get_log_st_volatility(self.asset_ticker, t)
 
+    def get_log_st_covar(self, other: "GBMAssetPriceDistribution", t: float = 1) -> float:
+        return self.price_model.get_log_st_covar(self.asset_ticker, other.asset_ticker, t)
+
+    def get_log_st_corr(self, other: "GBMAssetPriceDistribution", t: float = 1) -> float:
+        return self.price_model.get_log_st_corr(self.asset_ticker, other.asset_ticker, t)
+
     def get_expectation(self, t: float = 1) -> float:
         return self.s0 * np.exp(self.log_ret_mean * t)
 
@@ -43,9 +56,14 @@ class GBMAssetPriceDistribution (AssetPriceDistributionBase):
             return other.get_covariance(self, t)
 
         return self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
-            np.exp(self.price_model.get_log_st_covar(self.asset_ticker, other.asset_ticker, t))
-            - 1
+            np.exp(self.get_log_st_covar(other, t)) - 1
         )
 
+    def get_greeks(self, t: float = 0) -> GreeksResults:
+        delta = np.exp(self.log_ret_mean * t) * np.ones_like(self.s0)
+
+        return GreeksResults(self.s0 * delta, delta, np.zeros_like(delta), np.zeros_like(delta),
+                np.zeros_like(delta))
+
 if __name__ == "__main__":
     pass
\ No newline at end of file
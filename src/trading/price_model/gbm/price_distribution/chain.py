@@ -0,0 +1,144 @@
+import numpy as np
+
+from copy import copy
+from collections.abc import Iterable
+from . import GBMAssetPriceDistribution
+from .option import GBMOptionPriceDistributionBase
+from .option.call_option import GBMCallOptionPriceDistribution
+from .option.put_option import GBMPutOptionPriceDistribution
+from ..gbm_price_model_base import GBMPriceModelBase
+from ...price_model_interface import PriceSimulationResults
+
+class GBMAssetChainPriceDistribution (GBMAssetPriceDistribution):
+    # Vectorized GBMAssetPriceDistribution: the distribution parameters are arrays aligned
+    # with the asset_tickers such that the (scalar) distribution formulas are evaluated
+    # over the whole chain in a single pass.
+    vectorized: bool = True
+
+    def __init__(self, price_model: GBMPriceModelBase, asset_tickers: Iterable[str],
+        ticker: str = None) -> None:
+        """
+        @param price_model (GBMPriceModelBase): the parent pricing model.
+        @param asset_tickers (Iterable[str]): the tickers of the underlying assets.
+        @param ticker (str): the identifying ticker, generates an UUID by default.
+        """
+        GBMAssetPriceDistribution.__init__(self, price_model, ticker)
+        self.asset_indexes = np.array([
+            price_model.ticker_to_indexes[asset_ticker] for asset_ticker in asset_tickers
+        ], dtype=int)
+
+    @property
+    def asset_index(self) -> np.ndarray:
+        return self.asset_indexes
+
+    @property
+    def s0(self) -> np.ndarray:
+        return self.price_model.asset_spot_prices[self.asset_indexes]
+
+    @property
+    def log_ret_mean(self) -> np.ndarray:
+        return self.price_model.asset_log_ret_drift[self.asset_indexes]
+
+    @property
+    def log_ret_variance(self) -> np.ndarray:
+        return self.price_model.asset_log_ret_covar_mat[self.asset_indexes, self.asset_indexes]
+
+    @property
+    def log_ret_volatility(self) -> np.ndarray:
+        return np.sqrt(self.log_ret_variance)
+
+    @property
+    def leg_key(self) -> tuple:
+        return (type(self), self.asset_indexes) # Unhashable, the chain is not cached.
+
+    def get_spot_version(self) -> int:
+        # The spot versions only increase, such that the sum changes with the spot price of any underlying.
+        return int(self.price_model.spot_versions[self.asset_indexes].sum())
+
+    def get_log_st_mean(self, t: float = 1) -> np.ndarray:
+        return np.log(self.s0) + (self.log_ret_mean - self.log_ret_variance / 2) * t
+
+    def get_log_st_variance(self, t: float = 1) -> np.ndarray:
+        return t * self.log_ret_variance
+
+    def get_log_st_volatility(self, t: float = 1) -> np.ndarray:
+        return np.sqrt(self.log_ret_variance * t)
+
+    def get_log_st_covar(self, other: GBMAssetPriceDistribution, t: float = 1) -> np.ndarray:
+        return t * self.price_model.asset_log_ret_covar_mat[self.asset_index, other.asset_index]
+
+    def get_log_st_corr(self, other: GBMAssetPriceDistribution, t: float = 1) -> np.ndarray:
+        return self.price_model.asset_log_ret_covar_mat[self.asset_index, other.asset_index] \
+                / self.log_ret_volatility / other.log_ret_volatility
+
+    @property
+    def asset_tickers(self) -> list[str]:
+        index_to_tickers = {index: ticker for ticker, index in self.price_model.ticker_to_indexes.items()}
+        return [index_to_tickers[asset_index] for asset_index in self.asset_indexes.ravel()]
+
+    def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
+        """ @returns simulated_prices (np.ndarray): the prices (chain x time_steps x paths) in the
+                results corresponding to the asset_tickers.
+        """
+        simulated_values = results.results[[results.asset_tickers[asset_ticker] for asset_ticker
+                in self.asset_tickers]]
+
+        return simulated_values.reshape(self.asset_indexes.shape + simulated_values.shape[1:])
+
+    def reshape(self, shape: tuple[int, ...]) -> "GBMAssetChainPriceDistribution":
+        # Returns a copy of the chain with the parameters reshaped for broadcasting.
+        chain_dist = copy(self)
+        chain_dist.asset_indexes = self.asset_indexes.reshape(shape)
+        chain_dist._derived_values = dict() # Derived values are not reshaped.
+
+        return chain_dist
+
+class GBMOptionChainPriceDistributionBase (GBMAssetChainPriceDistribution, GBMOptionPriceDistributionBase):
+    def __init__(self, price_model: GBMPriceModelBase, asset_tickers: Iterable[str],
+        strike_prices: Iterable[float], times_to_expiry: Iterable[float], ticker: str = None) -> None:
+        """
+        @param price_model (GBMPriceModelBase): the parent pricing model.
+        @param asset_tickers (Iterable[str]): the tickers of the underlying assets.
+        @param strike_prices (Iterable[float]): the strike prices of the options.
+        @param times_to_expiry (Iterable[float]): the times to expiry of the options,
+                denominated in base_unit_of_time.
+        @param ticker (str): the identifying ticker, generates an UUID by default.
+        """
+        GBMOptionPriceDistributionBase.__init__(self, price_model, None, np.array(strike_prices,
+                dtype=float), np.array(times_to_expiry, dtype=float), ticker)
+        GBMAssetChainPriceDistribution.__init__(self, price_model, asset_tickers, self.ticker)
+
+    def reshape(self, shape: tuple[int, ...]) -> "GBMOptionChainPriceDistributionBase":
+        chain_dist = GBMAssetChainPriceDistribution.reshape(self, shape)
+        chain_dist.strike_price = self.strike_price.reshape(shape)
+        chain_dist.time_to_expiry = self.time_to_expiry.reshape(shape)
+
+        return chain_dist
+
+    def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
+        """ Batched pathwise valuation: the options on each underlying are valued against the
+        simulated prices of the underlying in a single pass.
+
+        @returns simulated_prices (np.ndarray): the prices (chain x time_steps x paths) in the
+                results corresponding to the options.
+        """
+        asset_indexes = self.asset_indexes.ravel()
+        strike_prices = self.strike_price.reshape(-1, 1, 1)
+        times_to_expiry = self.T.reshape(-1, 1, 1)
+        simulated_values = np.empty((asset_indexes.size,) + results.results.shape[1:])
+
+        for asset_index, asset_ticker in set(zip(asset_indexes, self.asset_tickers)):
+            legs = asset_indexes == asset_index
+            simulated_values[legs] = self.get_pathwise_values(results, asset_ticker, strike_prices[legs],
+                    times_to_expiry[legs])
+
+        return simulated_values.reshape(self.asset_indexes.shape + simulated_values.shape[1:])
+
+class GBMCallOptionChainPriceDistribution (GBMOptionChainPriceDistributionBase, GBMCallOptionPriceDistribution):
+    pass
+
+class GBMPutOptionChainPriceDistribution (GBMOptionChainPriceDistributionBase, GBMPutOptionPriceDistribution):
+    pass
+
+if __name__ == "__main__":
+    pass
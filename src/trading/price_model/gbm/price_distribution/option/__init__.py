@@ -3,32 +3,60 @@ import numpy as np
 from sympy import Function
 from sympy import ln, sqrt
 from scipy.special import owens_t
+from scipy.stats import norm
+
+from ....price_model_interface import PriceSimulationResults
 
 from .. import GBMAssetPriceDistribution
+from ....price_distribution import GreeksResults
 from ....price_distribution.option import OptionPriceDistributionBase
 
+try:
+    from . import option_kernel
+except ImportError:
+    # Extension not built: the scalar distributions fall back to the (broadcasting) numpy formulas.
+    option_kernel = None
+
 class GBMOptionPriceDistributionBase (OptionPriceDistributionBase, GBMAssetPriceDistribution):
     @staticmethod
-    def H(a: "GBMOptionPriceDistributionBase", b: "GBMOptionPriceDistributionBase", d_ai: float,
-        d_bj: float, log_st_corr: float, t: float) -> float:
+    def H(a: "GBMOptionPriceDistributionBase", b: "GBMOptionPriceDistributionBase", d_ai: (float | np.ndarray),
+        d_bj: (float | np.ndarray), log_st_corr: (float | np.ndarray), t: float) -> (float | np.ndarray):
 
-        def sign_plus(v: float) -> int:
-            return -1 if v < 0 else 1
+        def sign_plus(v: (float | np.ndarray)) -> (int | np.ndarray):
+            return np.where(v < 0, -1, 1)
 
         dt_a, dt_b = a.get_dt(t), b.get_dt(t)
-        owens_t_h_scalar = 1 / np.sqrt(a.T * b.T - log_st_corr ** 2 * t ** 2)
-        eta = d_bj * np.sqrt(b.T) - log_st_corr * d_ai * np.sqrt(a.T)
-
-        return 0.5 * np.sign(log_st_corr) * (
-                int(np.sign(log_st_corr) * sign_plus(eta) * sign_plus(-d_ai) < 0)
-                + int(sign_plus(-log_st_corr * eta) * sign_plus(-log_st_corr * d_bj) < 0)
-                - int(log_st_corr > 0)
-            ) - (
-                0.5 * np.sign(d_ai * np.sqrt(a.T) / dt_a + log_st_corr * d_bj * np.sqrt(b.T)
-                        / (dt_b + (1 - log_st_corr ** 2) * t)) if eta == 0 else 0
-            ) \
-            - owens_t(d_ai, owens_t_h_scalar * (d_bj / d_ai * np.sqrt(a.T * b.T) - log_st_corr * t)) \
-            - owens_t(d_bj, owens_t_h_scalar * (d_ai / d_bj * np.sqrt(a.T * b.T) - log_st_corr * t))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            owens_t_h_scalar = 1 / np.sqrt(a.T * b.T - log_st_corr ** 2 * t ** 2)
+            eta = d_bj * np.sqrt(b.T) - log_st_corr * d_ai * np.sqrt(a.T)
+
+            return (0.5 * np.sign(log_st_corr) * (
+                    np.where(np.sign(log_st_corr) * sign_plus(eta) * sign_plus(-d_ai) < 0, 1, 0)
+                    + np.where(sign_plus(-log_st_corr * eta) * sign_plus(-log_st_corr * d_bj) < 0, 1, 0)
+                    - np.where(log_st_corr > 0, 1, 0)
+                ) - np.where(eta == 0, 0.5 * np.sign(d_ai * np.sqrt(a.T) / dt_a + log_st_corr * d_bj
+                        * np.sqrt(b.T) / (dt_b + (1 - log_st_corr ** 2) * t)), 0) \
+                - owens_t(d_ai, owens_t_h_scalar * (d_bj / d_ai * np.sqrt(a.T * b.T) - log_st_corr * t)) \
+                - owens_t(d_bj, owens_t_h_scalar * (d_ai / d_bj * np.sqrt(a.T * b.T) - log_st_corr * t)))[()]
+
+    def is_kernel_supported(self, other: GBMAssetPriceDistribution = None) -> bool:
+        # @returns kernel_supported (bool): whether the formulas are delegated to the compiled option_kernel.
+        return option_kernel is not None and not self.vectorized and not (other is not None and other.vectorized)
+
+    def get_spot_time_versions(self) -> tuple[int, int]:
+        # @returns spot_time_versions (tuple[int, int]): the versions of the spot price of the underlying
+        # and of the time_stamp of the price model.
+        return self.get_spot_version(), self.price_model.get_time_version()
+
+    def get_kernel_params(self) -> tuple[float, float, float, float, float, float]:
+        """ @returns kernel_params (tuple[float, ...]): the (s0, K, log_ret_mean, log_ret_volatility,
+                r, T) arguments of the option_kernel formulas, cached until the spot price of the
+                underlying or the time is updated.
+        """
+        return self.get_derived_value("kernel_params", lambda: (float(self.s0), float(self.K),
+                float(self.log_ret_mean), float(self.log_ret_volatility), float(self.r), float(self.T)),
+                self.get_spot_time_versions())
 
     def get_d1_t(self, dt: float) -> Function:
         return (ln(self.st) - ln(self.K) + (self.r + self.log_ret_variance / 2) * dt) \
@@ -37,35 +65,101 @@ class GBMOptionPriceDistributionBase (OptionPriceDistributionBase, GBMAssetPrice
     def get_d2_t(self, dt: float) -> Function:
         return self.get_d1_t(dt) - self.log_ret_volatility * sqrt(dt)
 
-    def get_d3(self, t: float) -> float:
-        if self.log_ret_volatility == 0 or self.T == 0:
-            return np.inf
+    def get_d3(self, t: float) -> (float | np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d3 = (np.log(self.s0) - np.log(self.K) + self.log_ret_mean * t
+                    + self.r * self.get_dt(t) + self.log_ret_variance / 2 * self.T) \
+                    / (self.log_ret_volatility * np.sqrt(self.T))
 
-        return (np.log(self.s0) - np.log(self.K) + self.log_ret_mean * t
-                + self.r * self.get_dt(t) + self.log_ret_variance / 2 * self.T) \
-                / (self.log_ret_volatility * np.sqrt(self.T))
+        return np.where((self.log_ret_volatility == 0) | (self.T == 0), np.inf, d3)[()]
 
-    def get_d4(self, d3: float) -> float:
-        if np.isposinf(d3):
-            return np.inf
-        
-        return d3 - self.log_ret_volatility * np.sqrt(self.T)
+    def get_d3_d4(self, t: float) -> tuple[(float | np.ndarray), (float | np.ndarray)]:
+        # Cached until the spot price of the underlying or the time is updated.
+        def derive_d3_d4() -> tuple[(float | np.ndarray), (float | np.ndarray)]:
+            d3 = self.get_d3(t)
+            return d3, self.get_d4(d3)
 
-    def get_d5(self, d3: float, log_st_covar: float) -> float:
-        if np.isposinf(d3):
-            return np.inf
+        return self.get_derived_value(("d3_d4", t), derive_d3_d4, self.get_spot_time_versions())
 
-        return d3 + log_st_covar / (self.log_ret_volatility * np.sqrt(self.T))
+    def get_d4(self, d3: (float | np.ndarray)) -> (float | np.ndarray):
+        return np.where(np.isposinf(d3), np.inf, d3 - self.log_ret_volatility * np.sqrt(self.T))[()]
 
-    def get_d6(self, d5: float) -> float:
-        if np.isposinf(d5):
-            return np.inf
+    def get_d5(self, d3: (float | np.ndarray), log_st_covar: (float | np.ndarray)) -> (float | np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d5 = d3 + log_st_covar / (self.log_ret_volatility * np.sqrt(self.T))
 
-        return d5 - self.log_ret_volatility * np.sqrt(self.T)
+        return np.where(np.isposinf(d3), np.inf, d5)[()]
+
+    def get_d6(self, d5: (float | np.ndarray)) -> (float | np.ndarray):
+        return np.where(np.isposinf(d5), np.inf, d5 - self.log_ret_volatility * np.sqrt(self.T))[()]
 
     def get_variance(self, t: float = 1) -> float:
         return self.get_covariance(self, t)
 
+    def get_dt_values(self, st: np.ndarray, dt: (float | np.ndarray), K: (float | np.ndarray),
+        log_ret_volatility: float, log_st: np.ndarray = None, sqrt_dt: (float | np.ndarray) = None) \
+        -> np.ndarray:
+        """ Values the options at the prices @param st of the underlying (broadcast against the
+        remaining times to expiry @param dt and strike prices @param K).
+
+        @param log_ret_volatility (float): the log return volatility of the underlying.
+        @param log_st (np.ndarray, opt): the precomputed Ln(@param st).
+        @param sqrt_dt (float | np.ndarray, opt): the precomputed square root of max(@param dt, 0).
+        """
+        raise NotImplementedError()
+
+    def get_pathwise_values(self, results: PriceSimulationResults, asset_ticker: str,
+        K: (float | np.ndarray), T: (float | np.ndarray)) -> np.ndarray:
+        """ Values the options on @param asset_ticker against the simulated prices of the
+        underlying, reusing the intermediates cached by the @param results.
+
+        @param K (float | np.ndarray): the strike price(s), where arrays (n_options x 1 x 1)
+                are evaluated against the same (time_steps x paths) slab.
+        @param T (float | np.ndarray): the time(s) to expiry, broadcastable with @param K.
+
+        @returns values (np.ndarray): the option prices ([n_options x] time_steps x paths).
+        """
+        dt, sqrt_dt = results.get_times_to_expiry(T)
+
+        return self.get_dt_values(results.get_simulated_prices(asset_ticker), dt, K,
+                self.price_model.get_log_ret_volatility(asset_ticker),
+                results.get_log_simulated_prices(asset_ticker), sqrt_dt)
+
+    def get_fn_values(self, st: (float | np.ndarray), t: (float | np.ndarray) = 1) -> np.ndarray:
+        return self.get_dt_values(np.asarray(st, dtype=float), self.get_dt(t), self.K,
+                self.log_ret_volatility)
+
+    def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
+        """ @returns simulated_prices (np.ndarray): the prices (time_steps x paths) in the results
+                corresponding to the @param asset_ticker.
+        """
+        return self.get_pathwise_values(results, self.asset_ticker, self.K, self.T)
+
+    def get_option_greeks(self, t: float, option_sign: int) -> GreeksResults:
+        """ Closed-form sensitivities of the expected option price (F N(d3) - K' N(d4) for calls),
+        evaluated in the same (broadcastable) pass as the price.
+
+        @param option_sign (int): 1 for call options, -1 for put options.
+        """
+        d3, d4 = self.get_d3_d4(t)
+        sqrt_T = np.sqrt(self.T)
+        growth = np.exp(self.log_ret_mean * t)
+        discounted_strike = self.K * np.exp(-self.r * self.get_dt(t))
+        nd3 = norm.pdf(d3)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            live = (self.log_ret_volatility > 0) & (self.T > 0)
+            gamma = np.where(live, growth * nd3 / (self.s0 * self.log_ret_volatility * sqrt_T), 0)
+            time_decay = np.where(live, -self.s0 * growth * nd3 * self.log_ret_volatility / (2 * sqrt_T), 0)
+
+        return GreeksResults(
+            self.get_expectation(t),
+            option_sign * growth * norm.cdf(option_sign * d3),
+            gamma[()],
+            (self.s0 * growth * nd3 * sqrt_T)[()],
+            (time_decay - option_sign * self.r * discounted_strike * norm.cdf(option_sign * d4))[()]
+        )
+
     def get_plot_range_dist_params(self, t: float = 1) -> tuple[float, float]:
         return (GBMAssetPriceDistribution.get_expectation(self, t), np.sqrt(GBMAssetPriceDistribution
                 .get_variance(self, t)))
@@ -1,14 +1,15 @@
 import numpy as np
 
+from scipy.special import ndtr
 from scipy.stats import norm
 from sympy import exp, Function, Max
 from sympy.stats import cdf, Normal
 
-from . import GBMOptionPriceDistributionBase
+from . import GBMOptionPriceDistributionBase, option_kernel
 from .. import GBMAssetPriceDistribution
 from ....temporal_distribution import TemporalDistributionBase
+from ....price_distribution import GreeksResults
 from ....price_distribution.option import CallOptionPriceDistributionBase
-from ....price_model_interface import PriceSimulationResults
 
 class GBMCallOptionPriceDistribution (GBMOptionPriceDistributionBase, CallOptionPriceDistributionBase):
     def get_fn(self, t: float = 1) -> Function:
@@ -22,72 +23,131 @@ class GBMCallOptionPriceDistribution (GBMOptionPriceDistributionBase, CallOption
         return Max(self.st - self.K, 0)
 
     def get_expectation(self, t: float = 1, d3: float = None, d4: float = None) -> float:
+        if d3 is None and d4 is None and self.is_kernel_supported():
+            return option_kernel.get_call_expectation(*self.get_kernel_params(), t)
+
+        if d3 is None and d4 is None:   d3, d4 = self.get_d3_d4(t)
         if d3 is None:  d3 = self.get_d3(t)
         if d4 is None:  d4 = self.get_d4(d3)
 
         return self.s0 * np.exp(self.log_ret_mean * t) * norm.cdf(d3) - self.K \
                 * np.exp(-self.r * self.get_dt(t)) * norm.cdf(d4)
 
+    def get_greeks(self, t: float = 0) -> GreeksResults:
+        return self.get_option_greeks(t, 1)
+
     def get_covariance(self, other: TemporalDistributionBase, t: float = 1) -> float:        
         if not isinstance(other, GBMAssetPriceDistribution):
             # PortfolioDistribution | ReturnDistribution
             return other.get_covariance(self, t)
-        
-        log_st_covar = self.price_model.get_log_st_covar(self.asset_ticker, other.asset_ticker, t)
 
-        if log_st_covar == 0 or t == 0:
-            # Short circuit for trivial solution.
-            return 0
+        if not isinstance(other, GBMOptionPriceDistributionBase):
+            # AssetPriceDistribution
+            if self.is_kernel_supported(other):
+                return option_kernel.get_call_asset_covariance(*self.get_kernel_params(), float(other.s0),
+                        float(other.log_ret_mean), self.get_log_st_covar(other, t), t)
+
+            return self.get_asset_covariance(other, t)
+
+        if not self.is_kernel_supported(other):
+            if isinstance(other, GBMCallOptionPriceDistribution):
+                return self.get_call_option_covariance(other, t)
+
+            return self.get_put_option_covariance(other, t)
+
+        kernel_fn = option_kernel.get_call_call_covariance if isinstance(other, GBMCallOptionPriceDistribution) \
+                else option_kernel.get_call_put_covariance
+
+        return kernel_fn(*self.get_kernel_params(), *other.get_kernel_params(), self.get_log_st_covar(other, t),
+                self.get_log_st_corr(other, t), t)
+
+    # Covariance formulas (supports broadcasting over vectorized distributions)
+    def get_asset_covariance(self, other: GBMAssetPriceDistribution, t: float = 1) \
+        -> (float | np.ndarray):
+        log_st_covar = self.get_log_st_covar(other, t)
 
         dt_a = self.get_dt(t)
-        d3_a = self.get_d3(t)
-        d4_a = self.get_d4(d3_a)
+        d3_a, d4_a = self.get_d3_d4(t)
         d5_a = self.get_d5(d3_a, log_st_covar)
         d6_a = self.get_d6(d5_a)
 
         nd3_a = norm.cdf(d3_a)
         nd4_a = norm.cdf(d4_a)
 
-        if not isinstance(other, GBMOptionPriceDistributionBase):
-            # AssetPriceDistribution
-            return self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
+        # Short circuit for trivial solution (log_st_covar == 0 or t == 0).
+        return np.where(log_st_covar == 0, 0,
+                self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
                     np.exp(log_st_covar) * norm.cdf(d5_a) - nd3_a
                 ) - other.s0 * self.K * np.exp(other.log_ret_mean * t - self.r * dt_a) * (
                     norm.cdf(d6_a) - nd4_a
-                )
+                ))[()]
+
+    def get_call_option_covariance(self, other: "GBMCallOptionPriceDistribution", t: float = 1) \
+        -> (float | np.ndarray):
+        log_st_covar = self.get_log_st_covar(other, t)
+        log_st_corr = self.get_log_st_corr(other, t)
+
+        dt_a = self.get_dt(t)
+        d3_a, d4_a = self.get_d3_d4(t)
+        d5_a = self.get_d5(d3_a, log_st_covar)
+        d6_a = self.get_d6(d5_a)
+
+        nd3_a = norm.cdf(d3_a)
+        nd4_a = norm.cdf(d4_a)
 
-        log_st_corr = self.price_model.get_log_st_corr(self.asset_ticker, other.asset_ticker)
         dt_b = other.get_dt(t)
-        d3_b = other.get_d3(t)
-        d4_b = other.get_d4(d3_b)
+        d3_b, d4_b = other.get_d3_d4(t)
         d5_b = other.get_d5(d3_b, log_st_covar)
         d6_b = other.get_d6(d5_b)
 
         nd3_b = norm.cdf(d3_b)
         nd4_b = norm.cdf(d4_b)
 
-        if isinstance(other, GBMCallOptionPriceDistribution):
-            return self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
-                        np.exp(log_st_covar) * (
-                            0.5 * (norm.cdf(d5_a) + norm.cdf(d5_b))
-                            + GBMOptionPriceDistributionBase.H(self, other, d5_a, d5_b, log_st_corr, t)
-                        ) - nd3_a * nd3_a
-                    ) - self.K * other.s0 * np.exp(other.log_ret_mean * t - self.r * dt_a) * (
-                        0.5 * (nd3_b + norm.cdf(d6_a))
-                        + GBMOptionPriceDistributionBase.H(other, self, d3_b, d6_a, log_st_corr, t)
-                        - nd4_a * nd3_b
-                    ) - other.K * self.s0 * np.exp(self.log_ret_mean * t - other.r * dt_b) * (
-                        0.5 * (nd3_a + norm.cdf(d6_b))
-                        + GBMOptionPriceDistributionBase.H(self, other, d3_a, d6_b, log_st_corr, t)
-                        - nd3_a * nd4_b
-                    ) + self.K * other.K * np.exp(-(self.r * dt_a + other.r * dt_b)) * (
+        # Short circuit for trivial solution (log_st_covar == 0 or t == 0).
+        return np.where(log_st_covar == 0, 0,
+                self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
+                    np.exp(log_st_covar) * (
+                        0.5 * (norm.cdf(d5_a) + norm.cdf(d5_b))
+                        + GBMOptionPriceDistributionBase.H(self, other, d5_a, d5_b, log_st_corr, t)
+                    ) - nd3_a * nd3_b
+                ) - self.K * other.s0 * np.exp(other.log_ret_mean * t - self.r * dt_a) * (
+                    0.5 * (nd3_b + norm.cdf(d6_a))
+                    + GBMOptionPriceDistributionBase.H(other, self, d3_b, d6_a, log_st_corr, t)
+                    - nd4_a * nd3_b
+                ) - other.K * self.s0 * np.exp(self.log_ret_mean * t - other.r * dt_b) * (
+                    0.5 * (nd3_a + norm.cdf(d6_b))
+                    + GBMOptionPriceDistributionBase.H(self, other, d3_a, d6_b, log_st_corr, t)
+                    - nd3_a * nd4_b
+                ) + self.K * other.K * np.exp(-(self.r * dt_a + other.r * dt_b)) * (
                     0.5 * (nd4_a + nd4_b)
                     + GBMOptionPriceDistributionBase.H(self, other, d4_a, d4_b, log_st_corr, t)
                     - nd4_a * nd4_b
-                )
+                ))[()]
+
+    def get_put_option_covariance(self, other: GBMOptionPriceDistributionBase, t: float = 1) \
+        -> (float | np.ndarray):
+        log_st_covar = self.get_log_st_covar(other, t)
+        log_st_corr = self.get_log_st_corr(other, t)
+
+        dt_a = self.get_dt(t)
+        d3_a, d4_a = self.get_d3_d4(t)
+        d5_a = self.get_d5(d3_a, log_st_covar)
+        d6_a = self.get_d6(d5_a)
+
+        nd3_a = norm.cdf(d3_a)
+        nd4_a = norm.cdf(d4_a)
+
+        dt_b = other.get_dt(t)
+        d3_b, d4_b = other.get_d3_d4(t)
+        d5_b = other.get_d5(d3_b, log_st_covar)
+        d6_b = other.get_d6(d5_b)
+
+        nd3_b = norm.cdf(d3_b)
+        nd4_b = norm.cdf(d4_b)
 
-        # PutOptionPriceDistribution
-        return self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
+        # Short circuit for trivial solution (log_st_covar == 0 or t == 0).
+        return np.where(log_st_covar == 0, 0,
+                self.s0 * other.s0 * np.exp((self.log_ret_mean + other.log_ret_mean) * t) * (
                     np.exp(log_st_covar) * (
                         0.5 * (norm.cdf(d5_b) - norm.cdf(d5_a))
                         + GBMOptionPriceDistributionBase.H(self, other, d5_a, d5_b, log_st_corr, t)
@@ -104,36 +164,59 @@ class GBMCallOptionPriceDistribution (GBMOptionPriceDistributionBase, CallOption
                     0.5 * (nd4_a + nd4_b)
                     + GBMOptionPriceDistributionBase.H(self, other, d4_a, d4_b, log_st_corr, t)
                     - nd4_a * nd4_b
-                )
-
-    def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
-        """ @returns simulated_prices (np.ndarray): the prices (time_steps x paths) in the results
-                corresponding to the @param asset_ticker.
-        """
-        st: np.ndarray = results.get_simulated_prices(self.asset_ticker)
-
-        # Generating stepwise dt
-        dt = np.full(st.shape, - results.t, dtype=float)
-        dt = np.cumsum(dt, axis=0)
-        dt += (self.T + results.t)
-        
-        ct = np.empty(st.shape)
-        dt_mask = dt > 0
-        
-        if self.log_ret_volatility > 0:
-            d1_t = (np.log(st[dt_mask]) - np.log(self.K) + (self.r + self.log_ret_variance / 2) \
-                    * dt[dt_mask]) / (self.log_ret_volatility * np.sqrt(dt[dt_mask]))
+                ))[()]
 
-            d2_t = d1_t - self.log_ret_volatility * np.sqrt(dt[dt_mask])
+    def get_dt_values(self, st: np.ndarray, dt: (float | np.ndarray), K: (float | np.ndarray),
+        log_ret_volatility: float, log_st: np.ndarray = None, sqrt_dt: (float | np.ndarray) = None) \
+        -> np.ndarray:
+        if log_st is None:  log_st = np.log(st)
+        if sqrt_dt is None: sqrt_dt = np.sqrt(np.maximum(dt, 0))
 
-            ct[dt_mask] = st[dt_mask] * norm.cdf(d1_t) - self.K * np.exp(- self.r * dt[dt_mask]) \
-                    * norm.cdf(d2_t)
-        else:
-            ct[dt_mask] = st[dt_mask] - self.K * np.exp(- self.r * dt[dt_mask])
-        
-        ct[dt <= 0] = np.maximum(st[dt <= 0] - self.K, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if log_ret_volatility > 0:
+                d1_t = (log_st - np.log(K) + (self.r + log_ret_volatility ** 2 / 2) * dt) \
+                        / (log_ret_volatility * sqrt_dt)
+
+                ct = st * ndtr(d1_t) - K * np.exp(- self.r * dt) * ndtr(d1_t - log_ret_volatility \
+                        * sqrt_dt)
+            else:
+                ct = st - K * np.exp(- self.r * dt)
 
-        return ct
+        return np.where(dt > 0, ct, np.maximum(st - K, 0))
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    # Parity of the compiled option_kernel (scalar distributions) against the numpy formulas (the
+    # vectorized chain distributions, which never delegate to the kernel) over a grid of contracts.
+    from itertools import product
+    from ... import GBMPriceModel
+
+    assert option_kernel is not None, "option_kernel is not built (python setup.py build_ext --inplace)."
+
+    price_model = GBMPriceModel(["A", "B"], [100, 50], [.03, .05], np.array([[.04, .012], [.012, .09]]), .02,
+            time_stamp=1, log_ret_values=True)
+    contracts = [(asset_ticker, spot_price * moneyness, T) for (asset_ticker, spot_price), moneyness, T
+            in product([("A", 100), ("B", 50)], [.8, 1, 1.2], [.25, 1])]
+    asset_tickers, strike_prices, times_to_expiry = zip(*contracts)
+
+    scalar_dists = [
+        [price_model.get_call_option_price_dist(*contract) for contract in contracts],
+        [price_model.get_put_option_price_dist(*contract) for contract in contracts],
+        [price_model.get_asset_price_dist("A"), price_model.get_asset_price_dist("B")]
+    ]
+    chain_dists = [
+        price_model.get_call_option_chain_price_dist(asset_tickers, strike_prices, times_to_expiry),
+        price_model.get_put_option_chain_price_dist(asset_tickers, strike_prices, times_to_expiry),
+        price_model.get_asset_chain_price_dist(["A", "B"])
+    ]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Covers t < T, t == T and t > T (undefined covariances are NaN in both).
+        for t in [0, .1, .25, .5, 1, 1.5]:
+            for dists, chain_dist in zip(scalar_dists[:2], chain_dists[:2]):
+                assert np.allclose([dist.get_expectation(t) for dist in dists], chain_dist.get_expectation(t),
+                        rtol=1e-12, atol=1e-12)
+
+                for other_dists, other_chain_dist in zip(scalar_dists, chain_dists):
+                    assert np.allclose([[dist.get_covariance(other, t) for other in other_dists] for dist in dists],
+                            chain_dist.reshape((-1, 1)).get_covariance(other_chain_dist.reshape((1, -1)), t),
+                            rtol=1e-9, atol=1e-10, equal_nan=True)
@@ -0,0 +1,37 @@
+# Normal distribution
+cpdef double norm_cdf(double x)
+cpdef double owens_t(double h, double a)
+cdef double owens_t_quadrature(double h, double a)
+
+# Distribution parameters
+cpdef double get_d3(double s0, double K, double log_ret_mean, double log_ret_volatility, double r,
+        double T, double t)
+cpdef double get_d4(double d3, double log_ret_volatility, double T)
+cpdef double get_d5(double d3, double log_st_covar, double log_ret_volatility, double T)
+cpdef double H(double d_ai, double d_bj, double log_st_corr, double T_a, double T_b, double t)
+
+# Expectations
+cpdef double get_call_expectation(double s0, double K, double log_ret_mean, double log_ret_volatility,
+        double r, double T, double t)
+cpdef double get_put_expectation(double s0, double K, double log_ret_mean, double log_ret_volatility,
+        double r, double T, double t)
+
+# Covariances
+cpdef double get_call_asset_covariance(double s0_a, double K_a, double log_ret_mean_a,
+        double log_ret_volatility_a, double r_a, double T_a, double s0_b, double log_ret_mean_b,
+        double log_st_covar, double t)
+cpdef double get_put_asset_covariance(double s0_a, double K_a, double log_ret_mean_a,
+        double log_ret_volatility_a, double r_a, double T_a, double s0_b, double log_ret_mean_b,
+        double log_st_covar, double t)
+cpdef double get_call_call_covariance(double s0_a, double K_a, double log_ret_mean_a,
+        double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+        double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+        double log_st_covar, double log_st_corr, double t)
+cpdef double get_call_put_covariance(double s0_a, double K_a, double log_ret_mean_a,
+        double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+        double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+        double log_st_covar, double log_st_corr, double t)
+cpdef double get_put_put_covariance(double s0_a, double K_a, double log_ret_mean_a,
+        double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+        double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+        double log_st_covar, double log_st_corr, double t)
@@ -0,0 +1,264 @@
+# cython: cdivision=True
+# Scalar kernels of the GBM option moment and covariance formulas, evaluated without the array
+# overhead of the (broadcasting) formulas in GBMCallOptionPriceDistribution and
+# GBMPutOptionPriceDistribution. IEEE semantics (cdivision) match the numpy formulas at the
+# degenerate parameters (zero volatility, expired options).
+import numpy as np
+
+from libc.math cimport erfc, exp, log, sqrt, fabs, isinf, isnan, INFINITY, NAN, M_PI, M_SQRT1_2
+
+# Gauss-Legendre quadrature (20 points) mapped onto [0, 1].
+cdef double[20] GL_NODES
+cdef double[20] GL_WEIGHTS
+
+for i, (node, weight) in enumerate(zip(*np.polynomial.legendre.leggauss(20))):
+    GL_NODES[i] = (node + 1) / 2
+    GL_WEIGHTS[i] = weight / 2
+
+# Normal distribution
+cpdef double norm_cdf(double x):
+    return 0.5 * erfc(-x * M_SQRT1_2)
+
+cdef double norm_sf(double x):
+    return 0.5 * erfc(x * M_SQRT1_2)
+
+cpdef double owens_t(double h, double a):
+    """ Owen's T function T(h, a) = 1 / (2 pi) * int_0^a exp(-h^2 (1 + x^2) / 2) / (1 + x^2) dx,
+    by quadrature for |a| <= 1 and the reflection T(h, a) + T(ah, 1 / a) = (Q(h) + Q(ah)) / 2
+    - Q(h) Q(ah) (for h, a >= 0, where Q is the normal survival function) otherwise.
+    """
+    cdef double ah
+
+    if isnan(h) or isnan(a):
+        return NAN
+
+    if a < 0:
+        return -owens_t(h, -a)
+
+    h = fabs(h)
+
+    if isinf(h):
+        return 0
+
+    if isinf(a):
+        return 0.5 * norm_sf(h)
+
+    if a <= 1:
+        return owens_t_quadrature(h, a)
+
+    ah = a * h
+    return 0.5 * (norm_sf(h) + norm_sf(ah)) - norm_sf(h) * norm_sf(ah) - owens_t_quadrature(ah, 1 / a)
+
+cdef double owens_t_quadrature(double h, double a):
+    # @returns owens_t (float): T(@param h, @param a) for 0 <= @param a <= 1.
+    cdef double total = 0
+    cdef double x_sq
+    cdef int i
+
+    for i in range(20):
+        x_sq = (a * GL_NODES[i]) ** 2
+        total += GL_WEIGHTS[i] * exp(-0.5 * h * h * (1 + x_sq)) / (1 + x_sq)
+
+    return total * a / (2 * M_PI)
+
+cdef double sign(double v):
+    if v > 0:
+        return 1
+    if v < 0:
+        return -1
+
+    return v # Signed zero | NaN
+
+cdef double sign_plus(double v):
+    return -1 if v < 0 else 1
+
+# Distribution parameters
+cpdef double get_d3(double s0, double K, double log_ret_mean, double log_ret_volatility, double r,
+    double T, double t):
+    if log_ret_volatility == 0 or T == 0:
+        return INFINITY
+
+    return (log(s0) - log(K) + log_ret_mean * t + r * (T - t) + log_ret_volatility
+            * log_ret_volatility / 2 * T) / (log_ret_volatility * sqrt(T))
+
+cpdef double get_d4(double d3, double log_ret_volatility, double T):
+    # Also derives d6 from d5.
+    if d3 == INFINITY:
+        return INFINITY
+
+    return d3 - log_ret_volatility * sqrt(T)
+
+cpdef double get_d5(double d3, double log_st_covar, double log_ret_volatility, double T):
+    if d3 == INFINITY:
+        return INFINITY
+
+    return d3 + log_st_covar / (log_ret_volatility * sqrt(T))
+
+cpdef double H(double d_ai, double d_bj, double log_st_corr, double T_a, double T_b, double t):
+    # See @method GBMOptionPriceDistributionBase.H.
+    cdef double sqrt_T_a = sqrt(T_a)
+    cdef double sqrt_T_b = sqrt(T_b)
+    cdef double sqrt_T_ab = sqrt(T_a * T_b)
+    cdef double owens_t_h_scalar = 1 / sqrt(T_a * T_b - log_st_corr * log_st_corr * t * t)
+    cdef double eta = d_bj * sqrt_T_b - log_st_corr * d_ai * sqrt_T_a
+    cdef double corr_sign = sign(log_st_corr)
+    cdef double value
+
+    value = 0.5 * corr_sign * (
+        (1 if corr_sign * sign_plus(eta) * sign_plus(-d_ai) < 0 else 0)
+        + (1 if sign_plus(-log_st_corr * eta) * sign_plus(-log_st_corr * d_bj) < 0 else 0)
+        - (1 if log_st_corr > 0 else 0)
+    )
+
+    if eta == 0:
+        value -= 0.5 * sign(d_ai * sqrt_T_a / (T_a - t) + log_st_corr * d_bj * sqrt_T_b
+                / (T_b - t + (1 - log_st_corr * log_st_corr) * t))
+
+    return value - owens_t(d_ai, owens_t_h_scalar * (d_bj / d_ai * sqrt_T_ab - log_st_corr * t)) \
+            - owens_t(d_bj, owens_t_h_scalar * (d_ai / d_bj * sqrt_T_ab - log_st_corr * t))
+
+# Expectations
+cpdef double get_call_expectation(double s0, double K, double log_ret_mean, double log_ret_volatility,
+    double r, double T, double t):
+    cdef double d3 = get_d3(s0, K, log_ret_mean, log_ret_volatility, r, T, t)
+    cdef double d4 = get_d4(d3, log_ret_volatility, T)
+
+    return s0 * exp(log_ret_mean * t) * norm_cdf(d3) - K * exp(-r * (T - t)) * norm_cdf(d4)
+
+cpdef double get_put_expectation(double s0, double K, double log_ret_mean, double log_ret_volatility,
+    double r, double T, double t):
+    cdef double d3 = get_d3(s0, K, log_ret_mean, log_ret_volatility, r, T, t)
+    cdef double d4 = get_d4(d3, log_ret_volatility, T)
+
+    return K * exp(-r * (T - t)) * norm_sf(d4) - s0 * exp(log_ret_mean * t) * norm_sf(d3)
+
+# Covariances (short circuits for the trivial solution log_st_covar == 0 or t == 0)
+cpdef double get_call_asset_covariance(double s0_a, double K_a, double log_ret_mean_a,
+    double log_ret_volatility_a, double r_a, double T_a, double s0_b, double log_ret_mean_b,
+    double log_st_covar, double t):
+    if log_st_covar == 0:
+        return 0
+
+    cdef double d3_a = get_d3(s0_a, K_a, log_ret_mean_a, log_ret_volatility_a, r_a, T_a, t)
+    cdef double d4_a = get_d4(d3_a, log_ret_volatility_a, T_a)
+    cdef double d5_a = get_d5(d3_a, log_st_covar, log_ret_volatility_a, T_a)
+    cdef double d6_a = get_d4(d5_a, log_ret_volatility_a, T_a)
+
+    return s0_a * s0_b * exp((log_ret_mean_a + log_ret_mean_b) * t) * (
+        exp(log_st_covar) * norm_cdf(d5_a) - norm_cdf(d3_a)
+    ) - s0_b * K_a * exp(log_ret_mean_b * t - r_a * (T_a - t)) * (norm_cdf(d6_a) - norm_cdf(d4_a))
+
+cpdef double get_put_asset_covariance(double s0_a, double K_a, double log_ret_mean_a,
+    double log_ret_volatility_a, double r_a, double T_a, double s0_b, double log_ret_mean_b,
+    double log_st_covar, double t):
+    if log_st_covar == 0:
+        return 0
+
+    cdef double d3_a = get_d3(s0_a, K_a, log_ret_mean_a, log_ret_volatility_a, r_a, T_a, t)
+    cdef double d4_a = get_d4(d3_a, log_ret_volatility_a, T_a)
+    cdef double d5_a = get_d5(d3_a, log_st_covar, log_ret_volatility_a, T_a)
+    cdef double d6_a = get_d4(d5_a, log_ret_volatility_a, T_a)
+
+    return s0_a * s0_b * exp((log_ret_mean_a + log_ret_mean_b) * t) * (
+        norm_sf(d3_a) - exp(log_st_covar) * norm_sf(d5_a)
+    ) - s0_b * K_a * exp(log_ret_mean_b * t - r_a * (T_a - t)) * (norm_cdf(d6_a) - norm_cdf(d4_a))
+
+cpdef double get_call_call_covariance(double s0_a, double K_a, double log_ret_mean_a,
+    double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+    double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+    double log_st_covar, double log_st_corr, double t):
+    if log_st_covar == 0:
+        return 0
+
+    cdef double d3_a = get_d3(s0_a, K_a, log_ret_mean_a, log_ret_volatility_a, r_a, T_a, t)
+    cdef double d4_a = get_d4(d3_a, log_ret_volatility_a, T_a)
+    cdef double d5_a = get_d5(d3_a, log_st_covar, log_ret_volatility_a, T_a)
+    cdef double d6_a = get_d4(d5_a, log_ret_volatility_a, T_a)
+    cdef double nd3_a = norm_cdf(d3_a)
+    cdef double nd4_a = norm_cdf(d4_a)
+
+    cdef double d3_b = get_d3(s0_b, K_b, log_ret_mean_b, log_ret_volatility_b, r_b, T_b, t)
+    cdef double d4_b = get_d4(d3_b, log_ret_volatility_b, T_b)
+    cdef double d5_b = get_d5(d3_b, log_st_covar, log_ret_volatility_b, T_b)
+    cdef double d6_b = get_d4(d5_b, log_ret_volatility_b, T_b)
+    cdef double nd3_b = norm_cdf(d3_b)
+    cdef double nd4_b = norm_cdf(d4_b)
+
+    return s0_a * s0_b * exp((log_ret_mean_a + log_ret_mean_b) * t) * (
+        exp(log_st_covar) * (
+            0.5 * (norm_cdf(d5_a) + norm_cdf(d5_b)) + H(d5_a, d5_b, log_st_corr, T_a, T_b, t)
+        ) - nd3_a * nd3_b
+    ) - K_a * s0_b * exp(log_ret_mean_b * t - r_a * (T_a - t)) * (
+        0.5 * (nd3_b + norm_cdf(d6_a)) + H(d3_b, d6_a, log_st_corr, T_b, T_a, t) - nd4_a * nd3_b
+    ) - K_b * s0_a * exp(log_ret_mean_a * t - r_b * (T_b - t)) * (
+        0.5 * (nd3_a + norm_cdf(d6_b)) + H(d3_a, d6_b, log_st_corr, T_a, T_b, t) - nd3_a * nd4_b
+    ) + K_a * K_b * exp(-(r_a * (T_a - t) + r_b * (T_b - t))) * (
+        0.5 * (nd4_a + nd4_b) + H(d4_a, d4_b, log_st_corr, T_a, T_b, t) - nd4_a * nd4_b
+    )
+
+cpdef double get_call_put_covariance(double s0_a, double K_a, double log_ret_mean_a,
+    double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+    double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+    double log_st_covar, double log_st_corr, double t):
+    # The call (a) against the put (b).
+    if log_st_covar == 0:
+        return 0
+
+    cdef double d3_a = get_d3(s0_a, K_a, log_ret_mean_a, log_ret_volatility_a, r_a, T_a, t)
+    cdef double d4_a = get_d4(d3_a, log_ret_volatility_a, T_a)
+    cdef double d5_a = get_d5(d3_a, log_st_covar, log_ret_volatility_a, T_a)
+    cdef double d6_a = get_d4(d5_a, log_ret_volatility_a, T_a)
+    cdef double nd3_a = norm_cdf(d3_a)
+    cdef double nd4_a = norm_cdf(d4_a)
+
+    cdef double d3_b = get_d3(s0_b, K_b, log_ret_mean_b, log_ret_volatility_b, r_b, T_b, t)
+    cdef double d4_b = get_d4(d3_b, log_ret_volatility_b, T_b)
+    cdef double d5_b = get_d5(d3_b, log_st_covar, log_ret_volatility_b, T_b)
+    cdef double d6_b = get_d4(d5_b, log_ret_volatility_b, T_b)
+    cdef double nd3_b = norm_cdf(d3_b)
+    cdef double nd4_b = norm_cdf(d4_b)
+
+    return s0_a * s0_b * exp((log_ret_mean_a + log_ret_mean_b) * t) * (
+        exp(log_st_covar) * (
+            0.5 * (norm_cdf(d5_b) - norm_cdf(d5_a)) + H(d5_a, d5_b, log_st_corr, T_a, T_b, t)
+        ) + nd3_a * (1 - nd3_b)
+    ) - K_a * s0_b * exp(log_ret_mean_b * t - r_a * (T_a - t)) * (
+        0.5 * (nd3_b - norm_cdf(d6_a)) + H(d3_b, d6_a, log_st_corr, T_b, T_a, t) + nd4_a * (1 - nd3_b)
+    ) - K_b * s0_a * exp(log_ret_mean_a * t - r_b * (T_b - t)) * (
+        0.5 * (nd3_a + norm_cdf(d6_b)) + H(d3_a, d6_b, log_st_corr, T_a, T_b, t) - nd3_a * nd4_b
+    ) + K_a * K_b * exp(-(r_a * (T_a - t) + r_b * (T_b - t))) * (
+        0.5 * (nd4_a + nd4_b) + H(d4_a, d4_b, log_st_corr, T_a, T_b, t) - nd4_a * nd4_b
+    )
+
+cpdef double get_put_put_covariance(double s0_a, double K_a, double log_ret_mean_a,
+    double log_ret_volatility_a, double r_a, double T_a, double s0_b, double K_b,
+    double log_ret_mean_b, double log_ret_volatility_b, double r_b, double T_b,
+    double log_st_covar, double log_st_corr, double t):
+    if log_st_covar == 0:
+        return 0
+
+    cdef double d3_a = get_d3(s0_a, K_a, log_ret_mean_a, log_ret_volatility_a, r_a, T_a, t)
+    cdef double d4_a = get_d4(d3_a, log_ret_volatility_a, T_a)
+    cdef double d5_a = get_d5(d3_a, log_st_covar, log_ret_volatility_a, T_a)
+    cdef double d6_a = get_d4(d5_a, log_ret_volatility_a, T_a)
+    cdef double nd3_a = norm_cdf(d3_a)
+    cdef double nd4_a = norm_cdf(d4_a)
+
+    cdef double d3_b = get_d3(s0_b, K_b, log_ret_mean_b, log_ret_volatility_b, r_b, T_b, t)
+    cdef double d4_b = get_d4(d3_b, log_ret_volatility_b, T_b)
+    cdef double d5_b = get_d5(d3_b, log_st_covar, log_ret_volatility_b, T_b)
+    cdef double d6_b = get_d4(d5_b, log_ret_volatility_b, T_b)
+    cdef double nd3_b = norm_cdf(d3_b)
+    cdef double nd4_b = norm_cdf(d4_b)
+
+    return s0_a * s0_b * exp((log_ret_mean_a + log_ret_mean_b) * t) * (
+        exp(log_st_covar) * (
+            0.5 * (norm_sf(d5_a) + norm_sf(d5_b)) + H(d5_a, d5_b, log_st_corr, T_a, T_b, t)
+        ) - (1 - nd3_a) * (1 - nd3_b)
+    ) - K_a * s0_b * exp(log_ret_mean_b * t - r_a * (T_a - t)) * (
+        0.5 * (nd3_b - norm_cdf(d6_a)) + H(d3_b, d6_a, log_st_corr, T_b, T_a, t) + nd4_a * (1 - nd3_b)
+    ) - K_b * s0_a * exp(log_ret_mean_a * t - r_b * (T_b - t)) * (
+        0.5 * (nd3_a - norm_cdf(d6_b)) + H(d3_a, d6_b, log_st_corr, T_a, T_b, t) + (1 - nd3_a) * nd4_b
+    ) + K_a * K_b * exp(-(r_a * (T_a - t) + r_b * (T_b - t))) * (
+        0.5 * (nd4_a + nd4_b) + H(d4_a, d4_b, log_st_corr, T_a, T_b, t) - nd4_a * nd4_b
+    )
@@ -1,9 +1,27 @@
 import numpy as np
 
+from collections.abc import Callable, Hashable
+from typing import Any
 from sympy import Function, Symbol
 from ..temporal_distribution import AssetTemporalDistributionBase, PortfolioTemporalDistributionBase
 from ..price_model_interface import PriceModelInterface, PriceSimulationResults
 
+class GreeksResults:
+    def __init__(self, value: (float | np.ndarray), delta: (float | np.ndarray), gamma: (float | np.ndarray),
+        vega: (float | np.ndarray), theta: (float | np.ndarray)) -> None:
+        """ Container for sensitivities generated from @method AssetPriceDistributionBase.get_greeks
+        @param value (float | np.ndarray): the expected price.
+        @param delta (float | np.ndarray): the sensitivity to the spot price of the underlying.
+        @param gamma (float | np.ndarray): the sensitivity of delta to the spot price of the underlying.
+        @param vega (float | np.ndarray): the sensitivity to the log return volatility of the underlying.
+        @param theta (float | np.ndarray): the sensitivity to the passage of time (per base_unit_of_time).
+        """
+        self.value = value
+        self.delta = delta
+        self.gamma = gamma
+        self.vega = vega
+        self.theta = theta
+
 class PriceDistributionInterface:
     def __init__(self, price_model: PriceModelInterface) -> None:
         """
@@ -11,11 +29,34 @@ class PriceDistributionInterface:
         @param ticker (str): the identifying ticker, generates an UUID by default.
         """
         self.price_model = price_model
+        # Values derived from the price model inputs {key: (versions, derived_value)}, valid for the
+        # versions of the inputs they were derived from.
+        self._derived_values: dict[Hashable, tuple[Hashable, Any]] = dict()
 
     @property
     def r(self) -> float:
         return self.price_model.get_risk_free_rate()
 
+    def get_derived_value(self, key: Hashable, derive_fn: Callable[[], Any], versions: Hashable = None) -> Any:
+        """ @returns derived_value (Any): the cached value of @param derive_fn, recomputed once the
+                @param versions of its inputs change (or where @param key is not hashable).
+
+        @param versions (Hashable, opt): the versions of the price model inputs read by @param derive_fn,
+                defaults to the price model version (invalidated by every update).
+        """
+        if versions is None:
+            versions = self.price_model.version
+
+        try:
+            versions_value = self._derived_values.get(key)
+        except TypeError: # Unhashable key (e.g. array of time steps)
+            return derive_fn()
+
+        if versions_value is None or versions_value[0] != versions:
+            versions_value = self._derived_values[key] = (versions, derive_fn())
+
+        return versions_value[1]
+
 class AssetPriceDistributionBase (AssetTemporalDistributionBase, PriceDistributionInterface):
     def __init__(self, price_model: PriceModelInterface, ticker: str = None) -> None:
         """
@@ -33,18 +74,40 @@ class AssetPriceDistributionBase (AssetTemporalDistributionBase, PriceDistributi
     def st(self) -> Symbol:
         return Symbol(self.asset_ticker)
 
+    def get_spot_version(self) -> int:
+        # @returns spot_version (int): the version of the spot price of the underlying.
+        return self.price_model.get_spot_version(self.asset_ticker)
+
+    @property
+    def leg_key(self) -> Hashable:
+        # Identifies the distribution by its parameters, such that equivalent legs share the
+        # covariances cached by the price model.
+        return (type(self), self.asset_ticker)
+
     def get_fn(self, t: float = 1) -> Function:
         return self.st
 
     def get_density_fn(self, t: float = 1) -> Function:
         return self.price_model.get_asset_density_fn(self.asset_ticker, t)
 
+    def get_density(self, st: (float | np.ndarray), t: float = 1) -> (float | np.ndarray):
+        return self.price_model.get_asset_density(self.asset_ticker, st, t)
+
+    def get_fn_values(self, st: (float | np.ndarray), t: (float | np.ndarray) = 1) -> np.ndarray:
+        return np.broadcast_to(np.asarray(st, dtype=float), np.broadcast_shapes(np.shape(st), np.shape(t)))
+
     def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
         """ @returns simulated_prices (np.ndarray): the prices (time_steps x paths) in the results
                 corresponding to the @param asset_ticker.
         """
         return results.get_simulated_prices(self.asset_ticker)
 
+    def get_greeks(self, t: float = 0) -> GreeksResults:
+        """ @returns greeks (GreeksResults): the sensitivities of the expected price at the time
+                step @param t, where t = 0 yields the sensitivities of the current price.
+        """
+        raise NotImplementedError()
+
     def get_plot_xvar(self) -> Symbol:
         return self.st
 
@@ -69,11 +132,47 @@ class PortfolioPriceDistribution (PortfolioTemporalDistributionBase, PriceDistri
     def get_dist_weight(self, ticker: str) -> float:
         return self.ticker_to_sizes[ticker]
 
+    @property
+    def asset_tickers(self) -> list[str]:
+        # The (unique) underlying asset tickers, ordered by insertion.
+        return list(dict.fromkeys(dist.asset_ticker for dist in self.ticker_to_dists.values()))
+
     def get_density_fn(self, t: float = 1) -> Function:
         return self.price_model.get_joint_density_fn(
             { dist.asset_ticker for dist in self.ticker_to_dists.values() }, t
         )
 
+    def get_density(self, st: np.ndarray, t: float = 1) -> (float | np.ndarray):
+        # @param st (np.ndarray): the prices (... x m_assets) ordered as the asset_tickers.
+        return self.price_model.get_joint_density(self.asset_tickers, st, t)
+
+    def get_dist_covariance(self, dist_a: AssetPriceDistributionBase, dist_b: AssetTemporalDistributionBase,
+        t: float = 1) -> float:
+        if isinstance(dist_b, AssetPriceDistributionBase) and dist_b.price_model is self.price_model:
+            return self.price_model.get_covariance(dist_a, dist_b, t)
+
+        return dist_a.get_covariance(dist_b, t)
+
+    def get_covar_mat(self, t: float = 1) -> np.ndarray:
+        return self.price_model.get_covar_mat(list(self.ticker_to_dists.values()), t)
+
+    def get_greeks(self, t: float = 0) -> dict[str, GreeksResults]:
+        """ @returns asset_ticker_to_greeks (dict[str, GreeksResults]): the sensitivities of the
+                portfolio aggregated (size-weighted) by underlying asset.
+        """
+        dists = list(self.ticker_to_dists.values())
+        leg_greeks = self.price_model.get_greeks(dists, t)
+        weight_vect = self.get_weight_vect()
+        asset_tickers = np.array([dist.asset_ticker for dist in dists], dtype=object)
+
+        return {
+            asset_ticker: GreeksResults(*(
+                weight_vect[asset_tickers == asset_ticker] @ greek[asset_tickers == asset_ticker]
+                for greek in (leg_greeks.value, leg_greeks.delta, leg_greeks.gamma, leg_greeks.vega,
+                        leg_greeks.theta)
+            )) for asset_ticker in self.asset_tickers
+        }
+
     def get_plot_fn_label(self) -> str:
         return f"portfolio_price"
 
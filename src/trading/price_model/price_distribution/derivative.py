@@ -1,5 +1,6 @@
 import numpy as np
 
+from collections.abc import Hashable
 from sympy import Function
 from . import AssetPriceDistributionBase
 from ..price_model_interface import PriceModelInterface, PriceSimulationResults
@@ -12,6 +13,8 @@ class DerivativePriceDistributionBase (AssetPriceDistributionBase):
         self._asset_ticker = asset_ticker
         self.time_to_expiry = time_to_expiry
         self.settlement_ticker = settlement_ticker
+        # The model time_stamp from which time_to_expiry is measured.
+        self.time_stamp = getattr(price_model, "time_stamp", None)
 
     @property
     def asset_ticker(self) -> str:
@@ -19,7 +22,17 @@ class DerivativePriceDistributionBase (AssetPriceDistributionBase):
 
     @property
     def T(self) -> (float | None):
-        return self.time_to_expiry
+        # The time_to_expiry, decayed by the time elapsed since the distribution was generated.
+        if self.time_to_expiry is None or self.time_stamp is None:
+            return self.time_to_expiry
+
+        return self.get_derived_value("T", lambda: np.maximum(self.time_to_expiry
+                - self.price_model.get_elapsed_time(self.time_stamp), 0)[()],
+                self.price_model.get_time_version())
+
+    @property
+    def leg_key(self) -> Hashable:
+        return (type(self), self.asset_ticker, self.T)
 
     def get_dt(self, t: float) -> float:
         # Raises exception where time_to_expiry is not defined.
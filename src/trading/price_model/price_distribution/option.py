@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from .derivative import DerivativePriceDistributionBase
 from ..price_model_interface import PriceModelInterface
 
@@ -14,6 +15,10 @@ class OptionPriceDistributionBase (DerivativePriceDistributionBase):
     def K(self) -> float:
         return self.strike_price
 
+    @property
+    def leg_key(self) -> Hashable:
+        return DerivativePriceDistributionBase.leg_key.fget(self) + (self.K,)
+
 class CallOptionPriceDistributionBase (OptionPriceDistributionBase):
     pass
 
@@ -1,17 +1,45 @@
+import json
 import numpy as np
 
+from collections.abc import Iterable, Iterator
 from sympy import Function
 
+# Sampling methods supported by @method PriceModelInterface.simulate_prices
+SAMPLING_METHODS = ("pseudo", "antithetic", "sobol", "halton")
+
 class PriceSimulationResults:
-    def __init__(self, tickers_to_index: dict[str, int], results: np.ndarray, t: float) -> None:
+    def __init__(self, tickers_to_index: dict[str, int], results: np.ndarray, t: float,
+        sampling: str = "pseudo", times: Iterable[float] = None) -> None:
         """ Container for asset prices generated from @method PriceModelInterface.simulate_prices
         @param asset_tickers (dict[str, int]): the mapping of asset asset_tickers to index.
         @param results (np.ndarray): the generated prices (m_assets x time_steps x paths).
-        @param t (float): the size of the time step.
+        @param t (float): the size of the time step (None where the time steps are not uniform).
+        @param sampling (str, opt): the sampling method (SAMPLING_METHODS) used to generate
+                the results.
+                pseudo:     independent pseudo-random paths.
+                antithetic: path i is paired with the mirrored path i + ceil(paths / 2).
+                sobol, halton: randomized quasi-Monte Carlo paths.
+        @param times (Iterable[float], opt): the observation time of each time step (starting from
+                zero), defaults to the uniform steps of size @param t.
         """
         self.asset_tickers: dict[str, int] = tickers_to_index
         self.results: np.ndarray = results
         self.t = t
+        self.sampling = sampling
+        self.times: np.ndarray = np.arange(results.shape[1], dtype=float) * t if times is None \
+                else np.array(times, dtype=float)
+
+        assert self.times.size == results.shape[1]
+
+        # Pathwise valuation intermediates shared across the distributions valued against
+        # the results: {asset_ticker: log_simulated_prices} and {T: (dt, sqrt_dt)}.
+        self._log_simulated_prices: dict[str, np.ndarray] = dict()
+        self._times_to_expiry: dict[float, tuple[np.ndarray, np.ndarray]] = dict()
+        self._elapsed_times: np.ndarray = None
+
+    @property
+    def paths(self) -> int:
+        return self.results.shape[-1]
 
     def get_simulated_prices(self, asset_ticker: str) -> np.ndarray:
         """ @returns simulated_prices (np.ndarray): the prices (time_steps x paths) in the results
@@ -21,6 +49,124 @@ class PriceSimulationResults:
 
         return self.results[index]
 
+    def get_log_simulated_prices(self, asset_ticker: str) -> np.ndarray:
+        # Cached log of @method get_simulated_prices.
+        if asset_ticker not in self._log_simulated_prices:
+            self._log_simulated_prices[asset_ticker] = np.log(self.get_simulated_prices(asset_ticker))
+
+        return self._log_simulated_prices[asset_ticker]
+
+    def get_elapsed_times(self) -> np.ndarray:
+        # @returns elapsed_times (np.ndarray): the elapsed time (time_steps x 1) at each step.
+        if self._elapsed_times is None:
+            self._elapsed_times = self.times[:, np.newaxis]
+
+        return self._elapsed_times
+
+    def get_times_to_expiry(self, T: (float | np.ndarray)) -> tuple[np.ndarray, np.ndarray]:
+        """ @param T (float | np.ndarray): the time(s) to expiry from the start of the results,
+                where arrays are broadcast against the (time_steps x 1) step grid.
+
+        @returns dt (np.ndarray): the time remaining to expiry at each step.
+        @returns sqrt_dt (np.ndarray): the square root of the (non-negative) time remaining.
+        """
+        if not np.isscalar(T):
+            dt = T - self.get_elapsed_times()
+            return dt, np.sqrt(np.maximum(dt, 0))
+
+        if T not in self._times_to_expiry:
+            dt = T - self.get_elapsed_times()
+            self._times_to_expiry[T] = (dt, np.sqrt(np.maximum(dt, 0)))
+
+        return self._times_to_expiry[T]
+
+    def clear_cache(self) -> None:
+        # Invalidates the cached intermediates (where the results are modified in place).
+        self._log_simulated_prices.clear()
+
+class MemmapPriceSimulationResults (PriceSimulationResults):
+    # File layout: header size (8 bytes, little-endian) | JSON metadata header (padded to
+    # HEADER_ALIGNMENT) | results (little-endian float64, C-order).
+    HEADER_ALIGNMENT = 64
+
+    def __init__(self, file_path: str, mode: str = "r") -> None:
+        """ Disk-backed PriceSimulationResults, where the results are memory-mapped such that
+        processes opening the same file share the results without copying.
+
+        @param file_path (str): the path of the results file.
+        @param mode (str, opt): the np.memmap mode ("r": read-only, "r+": read-write, "c": copy-on-write).
+        """
+        with open(file_path, "rb") as results_file:
+            header_size = int.from_bytes(results_file.read(8), "little")
+            self.metadata: dict = json.loads(results_file.read(header_size))
+
+        results = np.memmap(file_path, dtype="<f8", mode=mode, offset=8 + header_size,
+                shape=tuple(self.metadata.get("shape")))
+
+        PriceSimulationResults.__init__(self, self.metadata.get("asset_tickers"), results,
+                self.metadata.get("t"), self.metadata.get("sampling"), self.metadata.get("times"))
+
+        self.file_path = file_path
+
+    @property
+    def seed(self) -> (int | None):
+        return self.metadata.get("seed")
+
+    @property
+    def model_params(self) -> (dict | None):
+        return self.metadata.get("model_params")
+
+    @staticmethod
+    def create(file_path: str, tickers_to_index: dict[str, int], time_steps: int, paths: int, t: float,
+        sampling: str = "pseudo", seed: int = None, model_params: dict = None, times: Iterable[float] = None) \
+        -> "MemmapPriceSimulationResults":
+        """ Creates a results file of (m_assets x time_steps + 1 x paths) zeros, opened for writing.
+
+        @param seed (int, opt): the seed used to generate the results.
+        @param model_params (dict, opt): the (JSON serializable) parameters of the price model.
+        @param times (Iterable[float], opt): the observation times (time_steps + 1) of non-uniform steps.
+        """
+        metadata = {
+            "asset_tickers": tickers_to_index,
+            "shape": [len(tickers_to_index), time_steps + 1, paths],
+            "t": t,
+            "sampling": sampling,
+            "seed": seed,
+            "model_params": model_params,
+            "times": None if times is None else [float(time) for time in times]
+        }
+
+        header = json.dumps(metadata).encode("utf-8")
+        header += b" " * (-(8 + len(header)) % MemmapPriceSimulationResults.HEADER_ALIGNMENT)
+
+        with open(file_path, "wb") as results_file:
+            results_file.write(len(header).to_bytes(8, "little"))
+            results_file.write(header)
+            results_file.truncate(8 + len(header) + int(np.prod(metadata.get("shape"))) * 8)
+
+        return MemmapPriceSimulationResults(file_path, "r+")
+
+    @staticmethod
+    def save(results: PriceSimulationResults, file_path: str, seed: int = None, model_params: dict = None) \
+        -> "MemmapPriceSimulationResults":
+        # Writes in-memory @param results to @param file_path.
+        memmap_results = MemmapPriceSimulationResults.create(file_path, results.asset_tickers,
+                results.results.shape[1] - 1, results.paths, results.t, results.sampling, seed,
+                model_params, None if results.t is not None else results.times)
+
+        memmap_results.results[:] = results.results
+        memmap_results.flush()
+
+        return memmap_results
+
+    def write_block(self, block_results: PriceSimulationResults, block_start: int) -> None:
+        # Writes the paths of @param block_results starting from path @param block_start.
+        self.results[:, :, block_start:block_start + block_results.paths] = block_results.results
+        self.clear_cache()
+
+    def flush(self) -> None:
+        self.results.flush()
+
 class PriceModelInterface:
     # Getters    
     def get_risk_free_rate(self) -> float:
@@ -29,16 +175,62 @@ class PriceModelInterface:
     def get_spot_price(self, asset_ticker: str) -> float:
         raise NotImplementedError()
 
+    def get_asset_density(self, asset_ticker: str, st: (float | np.ndarray), t: float = 1) -> (float | np.ndarray):
+        raise NotImplementedError()
+
+    def get_joint_density(self, asset_tickers: Iterable[str], st: np.ndarray, t: float = 1) -> (float | np.ndarray):
+        raise NotImplementedError()
+
     def get_asset_density_fn(self, asset_ticker: str, t: float = 1) -> Function:
         raise NotImplementedError()
 
     def get_joint_density_fn(self, asset_tickers: set[str], t: float = 1) -> Function:
         raise NotImplementedError()
 
+    def get_covariance(self, price_dist_a, price_dist_b, t: float = 1) -> float:
+        raise NotImplementedError()
+
+    def get_covar_mat(self, price_dists: list, t: float = 1) -> np.ndarray:
+        raise NotImplementedError()
+
+    def get_elapsed_time(self, time_stamp: float) -> float:
+        raise NotImplementedError()
+
+    def get_time_version(self) -> int:
+        raise NotImplementedError()
+
+    def get_spot_version(self, asset_ticker: str) -> int:
+        raise NotImplementedError()
+
+    def get_greeks(self, price_dists: list, t: float = 0):
+        raise NotImplementedError()
+
+    # Mutators
+    def update_spots(self, ticker_to_prices: dict[str, float]) -> None:
+        raise NotImplementedError()
+
+    def update_time(self, time_stamp: float = None) -> None:
+        raise NotImplementedError()
+
     # Simulation methods
-    def simulate_prices(self, paths: int, time_steps: int, t: float = 1) \
+    def simulate_prices(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1, sampling: str = "pseudo",
+        seed: (int | np.random.SeedSequence) = None) -> PriceSimulationResults:
+        raise NotImplementedError()
+
+    def simulate_price_blocks(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1, block_paths: int = 10000,
+        sampling: str = "pseudo", seed: (int | np.random.SeedSequence) = None) \
+        -> Iterator[PriceSimulationResults]:
+        raise NotImplementedError()
+
+    def simulate_prices_parallel(self, paths: int, time_steps: (int | Iterable[float]), t: float = 1, block_paths: int = 10000,
+        sampling: str = "pseudo", seed: (int | np.random.SeedSequence) = None, workers: int = None) \
         -> PriceSimulationResults:
         raise NotImplementedError()
 
+    def simulate_prices_to_file(self, file_path: str, paths: int, time_steps: (int | Iterable[float]), t: float = 1,
+        block_paths: int = 10000, sampling: str = "pseudo", seed: int = None) \
+        -> MemmapPriceSimulationResults:
+        raise NotImplementedError()
+
 if __name__ == "__main__":
     pass
\ No newline at end of file
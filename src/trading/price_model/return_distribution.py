@@ -27,6 +27,12 @@ class AssetReturnDistribution (AssetTemporalDistributionBase, ReturnDistribution
     def get_density_fn(self, t: float = 1) -> Function:
         return self.price_dist.get_density_fn(t)
 
+    def get_density(self, st: (float | np.ndarray), t: float = 1) -> (float | np.ndarray):
+        return self.price_dist.get_density(st, t)
+
+    def get_fn_values(self, st: (float | np.ndarray), t: (float | np.ndarray) = 1) -> np.ndarray:
+        return self.price_dist.get_fn_values(st, t) / self.entry_price - 1
+
     def get_expectation(self, t: float = 1) -> float:
         return self.price_dist.get_expectation(t) / self.entry_price - 1
     
@@ -72,11 +78,35 @@ class PortfolioReturnDistribution (PortfolioTemporalDistributionBase, ReturnDist
         return self.ticker_to_sizes[ticker] * self.ticker_to_dists[ticker].entry_price \
                 / self.entry_price
 
+    @property
+    def asset_tickers(self) -> list[str]:
+        # The (unique) underlying asset tickers, ordered by insertion.
+        return list(dict.fromkeys(dist.asset_ticker for dist in self.ticker_to_dists.values()))
+
     def get_density_fn(self, t: float = 1) -> Function:
         return self.price_model.get_joint_density_fn({
             dist.asset_ticker for dist in self.ticker_to_dists.values()
         })
 
+    def get_density(self, st: np.ndarray, t: float = 1) -> (float | np.ndarray):
+        # @param st (np.ndarray): the prices (... x m_assets) ordered as the asset_tickers.
+        return self.price_model.get_joint_density(self.asset_tickers, st, t)
+
+    def get_dist_covariance(self, dist_a: AssetReturnDistribution, dist_b: TemporalDistributionBase,
+        t: float = 1) -> float:
+        if isinstance(dist_b, AssetReturnDistribution) and dist_b.price_model is self.price_model:
+            return self.price_model.get_covariance(dist_a.price_dist, dist_b.price_dist, t) \
+                    / (dist_a.entry_price * dist_b.entry_price)
+
+        return dist_a.get_covariance(dist_b, t)
+
+    def get_covar_mat(self, t: float = 1) -> np.ndarray:
+        dists = list(self.ticker_to_dists.values())
+        entry_price_vect = np.array([dist.entry_price for dist in dists], dtype=float)
+
+        return self.price_model.get_covar_mat([dist.price_dist for dist in dists], t) \
+                / np.outer(entry_price_vect, entry_price_vect)
+
     def get_plot_fn_label(self) -> str:
         return "portfolio_return"
 
@@ -0,0 +1,210 @@
+import numpy as np
+
+from collections.abc import Iterable
+
+class QuantileSketch:
+    def __init__(self, compression: float = 1000) -> None:
+        """ Merging t-digest: a bounded-memory summary of a stream of values as weighted centroids,
+        with centroids narrowing towards the tails (k1 scale function) where the quantiles are
+        estimated most accurately. Holds at most compression / 2 + 1 centroids.
+
+        @param compression (float, opt): the compression parameter (delta), trading memory for accuracy.
+        """
+        self.compression = compression
+        self.means = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    # Getters
+    def get_scale(self, q: np.ndarray) -> np.ndarray:
+        # k1 scale function: centroids span at most a unit interval of k.
+        return self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+    def get_knots(self) -> tuple[np.ndarray, np.ndarray]:
+        """ @returns ranks (np.ndarray): the (cumulative) ranks of the centroid centers, bounded by
+                zero and the count.
+        @returns values (np.ndarray): the centroid means, bounded by the minimum and maximum.
+        """
+        ranks = np.concatenate([[0], np.cumsum(self.weights) - self.weights / 2, [self.count]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+
+        return ranks, values
+
+    def get_quantile(self, q: (float | np.ndarray)) -> (float | np.ndarray):
+        # Quantile(s) interpolated linearly between the centroid centers.
+        assert self.count > 0, "No values have been pushed."
+        return np.interp(np.asarray(q, dtype=float) * self.count, *self.get_knots())
+
+    def get_tail_moments(self, q: float) -> tuple[float, float]:
+        """ @returns tail_mean (float): the mean of the values below the @param q quantile.
+        @returns tail_sq_mean (float): the mean of the squared values below the @param q quantile.
+        """
+        ranks, values = self.get_knots()
+        rank = q * self.count
+        inner = ranks < rank
+
+        tail_ranks = np.append(ranks[inner], rank)
+        tail_values = np.append(values[inner], np.interp(rank, ranks, values))
+        step, lo, hi = np.diff(tail_ranks), tail_values[:-1], tail_values[1:]
+
+        # Exact integrals of the (piecewise linear) quantile function.
+        return (np.sum(step * (lo + hi) / 2) / rank,
+                np.sum(step * (lo ** 2 + lo * hi + hi ** 2) / 3) / rank)
+
+    def get_sketch_error(self, q: float) -> float:
+        # @returns sketch_error (float): half the spread of the centroids bracketing the @param q quantile.
+        ranks, values = self.get_knots()
+        index = np.clip(np.searchsorted(ranks, q * self.count), 1, ranks.size - 1)
+
+        return (values[index] - values[index - 1]) / 2
+
+    # Mutators
+    def push(self, values: np.ndarray) -> None:
+        # Merges the @param values into the centroids in O((n + compression) * log(n + compression)).
+        values = np.ravel(np.asarray(values, dtype=float))
+
+        if not values.size:
+            return
+
+        self.count += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        means = np.concatenate([self.means, values])
+        weights = np.concatenate([self.weights, np.ones(values.size, dtype=float)])
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        # Merges the centroids centered within the same unit interval of the scale function.
+        q_centers = (np.cumsum(weights) - weights / 2) / self.count
+        _, clusters = np.unique(np.floor(self.get_scale(q_centers)), return_inverse=True)
+
+        self.weights = np.bincount(clusters, weights)
+        self.means = np.bincount(clusters, weights * means) / self.weights
+
+class RiskEstimateResults:
+    def __init__(self, confidence_levels: np.ndarray, horizons: np.ndarray, value_at_risk: np.ndarray,
+        conditional_value_at_risk: np.ndarray, value_at_risk_error: np.ndarray,
+        conditional_value_at_risk_error: np.ndarray, sketch_error: np.ndarray, paths: int) -> None:
+        """ Container for the risk estimates generated from @method StreamingRiskEngine.get_results,
+        where the estimates are arrays (horizons x confidence_levels) of losses (positive values).
+
+        @param confidence_levels (np.ndarray): the confidence levels, e.g. 0.99.
+        @param horizons (np.ndarray): the horizons, denominated in base_unit_of_time.
+        @param value_at_risk (np.ndarray): the VaR, the loss exceeded with 1 - confidence_level.
+        @param conditional_value_at_risk (np.ndarray): the CVaR (expected shortfall), the mean
+                loss beyond the VaR.
+        @param value_at_risk_error (np.ndarray): the (asymptotic) standard error of the VaR.
+        @param conditional_value_at_risk_error (np.ndarray): the (asymptotic) standard error of the CVaR.
+        @param sketch_error (np.ndarray): the estimated error of the VaR from the quantile sketch.
+        @param paths (int): the number of simulated paths.
+        """
+        self.confidence_levels = confidence_levels
+        self.horizons = horizons
+        self.value_at_risk = value_at_risk
+        self.conditional_value_at_risk = conditional_value_at_risk
+        self.value_at_risk_error = value_at_risk_error
+        self.conditional_value_at_risk_error = conditional_value_at_risk_error
+        self.sketch_error = sketch_error
+        self.paths = paths
+
+class StreamingRiskEngine:
+    def __init__(self, confidence_levels: Iterable[float] = (.95, .99), horizons: Iterable[float] = None,
+        compression: float = 1000) -> None:
+        """ Estimates the VaR and CVaR of simulated P&L consumed in blocks, holding a QuantileSketch
+        for each horizon such that the memory is constant in the number of paths.
+
+        @param confidence_levels (Iterable[float], opt): the confidence levels (0, 1).
+        @param horizons (Iterable[float], opt): the horizons of the P&L rows, denominated in
+                base_unit_of_time, defaults to the row indexes.
+        @param compression (float, opt): the compression parameter of the quantile sketches.
+        """
+        self.confidence_levels = np.array(confidence_levels, dtype=float, ndmin=1)
+        self.horizons = None if horizons is None else np.array(horizons, dtype=float, ndmin=1)
+        self.compression = compression
+        self.sketches: list[QuantileSketch] = None
+
+        assert np.all((self.confidence_levels > 0) & (self.confidence_levels < 1))
+
+    # Getters
+    @property
+    def paths(self) -> int:
+        return self.sketches[0].count if self.sketches else 0
+
+    def get_results(self) -> RiskEstimateResults:
+        """ @returns risk_estimate (RiskEstimateResults): the VaR and CVaR at each horizon and
+                confidence level, with standard errors.
+
+        Notes:
+            1. The VaR standard error is sqrt(p * (1 - p) / n) / f(VaR), with the density f
+                estimated from the sketch quantiles around p = 1 - confidence_level.
+            2. The CVaR standard error is sqrt((Var[L | L >= VaR] + (1 - p) * (CVaR - VaR) ^ 2)
+                / (n * p)).
+            3. Antithetic (or quasi-random) paths are treated as independent samples, such that
+                the standard errors are approximate.
+        """
+        assert self.paths > 0, "No P&L has been pushed."
+
+        n = self.paths
+        p_tail = 1 - self.confidence_levels
+        shape = (len(self.sketches), self.confidence_levels.size)
+        value_at_risk, conditional_value_at_risk = np.empty(shape), np.empty(shape)
+        value_at_risk_error, conditional_value_at_risk_error = np.empty(shape), np.empty(shape)
+        sketch_error = np.empty(shape)
+
+        for i, sketch in enumerate(self.sketches):
+            for j, p in enumerate(p_tail):
+                tail_mean, tail_sq_mean = sketch.get_tail_moments(p)
+                quantile_lo, quantile, quantile_hi = sketch.get_quantile([p * 3 / 4, p, p * 5 / 4])
+
+                value_at_risk[i, j] = -quantile
+                conditional_value_at_risk[i, j] = -tail_mean
+                value_at_risk_error[i, j] = np.sqrt(p * (1 - p) / n) * (quantile_hi - quantile_lo) / (p / 2)
+                conditional_value_at_risk_error[i, j] = np.sqrt((max(tail_sq_mean - tail_mean ** 2, 0)
+                        + (1 - p) * (tail_mean - quantile) ** 2) / (n * p))
+                sketch_error[i, j] = sketch.get_sketch_error(p)
+
+        horizons = self.horizons if self.horizons is not None else np.arange(len(self.sketches), dtype=float)
+
+        return RiskEstimateResults(self.confidence_levels, horizons, value_at_risk, conditional_value_at_risk,
+                value_at_risk_error, conditional_value_at_risk_error, sketch_error, n)
+
+    # Mutators
+    def push(self, pnl: np.ndarray) -> None:
+        # @param pnl (np.ndarray): a block of the simulated P&L (horizons x paths).
+        pnl = np.array(pnl, dtype=float, ndmin=2)
+
+        if self.sketches is None:
+            self.sketches = [QuantileSketch(self.compression) for _ in range(pnl.shape[0])]
+
+        assert pnl.shape[0] == len(self.sketches)
+
+        for sketch, horizon_pnl in zip(self.sketches, pnl):
+            sketch.push(horizon_pnl)
+
+    def reset(self) -> None:
+        self.sketches = None
+
+if __name__ == "__main__":
+    # Accuracy and memory of the streamed estimates against sorting every path.
+    blocks, block_paths = 100, 10000
+    rng = np.random.default_rng(0)
+    risk_engine = StreamingRiskEngine((.95, .99, .999))
+    pnl = list[np.ndarray]()
+
+    for _ in range(blocks):
+        pnl.append(rng.standard_normal((1, block_paths)))
+        risk_engine.push(pnl[-1])
+
+    risk_estimate = risk_engine.get_results()
+    pnl = np.concatenate(pnl, axis=1)[0]
+    value_at_risk = -np.quantile(pnl, 1 - risk_estimate.confidence_levels)
+    conditional_value_at_risk = np.array([-pnl[pnl <= -var].mean() for var in value_at_risk])
+
+    assert risk_estimate.paths == blocks * block_paths
+    assert risk_engine.sketches[0].means.size <= risk_engine.sketches[0].compression / 2 + 1
+    assert (np.abs(risk_estimate.value_at_risk[0] - value_at_risk) <= risk_estimate.sketch_error[0]).all()
+    assert (np.abs(risk_estimate.conditional_value_at_risk[0] - conditional_value_at_risk)
+            <= risk_estimate.conditional_value_at_risk_error[0]).all()
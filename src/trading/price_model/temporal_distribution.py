@@ -5,9 +5,10 @@ from collections import defaultdict
 from collections.abc import Iterable
 from scipy.stats import norm
 from sympy import Function, Symbol
-from sympy import plot, plot_parametric
+from sympy import lambdify, plot, plot_parametric
 from uuid import uuid4
 from .price_model_interface import PriceSimulationResults
+from .risk import RiskEstimateResults, StreamingRiskEngine
 
 class DistributionPlotResults:
     # Container for distribution plots
@@ -25,6 +26,43 @@ class DistributionPlotResults:
     def show(self) -> None:
         self._dist_plot.show()
 
+class NumericDistributionPlotResults (DistributionPlotResults):
+    def __init__(self, x: np.ndarray) -> None:
+        """ Container for distribution plots evaluated on a fixed grid (numpy backend)
+        @param x (np.ndarray): the grid of values on the horizontal axis.
+        """
+        self.x = x
+        self._dist_plot: dict[str, np.ndarray] = dict()
+
+    def get(self) -> dict[str, np.ndarray]:
+        # @returns dist_plot (dict[str, np.ndarray]): the {label: values} of the plotted functions.
+        return self._dist_plot
+
+    def extend(self, fn_plot: dict[str, np.ndarray]) -> None:
+        self._dist_plot.update(fn_plot)
+
+    def show(self) -> None:
+        import matplotlib.pyplot as plt
+
+        _, ax = plt.subplots()
+
+        for label, values in self._dist_plot.items():
+            ax.plot(self.x, values, label=label)
+
+        ax.legend()
+        plt.show()
+
+class SimulationEstimateResults:
+    def __init__(self, expectation: np.ndarray, standard_error: np.ndarray, paths: int) -> None:
+        """ Container for estimates generated from @method TemporalDistributionBase.get_simulated_estimate
+        @param expectation (np.ndarray): the estimated expectation at each time step.
+        @param standard_error (np.ndarray): the standard error of the estimate at each time step.
+        @param paths (int): the number of simulated paths.
+        """
+        self.expectation = expectation
+        self.standard_error = standard_error
+        self.paths = paths
+
 class TemporalDistributionBase:
     # Characteristic functions
     def get_fn(self, t: float = 1) -> Function:
@@ -33,6 +71,28 @@ class TemporalDistributionBase:
     def get_density_fn(self, t: float = 1) -> Function:
         raise NotImplementedError()
 
+    def get_density(self, st: (float | np.ndarray), t: float = 1) -> (float | np.ndarray):
+        # Numeric counterpart of @method get_density_fn evaluated at the (underlying) prices @param st.
+        raise NotImplementedError()
+
+    def get_fn_values(self, st: (float | np.ndarray), t: (float | np.ndarray) = 1) -> np.ndarray:
+        """ Numeric counterpart of @method get_fn evaluated at the (underlying) prices @param st,
+        where @param t is broadcast against @param st. Defaults to lambdifying @method get_fn
+        once for each unique t.
+        """
+        if np.ndim(t) == 0:
+            fn_values = lambdify(self.get_plot_xvar(), self.get_fn(float(t)), modules=["scipy", "numpy"])(st)
+            return np.broadcast_to(fn_values, np.shape(st)).astype(float)
+
+        st, t = np.broadcast_arrays(np.asarray(st, dtype=float), t)
+        fn_values = np.empty(st.shape, dtype=float)
+
+        for t_unique in np.unique(t):
+            mask = t == t_unique
+            fn_values[mask] = self.get_fn_values(st[mask], t_unique)
+
+        return fn_values
+
     # Distribution parameters
     def get_expectation(self, t: float = 1) -> float:
         raise NotImplementedError()
@@ -47,6 +107,127 @@ class TemporalDistributionBase:
     def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
         raise NotImplementedError()
 
+    def get_simulated_moments(self, results_blocks: Iterable[PriceSimulationResults]) \
+        -> tuple[np.ndarray, np.ndarray]:
+        """ Reduces the simulated values over blocks of results (see @method
+        PriceModelInterface.simulate_price_blocks) without holding all paths in memory.
+
+        @returns simulated_moments (tuple[np.ndarray, np.ndarray]): the mean and variance of
+                the simulated values at each time step.
+        """
+        paths, mean, sum_sq_dev = 0, 0., 0.
+
+        for results in results_blocks:
+            values = self.get_simulated_values(results)
+            block_paths = values.shape[-1]
+            block_mean = values.mean(axis=-1)
+            block_sum_sq_dev = np.square(values - block_mean[..., None]).sum(axis=-1)
+
+            # Pairwise combination of the running and block moments.
+            delta = block_mean - mean
+            mean = mean + delta * block_paths / (paths + block_paths)
+            sum_sq_dev = sum_sq_dev + block_sum_sq_dev + delta ** 2 * paths * block_paths \
+                    / (paths + block_paths)
+
+            paths += block_paths
+
+        return mean, sum_sq_dev / (paths - 1)
+
+    def get_simulated_risk(self, results_blocks: Iterable[PriceSimulationResults],
+        confidence_levels: Iterable[float] = (.95, .99), compression: float = 1000) -> RiskEstimateResults:
+        """ Estimates the VaR and CVaR of the P&L (the simulated values less the initial value) at each
+        time step over blocks of results, in memory constant in the number of paths.
+
+        @param results_blocks (Iterable[PriceSimulationResults]): the blocks of simulated results.
+        @param confidence_levels (Iterable[float], opt): the confidence levels (0, 1).
+        @param compression (float, opt): the compression parameter of the quantile sketches.
+
+        @returns risk_estimate (RiskEstimateResults): the VaR and CVaR at each time step (horizon).
+        """
+        risk_engine = None
+
+        for results in results_blocks:
+            values = self.get_simulated_values(results)
+
+            if risk_engine is None:
+                risk_engine = StreamingRiskEngine(confidence_levels, results.times[1:], compression)
+
+            risk_engine.push(values[1:] - values[:1])
+
+        assert risk_engine is not None, "get_simulated_risk requires at least one block of results."
+        return risk_engine.get_results()
+
+    def get_simulated_estimate(self, results_blocks: Iterable[PriceSimulationResults],
+        control_dist: "TemporalDistributionBase" = None) -> SimulationEstimateResults:
+        """ Estimates the expectation at each time step from the simulated values, reporting the
+        achieved standard error.
+
+        @param results_blocks (Iterable[PriceSimulationResults]): the blocks of simulated results.
+        @param control_dist (TemporalDistributionBase, opt): the control variate, whose closed-form
+                @method get_expectation is known, e.g. the underlying asset price distribution.
+
+        @returns estimate (SimulationEstimateResults): the estimates and standard errors.
+
+        Notes:
+            1. Antithetic pairs are averaged before estimating the variance.
+            2. The standard errors of quasi-Monte Carlo results are estimated from the spread
+                between the (independently scrambled) blocks, requiring at least two blocks.
+        """
+        paths, quasi_random = 0, False
+        block_sums = list[tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]()
+        control_expectation = 0.
+
+        for results in results_blocks:
+            values = self.get_simulated_values(results)
+            control_values = control_dist.get_simulated_values(results) if control_dist else \
+                    np.zeros(values.shape, dtype=float)
+
+            if control_dist is not None:
+                control_expectation = np.array([control_dist.get_expectation(time)
+                        for time in results.times], dtype=float)
+
+            paths += results.paths
+            quasi_random = results.sampling in ("sobol", "halton")
+
+            if results.sampling == "antithetic":
+                # Average each path with its antithetic pair.
+                half_paths = results.paths - results.paths // 2
+                pairs = results.paths // 2
+
+                values = np.concatenate([(values[:, :pairs] + values[:, half_paths:]) / 2,
+                        values[:, pairs:half_paths]], axis=1)
+                control_values = np.concatenate([(control_values[:, :pairs] + control_values[:,
+                        half_paths:]) / 2, control_values[:, pairs:half_paths]], axis=1)
+
+            block_sums.append((values.shape[1], values.sum(axis=1), control_values.sum(axis=1),
+                    np.square(values).sum(axis=1), np.square(control_values).sum(axis=1),
+                    (values * control_values).sum(axis=1)))
+
+        samples, sum_y, sum_x, sum_yy, sum_xx, sum_xy = (sum(block_sum) for block_sum in zip(*block_sums))
+        mean_y, mean_x = sum_y / samples, sum_x / samples
+        var_y = (sum_yy - samples * mean_y ** 2) / (samples - 1)
+        var_x = (sum_xx - samples * mean_x ** 2) / (samples - 1)
+        covar_xy = (sum_xy - samples * mean_x * mean_y) / (samples - 1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Optimal control variate coefficient (zero where the control is degenerate).
+            beta = np.where(var_x > 0, covar_xy / var_x, 0)
+
+        expectation = mean_y - beta * (mean_x - control_expectation)
+
+        assert not quasi_random or len(block_sums) > 1, \
+                "quasi-Monte Carlo standard errors require at least two (independently scrambled) blocks."
+
+        if quasi_random:
+            block_estimates = np.stack([(block_sum_y - beta * block_sum_x) / block_samples
+                    for block_samples, block_sum_y, block_sum_x, *_ in block_sums], axis=0)
+            standard_error = np.std(block_estimates, axis=0, ddof=1) / np.sqrt(len(block_sums))
+        else:
+            standard_error = np.sqrt(np.maximum(var_y - 2 * beta * covar_xy + beta ** 2 * var_x, 0)
+                    / samples)
+
+        return SimulationEstimateResults(expectation, standard_error, paths)
+
     # Plotting methods
     def get_plot_xvar(self) -> Symbol:
         raise NotImplementedError()
@@ -60,10 +241,15 @@ class TemporalDistributionBase:
         """
         return (self.get_expectation(t), np.sqrt(self.get_variance(t)))
 
+    def get_plot_density(self, x: np.ndarray, t: (float | np.ndarray) = 1) -> np.ndarray:
+        # Numeric density evaluated on the plotting grid @param x.
+        return self.get_density(x, t)
+
     def plot(self, t: (float | Iterable[float]) = 1, plot_range: tuple[float, float] = None,
         tail_percentile: float = .025, plot_fn: bool = True, plot_expectation: bool = False,
         plot_density_fn: bool = False, plot_density_weighted: bool = False,
-        constant_offset: float = 0., show: bool = True) -> DistributionPlotResults:
+        constant_offset: float = 0., show: bool = True, backend: str = "sympy",
+        plot_points: int = 1000) -> DistributionPlotResults:
         """
         @param t (float | Iterable[float], opt): the timestep sizes(s) to plot.
         @param plot_range (tuple[float, float], opt): the range of values to plot.
@@ -76,15 +262,22 @@ class TemporalDistributionBase:
         @param constant_offset (bool, opt): adds a constant vertical offset to the
                 distribution and expectation functions.
         @param show (bool, opt): shows the plot.
+        @param backend (str, opt): the plotting backend.
+                sympy:  plots the symbolic functions with sympy.plot.
+                numpy:  evaluates the functions numerically on a grid of @param plot_points,
+                        with every t evaluated in a single array evaluation.
+        @param plot_points (int, opt): the number of grid points (numpy backend).
 
         @returns dist_plot (DistributionPlotResults): container for the plot.
 
         Notes:
             1. Only supports univariate distributions.
         """
+        assert backend in ("sympy", "numpy")
+
         xvar = self.get_plot_xvar()
         dist_plot = DistributionPlotResults()
-        ts: list[float] = [t] if isinstance(t, float) else t
+        ts: list[float] = [t] if np.isscalar(t) else list(t)
 
         if not plot_range:
             for t in ts:
@@ -98,6 +291,38 @@ class TemporalDistributionBase:
                     plot_range[0] = min(plot_range[0], min_range)
                     plot_range[1] = max(plot_range[1], max_range)
 
+        if backend == "numpy":
+            dist_plot = NumericDistributionPlotResults(np.linspace(max(0.01, plot_range[0]), plot_range[1],
+                    plot_points))
+
+            t_vect = np.array(ts, dtype=float)[:, np.newaxis]
+            plot_shape = (len(ts), plot_points)
+            fn_values, density_values = None, None
+
+            if plot_fn or plot_density_weighted:
+                fn_values = np.broadcast_to(self.get_fn_values(dist_plot.x, t_vect), plot_shape) \
+                        + constant_offset
+
+            if plot_density_fn or plot_density_weighted:
+                density_values = np.broadcast_to(self.get_plot_density(dist_plot.x, t_vect), plot_shape)
+
+            for i, t in enumerate(ts):
+                if plot_fn:
+                    dist_plot.extend({ self.get_plot_fn_label() + f" ({t})": fn_values[i] })
+
+                if plot_expectation:
+                    dist_plot.extend({ f"mean ({t})": np.full(plot_points, self.get_expectation(t)
+                            + constant_offset) })
+
+                if plot_density_fn:
+                    dist_plot.extend({ f"price_density_fn ({t})": density_values[i] })
+
+                if plot_density_weighted:
+                    dist_plot.extend({ f"density_weighted ({t})": density_values[i] * fn_values[i] })
+
+            if show: dist_plot.show()
+            return dist_plot
+
         plot_range = (xvar, max(0.01, plot_range[0]), plot_range[1])
 
         for t in ts:
@@ -162,42 +387,26 @@ class PortfolioTemporalDistributionBase (TemporalDistributionBase):
                 in self.ticker_to_dists.items())
 
     def get_variance(self, t: float = 1) -> float:
-        tickers = list(self.ticker_to_dists.keys())
-        m = len(tickers)
-        portfolio_var = 0
-
-        for i in range(m):
-            dist_a = self.ticker_to_dists.get(tickers[i])
-            weight_a = self.get_dist_weight(tickers[i])
-            portfolio_var += weight_a ** 2 * dist_a.get_variance(t)
-
-            for j in range(i + 1, m):
-                dist_b = self.ticker_to_dists.get(tickers[j])
-                weight_b = self.get_dist_weight(tickers[j])
-                portfolio_var += 2 * weight_a * weight_b * dist_a.get_covariance(dist_b, t)
-
-        return portfolio_var
+        weight_vect = self.get_weight_vect()
+        return weight_vect @ self.get_covar_mat(t) @ weight_vect
 
     def get_covariance(self, other: TemporalDistributionBase, t: float = 1) -> float:
         if isinstance(other, PortfolioTemporalDistributionBase):
-            cached_values = dict[tuple[str, str], float]()
-            portfolio_covar = 0
-
-            for ticker_a, dist_a in self.ticker_to_dists.items():
-                weight_a = self.get_dist_weight(ticker_a)
+            return sum(self.get_dist_weight(ticker_a) * other.get_dist_weight(ticker_b)
+                    * self.get_dist_covariance(dist_a, dist_b, t)
+                    for ticker_a, dist_a in self.ticker_to_dists.items()
+                    for ticker_b, dist_b in other.ticker_to_dists.items())
 
-                for ticker_b, dist_b in other.ticker_to_dists.items():
-                    weight_b = other.get_dist_weight(ticker_b)
-
-                    if (weight_a, weight_b) not in cached_values:
-                        cached_values[(weight_a, weight_b)] = dist_a.get_covariance(dist_b, t)
-                        cached_values[(weight_b, weight_a)] = cached_values[(weight_a, weight_b)]
+        return sum(self.get_dist_weight(ticker) * self.get_dist_covariance(dist, other, t)
+                for ticker, dist in self.ticker_to_dists.items())
 
-                    portfolio_covar += weight_a * weight_b * cached_values.get((weight_a, weight_b))
-                    
-            return portfolio_covar
+    def get_dist_covariance(self, dist_a: AssetTemporalDistributionBase, dist_b: TemporalDistributionBase,
+        t: float = 1) -> float:
+        # Covariance of a component distribution, overridden to share the covariances cached by the price model.
+        return dist_a.get_covariance(dist_b, t)
 
-        return sum(self.get_dist_weight(ticker) * dist.get_covariance(other, t)
+    def get_fn_values(self, st: (float | np.ndarray), t: (float | np.ndarray) = 1) -> np.ndarray:
+        return sum(self.get_dist_weight(ticker) * dist.get_fn_values(st, t)
                 for ticker, dist in self.ticker_to_dists.items())
 
     def get_simulated_values(self, results: PriceSimulationResults) -> np.ndarray:
@@ -241,5 +450,9 @@ class PortfolioTemporalDistributionBase (TemporalDistributionBase):
         """
         return list(self.ticker_to_dists.values())[0].get_plot_range_dist_params(t)
 
+    def get_plot_density(self, x: np.ndarray, t: (float | np.ndarray) = 1) -> np.ndarray:
+        # Joint density of the (single) underlying asset.
+        return self.get_density(np.expand_dims(x, axis=-1), t)
+
 if __name__ == "__main__":
     pass
\ No newline at end of file